@@ -0,0 +1,52 @@
+"""
+Measure per-ID cost of the str codecs against the bytes codecs with a decode/encode round trip.
+
+Run with: python -m benchmarks.codecs
+"""
+
+import sys
+import timeit
+
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID, TwitterSnowflakeIDGenerator
+
+NUMBER = 200_000
+
+
+def per_call_ns(statement: str, namespace: dict[str, object]) -> float:
+    """
+    Best time in nanoseconds per call of running the statement NUMBER times.
+    """
+
+    best = min(timeit.repeat(statement, globals=namespace, number=NUMBER, repeat=5))
+    return best / NUMBER * 1e9
+
+
+def main() -> None:
+    id_ = TwitterSnowflakeIDGenerator(node_id=0).generate_next_id()
+    namespace = {
+        "id_": id_,
+        "cls": TwitterSnowflakeID,
+        "base16": id_.as_base16_str(),
+        "base32": id_.as_base32_str(),
+        "base64": id_.as_base64_urlsafe_str(),
+        "base62": id_.as_base62_str(),
+    }
+
+    cases = {
+        "base16, bytes": ("id_.as_base16().decode()", "cls.parse_base16(base16.encode())"),
+        "base16, str": ("id_.as_base16_str()", "cls.parse_base16_str(base16)"),
+        "base32, bytes": ("id_.as_base32().decode()", "cls.parse_base32(base32.encode())"),
+        "base32, str": ("id_.as_base32_str()", "cls.parse_base32_str(base32)"),
+        "base64 URL-safe, bytes": ("id_.as_base64_urlsafe().decode()", "cls.parse_base64_urlsafe(base64.encode())"),
+        "base64 URL-safe, str": ("id_.as_base64_urlsafe_str()", "cls.parse_base64_urlsafe_str(base64)"),
+        "base62, str": ("id_.as_base62_str()", "cls.parse_base62_str(base62)"),
+    }
+
+    for name, (encode, parse) in cases.items():
+        encode_ns = per_call_ns(encode, namespace)
+        parse_ns = per_call_ns(parse, namespace)
+        sys.stdout.write(f"{name:<24} encode {encode_ns:7.1f} ns, parse {parse_ns:7.1f} ns\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Measure per-ID cost of generation and decoding, compiled accelerator against pure Python.
+
+Run with: python -m benchmarks.generate
+"""
+
+import sys
+import timeit
+
+from snowflake_id_toolkit import _cli as cli
+from snowflake_id_toolkit._compiled import speedups
+from snowflake_id_toolkit.twitter import TWITTER_SNOWFLAKE_CONFIG, TwitterSnowflakeIDGenerator
+
+NUMBER = 200_000
+
+
+def per_id_ns(statement: str, namespace: dict[str, object], ids_per_run: int = 1) -> float:
+    """
+    Best time in nanoseconds per ID of running the statement NUMBER // ids_per_run times.
+    """
+
+    number = NUMBER // ids_per_run
+    best = min(timeit.repeat(statement, globals=namespace, number=number, repeat=5))
+    return best / (number * ids_per_run) * 1e9
+
+
+def main() -> None:
+    sys.stdout.write(f"compiled accelerator available: {speedups is not None}\n")
+
+    generator = TwitterSnowflakeIDGenerator(node_id=0)
+    random_generator = TwitterSnowflakeIDGenerator(node_id=0, random_sequence=True)
+    # Alternating calls to monotonic generators of different node IDs, the lower one following the higher one
+    low_generator = TwitterSnowflakeIDGenerator(node_id=1, monotonic=True)
+    high_generator = TwitterSnowflakeIDGenerator(node_id=2, monotonic=True)
+    values = [int(id_) for id_ in generator.generate_ids(1000)]
+    namespace = {
+        "generator": generator,
+        "random_generator": random_generator,
+        "low_generator": low_generator,
+        "high_generator": high_generator,
+        "cli": cli,
+        "values": values,
+        "config": TWITTER_SNOWFLAKE_CONFIG,
+    }
+
+    cases = {
+        "generate_next_id, compiled": ("generator.generate_next_id()", 1),
+        "generate_next_id, pure Python": ("generator._generate_next_id()", 1),
+        "generate_next_raw_id, compiled": ("generator.generate_next_raw_id()", 1),
+        "generate_next_raw_id, pure Python": ("generator._generate_next_raw_id()", 1),
+        "random sequence, compiled": ("random_generator.generate_next_id()", 1),
+        "random sequence, pure Python": ("random_generator._generate_next_id()", 1),
+        "monotonic, alternating node IDs": ("low_generator.generate_next_id(); high_generator.generate_next_id()", 2),
+        "generate_ids(1000)": ("generator.generate_ids(1000)", 1000),
+        "generate_raw_ids(1000)": ("generator.generate_raw_ids(1000)", 1000),
+        "generate_id_array(1000)": ("generator.generate_id_array(1000)", 1000),
+        "random sequence, generate_ids(1000)": ("random_generator.generate_ids(1000)", 1000),
+        "decode to CSV": ("cli._format_csv(values, config, 0)", 1000),
+    }
+
+    for name, (statement, ids_per_run) in cases.items():
+        sys.stdout.write(f"{name:<40} {per_id_ns(statement, namespace, ids_per_run):8.1f} ns/ID\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Measure cold import time of the package and of each layout.
+
+Run with: python -m benchmarks.import_time
+"""
+
+import subprocess
+import sys
+import time
+
+STATEMENTS = (
+    "pass",
+    "import snowflake_id_toolkit",
+    "from snowflake_id_toolkit import TwitterSnowflakeIDGenerator",
+    "from snowflake_id_toolkit import InstagramSnowflakeIDGenerator",
+    "from snowflake_id_toolkit import SonyflakeIDGenerator",
+    "from snowflake_id_toolkit import WideSnowflakeIDGenerator",
+)
+
+REPEAT = 30
+
+
+def measure(statement: str) -> float:
+    """
+    Best wall time in milliseconds of a fresh interpreter running the statement.
+    """
+
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)  # noqa: S603
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    baseline = measure(STATEMENTS[0])
+    sys.stdout.write(f"{'interpreter startup':<65} {baseline:6.1f} ms\n")
+
+    for statement in STATEMENTS[1:]:
+        sys.stdout.write(f"{statement:<65} +{measure(statement) - baseline:5.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Measure parse cost with and without the parse cache and the hit rate at which the cache pays off.
+
+Run with: python -m benchmarks.parse_cache
+"""
+
+import sys
+import timeit
+
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID, TwitterSnowflakeIDGenerator
+
+NUMBER = 100_000
+
+# IDs per run, more than the cache holds, so every parse of a cold run misses
+IDS = 4096
+MAXSIZE = 1024
+
+
+def per_parse_ns(statement: str, namespace: dict[str, object]) -> float:
+    """
+    Best time in nanoseconds per parse of running the statement over all IDs.
+    """
+
+    number = NUMBER // IDS
+    best = min(timeit.repeat(statement, globals=namespace, number=number, repeat=5))
+    return best / (number * IDS) * 1e9
+
+
+def main() -> None:
+    ids = TwitterSnowflakeIDGenerator(node_id=0).generate_ids(IDS)
+
+    for codec in ("base32", "base64_urlsafe"):
+        encoded = [getattr(id_, f"as_{codec}")() for id_ in ids]
+        hot = encoded[:1] * IDS
+        namespace = {"parse": getattr(TwitterSnowflakeID, f"parse_{codec}"), "encoded": encoded, "hot": hot}
+        statement = "for data in {}: parse(data)"
+
+        TwitterSnowflakeID.disable_parse_cache()
+        uncached = per_parse_ns(statement.format("encoded"), namespace)
+
+        TwitterSnowflakeID.enable_parse_cache(MAXSIZE)
+        miss = per_parse_ns(statement.format("encoded"), namespace)
+        hit = per_parse_ns(statement.format("hot"), namespace)
+        TwitterSnowflakeID.disable_parse_cache()
+
+        # Cost at hit rate h is h * hit + (1 - h) * miss, equal to uncached at the break-even point
+        break_even = max(0.0, (miss - uncached) / (miss - hit))
+
+        sys.stdout.write(
+            f"parse_{codec:<16} uncached {uncached:7.1f} ns, hit {hit:7.1f} ns, miss {miss:7.1f} ns, "
+            f"break-even hit rate {break_even:.0%}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
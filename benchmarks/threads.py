@@ -0,0 +1,76 @@
+"""
+Measure ID generation throughput with a growing number of threads.
+
+Run with: python -m benchmarks.threads
+On free-threaded builds, run with PYTHON_GIL=0 to measure scaling without the GIL.
+"""
+
+import sys
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+
+from snowflake_id_toolkit import SnowflakeIDGeneratorPool
+from snowflake_id_toolkit.wide import WideSnowflakeID, WideSnowflakeIDGenerator
+
+IDS_PER_THREAD = 200_000
+
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def measure(threads: int, target: Callable[[], object]) -> float:
+    """
+    Throughput in million IDs per second of threads running target concurrently.
+    """
+
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        target()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return threads * IDS_PER_THREAD / elapsed / 1_000_000
+
+
+def main() -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    sys.stdout.write(f"GIL enabled: {is_gil_enabled()}\n")
+
+    # The 128-bit layout never exhausts its sequence, so the clock does not cap throughput
+    for threads in THREAD_COUNTS:
+        generator = WideSnowflakeIDGenerator(node_id=0)
+        pool = SnowflakeIDGeneratorPool(WideSnowflakeIDGenerator, range(threads))
+
+        cases: dict[str, Callable[[], object]] = {
+            "shared generator, generate_next_id": partial(generate_one_by_one, generator),
+            "shared generator, generate_ids(1000)": partial(generate_batches, generator),
+            "pool, generate_next_id": partial(generate_one_by_one, pool),
+        }
+
+        for name, target in cases.items():
+            sys.stdout.write(f"{threads} threads, {name:<40} {measure(threads, target):6.2f} M IDs/s\n")
+
+
+def generate_one_by_one(generator: WideSnowflakeIDGenerator | SnowflakeIDGeneratorPool[WideSnowflakeID]) -> None:
+    for _ in range(IDS_PER_THREAD):
+        generator.generate_next_id()
+
+
+def generate_batches(generator: WideSnowflakeIDGenerator) -> None:
+    for _ in range(IDS_PER_THREAD // 1000):
+        generator.generate_ids(1000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Hatch build hook compiling the optional C accelerator, src/snowflake_id_toolkit/_speedups.c.
+
+Without a working C compiler, or with SNOWFLAKE_ID_TOOLKIT_PURE_PYTHON set,
+the wheel ships the pure-Python implementation only.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class SpeedupsBuildHook(BuildHookInterface):  # type: ignore[misc]
+    PLUGIN_NAME = "speedups"
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        if self.target_name != "wheel" or os.environ.get("SNOWFLAKE_ID_TOOLKIT_PURE_PYTHON"):
+            return
+
+        from setuptools import Distribution, Extension  # noqa: PLC0415
+
+        # Editable installs import from src, so build the module in place there
+        inplace = version == "editable"
+        source = Path(self.root, "src", "snowflake_id_toolkit", "_speedups.c")
+
+        distribution = Distribution(
+            {
+                "ext_modules": [Extension("snowflake_id_toolkit._speedups", [str(source)])],
+                "package_dir": {"": str(Path(self.root, "src"))},
+            }
+        )
+        command = distribution.get_command_obj("build_ext")
+        command.inplace = inplace
+        command.build_lib = tempfile.mkdtemp()
+        command.build_temp = tempfile.mkdtemp()
+
+        try:
+            command.ensure_finalized()
+            command.run()
+        except Exception as exc:
+            self.app.display_warning(f"Building the C accelerator failed, falling back to pure Python: {exc}")
+            return
+
+        build_data["pure_python"] = False
+        build_data["infer_tag"] = True
+
+        if not inplace:
+            for output in command.get_outputs():
+                build_data["force_include"][output] = f"snowflake_id_toolkit/{Path(output).name}"
@@ -1,32 +1,122 @@
 """
 Snowflake ID Toolkit - Generate distributed unique IDs.
+
+Public names are imported on first access, so importing the package only loads
+the modules of the layouts and helpers actually used.
 """
 
-from snowflake_id_toolkit._config import SnowflakeIDConfig
-from snowflake_id_toolkit._exceptions import (
-    LastGenerationTimestampIsGreaterError,
-    MaxTimestampHasReachedError,
-)
-from snowflake_id_toolkit._generator import SnowflakeIDGenerator
-from snowflake_id_toolkit._id import SnowflakeID
-from snowflake_id_toolkit.instagram import InstagramSnowflakeID, InstagramSnowflakeIDGenerator
-from snowflake_id_toolkit.sony import SonyflakeID, SonyflakeIDGenerator
-from snowflake_id_toolkit.twitter import TwitterSnowflakeID, TwitterSnowflakeIDGenerator
+from importlib import import_module
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from snowflake_id_toolkit._buffered import BufferedSnowflakeIDGenerator, BufferStats
+    from snowflake_id_toolkit._config import SnowflakeIDConfig
+    from snowflake_id_toolkit._exceptions import (
+        CopiedGeneratorError,
+        LastGenerationTimestampIsGreaterError,
+        LifetimeWarning,
+        MaxTimestampHasReachedError,
+    )
+    from snowflake_id_toolkit._generator import SnowflakeIDGenerator
+    from snowflake_id_toolkit._id import SnowflakeID
+    from snowflake_id_toolkit._planning import (
+        ExhaustionStats,
+        GeneratorHealth,
+        LayoutPlan,
+        StallReport,
+        TickUtilization,
+        plan_layout,
+        simulate_stalls,
+    )
+    from snowflake_id_toolkit._pool import SnowflakeIDGeneratorPool
+    from snowflake_id_toolkit._simulation import SimulationReport, read_trace, replay_trace
+    from snowflake_id_toolkit._waiting import WaitStrategy
+    from snowflake_id_toolkit.instagram import InstagramSnowflakeID, InstagramSnowflakeIDGenerator
+    from snowflake_id_toolkit.sony import SonyflakeID, SonyflakeIDGenerator
+    from snowflake_id_toolkit.twitter import TwitterSnowflakeID, TwitterSnowflakeIDGenerator
+    from snowflake_id_toolkit.wide import WideSnowflakeID, WideSnowflakeIDGenerator
 
 __all__ = (
+    "BufferStats",
+    "BufferedSnowflakeIDGenerator",
+    "CopiedGeneratorError",
+    "ExhaustionStats",
+    "GeneratorHealth",
     "InstagramSnowflakeID",
     "InstagramSnowflakeIDGenerator",
     "LastGenerationTimestampIsGreaterError",
+    "LayoutPlan",
+    "LifetimeWarning",
     "MaxTimestampHasReachedError",
+    "SimulationReport",
     "SnowflakeID",
     "SnowflakeIDConfig",
     "SnowflakeIDGenerator",
+    "SnowflakeIDGeneratorPool",
     "SonyflakeID",
     "SonyflakeIDGenerator",
+    "StallReport",
+    "TickUtilization",
     "TwitterSnowflakeID",
     "TwitterSnowflakeIDGenerator",
+    "WaitStrategy",
+    "WideSnowflakeID",
+    "WideSnowflakeIDGenerator",
     "__version__",
+    "plan_layout",
+    "read_trace",
+    "replay_trace",
+    "simulate_stalls",
 )
 
+# Module each public name is imported from on first access
+_LAZY_IMPORTS = {
+    "BufferStats": "snowflake_id_toolkit._buffered",
+    "BufferedSnowflakeIDGenerator": "snowflake_id_toolkit._buffered",
+    "CopiedGeneratorError": "snowflake_id_toolkit._exceptions",
+    "ExhaustionStats": "snowflake_id_toolkit._planning",
+    "GeneratorHealth": "snowflake_id_toolkit._planning",
+    "InstagramSnowflakeID": "snowflake_id_toolkit.instagram",
+    "InstagramSnowflakeIDGenerator": "snowflake_id_toolkit.instagram",
+    "LastGenerationTimestampIsGreaterError": "snowflake_id_toolkit._exceptions",
+    "LayoutPlan": "snowflake_id_toolkit._planning",
+    "LifetimeWarning": "snowflake_id_toolkit._exceptions",
+    "MaxTimestampHasReachedError": "snowflake_id_toolkit._exceptions",
+    "SimulationReport": "snowflake_id_toolkit._simulation",
+    "SnowflakeID": "snowflake_id_toolkit._id",
+    "SnowflakeIDConfig": "snowflake_id_toolkit._config",
+    "SnowflakeIDGenerator": "snowflake_id_toolkit._generator",
+    "SnowflakeIDGeneratorPool": "snowflake_id_toolkit._pool",
+    "SonyflakeID": "snowflake_id_toolkit.sony",
+    "SonyflakeIDGenerator": "snowflake_id_toolkit.sony",
+    "StallReport": "snowflake_id_toolkit._planning",
+    "TickUtilization": "snowflake_id_toolkit._planning",
+    "TwitterSnowflakeID": "snowflake_id_toolkit.twitter",
+    "TwitterSnowflakeIDGenerator": "snowflake_id_toolkit.twitter",
+    "WaitStrategy": "snowflake_id_toolkit._waiting",
+    "WideSnowflakeID": "snowflake_id_toolkit.wide",
+    "WideSnowflakeIDGenerator": "snowflake_id_toolkit.wide",
+    "plan_layout": "snowflake_id_toolkit._planning",
+    "read_trace": "snowflake_id_toolkit._simulation",
+    "replay_trace": "snowflake_id_toolkit._simulation",
+    "simulate_stalls": "snowflake_id_toolkit._planning",
+}
+
 # Version will be set dynamically by hatch-vcs
 __version__ = "0.0.0"
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,6 @@
+import sys
+
+from snowflake_id_toolkit._cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
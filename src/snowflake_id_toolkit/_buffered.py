@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Generic
+
+from snowflake_id_toolkit._exceptions import SnowflakeIDToolkitError
+from snowflake_id_toolkit._generator import TID, SnowflakeIDGenerator
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+@dataclass(frozen=True)
+class BufferStats:
+    """Snapshot of a buffered generator's counters.
+
+    Attributes:
+        size: Number of IDs currently buffered.
+        depth: Maximum number of buffered IDs.
+        low_water_mark: Lowest buffer size observed since start, 0 after any miss.
+        refills: Number of refills that added IDs to the buffer.
+        misses: Number of requests served directly by the generator on an empty buffer.
+        evicted: Number of buffered IDs discarded for exceeding the staleness bound.
+    """
+
+    size: int
+    depth: int
+    low_water_mark: int
+    refills: int
+    misses: int
+    evicted: int
+
+
+class BufferedSnowflakeIDGenerator(Generic[TID]):
+    """Generator wrapper that hands out pre-generated IDs from a buffer.
+
+    A background thread keeps the buffer topped up, so the request path is a single
+    deque pop: the generator lock, clock reads and sequence-exhaustion waits all
+    happen on the refill thread. Buffered IDs older than max_staleness_ms are
+    discarded, so returned timestamps stay close to wall time.
+
+    IDs are unique, and increasing as long as the buffer does not run empty.
+    On an empty buffer the request falls back to the wrapped generator, and
+    that ID may be newer than IDs still in flight from the buffer.
+
+    Call close() or use the wrapper as a context manager to stop the refill
+    thread. A wrapper that is garbage collected unclosed stops it as well.
+
+    Example:
+        >>> with BufferedSnowflakeIDGenerator(
+        ...     TwitterSnowflakeIDGenerator(node_id=0),
+        ...     depth=8192,
+        ... ) as generator:
+        ...     generator.generate_next_id()
+    """
+
+    def __init__(
+        self,
+        generator: SnowflakeIDGenerator[TID],
+        *,
+        depth: int = 4096,
+        refill_threshold: int | None = None,
+        max_staleness_ms: int = 1000,
+        refill_interval_ms: int | None = None,
+    ) -> None:
+        """Fill the buffer and start the refill thread.
+
+        Args:
+            generator: Generator to draw IDs from.
+            depth: Maximum number of buffered IDs.
+            refill_threshold: Buffer size at which the request path wakes the refill
+                thread early (default: depth // 2).
+            max_staleness_ms: Maximum age of a buffered ID before it is discarded.
+            refill_interval_ms: Period of refills and stale-ID eviction
+                (default: one generator tick).
+
+        Raises:
+            ValueError: If any parameter is out of valid range.
+        """
+
+        if depth <= 0:
+            raise ValueError("Depth must be positive")
+
+        if refill_threshold is None:
+            refill_threshold = depth // 2
+
+        if not 0 <= refill_threshold < depth:
+            raise ValueError(f"Refill threshold must be between 0 and {depth - 1}")
+
+        if max_staleness_ms <= 0:
+            raise ValueError("Max staleness must be positive")
+
+        time_step_ms = generator.config.time_step_ms
+
+        if refill_interval_ms is None:
+            refill_interval_ms = time_step_ms
+
+        if refill_interval_ms <= 0:
+            raise ValueError("Refill interval must be positive")
+
+        self._generator = generator
+        self._depth = depth
+        self._refill_threshold = refill_threshold
+        self._max_staleness = max(max_staleness_ms // time_step_ms, 1)
+        self._refill_interval = refill_interval_ms / 1000
+
+        self._buffer: deque[TID] = deque()
+        self._low_water_mark = 0
+        self._refills = 0
+        self._misses = 0
+        self._evicted = 0
+
+        self._refill()
+        self._low_water_mark = depth
+
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=_run,
+            args=(weakref.ref(self), self._wakeup, self._stopped, self._refill_interval),
+            name="snowflake-id-refill",
+            daemon=True,
+        )
+        self._thread.start()
+        weakref.finalize(self, _stop, self._wakeup, self._stopped)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def stats(self) -> BufferStats:
+        """
+        Current buffer counters.
+        """
+
+        return BufferStats(
+            size=len(self._buffer),
+            depth=self._depth,
+            low_water_mark=self._low_water_mark,
+            refills=self._refills,
+            misses=self._misses,
+            evicted=self._evicted,
+        )
+
+    def generate_next_id(self) -> TID:
+        """Take the next ID from the buffer.
+
+        Returns:
+            A unique SnowflakeID instance.
+
+        Raises:
+            MaxTimestampHasReachedError: If the buffer is empty and timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If the buffer is empty and clock moved backwards.
+        """
+
+        buffer = self._buffer
+
+        try:
+            snowflake_id = buffer.popleft()
+        except IndexError:
+            self._misses += 1
+            self._low_water_mark = 0
+            self._wakeup.set()
+            return self._generator.generate_next_id()
+
+        if len(buffer) == self._refill_threshold:
+            self._wakeup.set()
+
+        return snowflake_id
+
+    def close(self) -> None:
+        """Stop the refill thread.
+
+        IDs left in the buffer are still handed out, after that every request
+        goes to the wrapped generator.
+        """
+
+        _stop(self._wakeup, self._stopped)
+        self._thread.join()
+
+    def _refill(self) -> None:
+        """
+        Discard stale IDs and top the buffer up to depth.
+        """
+
+        generator = self._generator
+        buffer = self._buffer
+
+        # IDs below this value were generated more than max_staleness ticks ago
+        stale_before = (
+            generator.get_current_timestamp() - generator.epoch - self._max_staleness
+        ) << generator.config.timestamp_shift
+
+        with suppress(IndexError):
+            while buffer[0] < stale_before:
+                buffer.popleft()
+                self._evicted += 1
+
+        size = len(buffer)
+        self._low_water_mark = min(self._low_water_mark, size)
+
+        if size < self._depth:
+            buffer.extend(generator.generate_ids(self._depth - size))
+            self._refills += 1
+
+
+def _run(
+    buffered_ref: weakref.ref[BufferedSnowflakeIDGenerator[TID]],
+    wakeup: threading.Event,
+    stopped: threading.Event,
+    interval: float,
+) -> None:
+    """Refill the buffer until stopped, body of the refill thread.
+
+    Holds the wrapper only through a weak reference between refills, so an
+    unclosed wrapper can still be garbage collected, which stops the thread.
+    """
+
+    while True:
+        wakeup.wait(interval)
+
+        if stopped.is_set():
+            return
+
+        wakeup.clear()
+        buffered = buffered_ref()
+
+        if buffered is None:
+            return
+
+        # Generator errors reach callers through the fallback path once the buffer runs empty
+        with suppress(SnowflakeIDToolkitError):
+            buffered._refill()  # noqa: SLF001
+
+        del buffered
+
+
+def _stop(wakeup: threading.Event, stopped: threading.Event) -> None:
+    """
+    Make the refill thread exit at its next wake-up, and wake it now.
+    """
+
+    stopped.set()
+    wakeup.set()
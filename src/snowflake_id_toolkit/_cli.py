@@ -0,0 +1,355 @@
+"""
+Command-line interface: bulk generation and decoding of snowflake IDs, layout planning and trace replay.
+"""
+
+import argparse
+import struct
+import sys
+from base64 import b32decode, b32encode
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+from snowflake_id_toolkit._compiled import speedups
+from snowflake_id_toolkit._config import SnowflakeIDConfig
+from snowflake_id_toolkit._exceptions import SnowflakeIDToolkitError
+from snowflake_id_toolkit._layouts import LAYOUTS
+from snowflake_id_toolkit._planning import plan_layout, simulate_stalls
+from snowflake_id_toolkit._simulation import read_trace, replay_trace
+
+# Number of IDs generated, read or written per I/O call
+_CHUNK_SIZE = 1 << 16
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the snowflake-id command.
+
+    Args:
+        argv: Command-line arguments without the program name (default: sys.argv[1:]).
+
+    Returns:
+        Process exit code.
+    """
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        args.handler(args)
+    except (ValueError, OSError, SnowflakeIDToolkitError) as exc:
+        sys.stderr.write(f"{parser.prog}: error: {exc}\n")
+        return 1
+
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="snowflake-id",
+        description="Generate and decode snowflake IDs in bulk, plan ID layouts and replay traffic against them.",
+    )
+    commands = parser.add_subparsers(required=True, metavar="COMMAND")
+
+    layout = argparse.ArgumentParser(add_help=False)
+    layout.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        default="twitter",
+        help="ID bit layout (default: %(default)s)",
+    )
+    layout.add_argument(
+        "--epoch",
+        type=int,
+        default=0,
+        help="custom epoch in layout time units, 10 ms for sonyflake, 1 ms otherwise (default: %(default)s)",
+    )
+
+    generate = commands.add_parser("generate", parents=[layout], help="generate IDs")
+    generate.add_argument("-n", "--count", type=int, required=True, help="number of IDs to generate")
+    generate.add_argument("--node-id", type=int, default=0, help="node ID of the generator (default: %(default)s)")
+    generate.add_argument(
+        "-f",
+        "--format",
+        choices=_ENCODERS,
+        default="text",
+        help="output format: decimal lines, raw big-endian bytes or base32 lines (default: %(default)s)",
+    )
+    generate.add_argument("-o", "--output", type=Path, help="output file (default: stdout)")
+    generate.set_defaults(handler=_generate)
+
+    decode = commands.add_parser("decode", parents=[layout], help="decode IDs into their components")
+    decode.add_argument(
+        "-f",
+        "--format",
+        choices=_ENCODERS,
+        default="text",
+        help="input format, as written by generate (default: %(default)s)",
+    )
+    decode.add_argument(
+        "-t",
+        "--to",
+        choices=_ROW_FORMATTERS,
+        default="csv",
+        help="output format (default: %(default)s)",
+    )
+    decode.add_argument("-i", "--input", type=Path, help="input file (default: stdin)")
+    decode.add_argument("-o", "--output", type=Path, help="output file (default: stdout)")
+    decode.set_defaults(handler=_decode)
+
+    plan = commands.add_parser("plan", help="recommend a bit layout for a load and lifespan")
+    plan.add_argument("--ids-per-second", type=int, required=True, help="target IDs per second per node")
+    plan.add_argument("--nodes", type=int, required=True, help="number of nodes generating IDs")
+    plan.add_argument("--years", type=float, required=True, help="years the layout must cover from its epoch")
+    plan.add_argument(
+        "--total-bits",
+        type=int,
+        default=64,
+        help="width of the encoded ID in bits (default: %(default)s)",
+    )
+    plan.add_argument(
+        "--headroom",
+        type=float,
+        default=2.0,
+        help="factor of burst capacity over the target rate (default: %(default)s)",
+    )
+    plan.add_argument(
+        "--profile",
+        type=Path,
+        help="load profile to replay against the layout: CSV of one node's request arrival times in ms",
+    )
+    plan.set_defaults(handler=_plan)
+
+    simulate = commands.add_parser("simulate", help="replay a traffic trace against layouts on a virtual clock")
+    simulate.add_argument(
+        "--trace",
+        type=Path,
+        required=True,
+        help="CSV of one node's request arrival times in ms since the Unix epoch, in the first column",
+    )
+    simulate.add_argument(
+        "--layout",
+        action="append",
+        choices=LAYOUTS,
+        help="layout to replay against, repeatable (default: all)",
+    )
+    simulate.add_argument("--node-id", type=int, default=0, help="node ID of the generators (default: %(default)s)")
+    simulate.set_defaults(handler=_simulate)
+
+    return parser
+
+
+def _generate(args: argparse.Namespace) -> None:
+    if args.count < 0:
+        raise ValueError("Count must not be negative")
+
+    generator_cls, _ = LAYOUTS[args.layout]
+    generator = generator_cls(args.node_id, epoch=args.epoch)
+    encode = _ENCODERS[args.format]
+    byte_length = generator.config.byte_length
+
+    with _open_output(args.output) as output:
+        remaining = args.count
+        while remaining:
+            size = min(remaining, _CHUNK_SIZE)
+            output.write(encode(generator.generate_ids(size), byte_length))
+            remaining -= size
+
+
+def _decode(args: argparse.Namespace) -> None:
+    _, config = LAYOUTS[args.layout]
+    read_chunks = _READERS[args.format]
+    format_rows = _ROW_FORMATTERS[args.to]
+
+    with _open_input(args.input) as input_, _open_output(args.output) as output:
+        if args.to == "csv":
+            output.write(b"id,timestamp_ms,node_id,sequence\n")
+
+        for values in read_chunks(input_, config.byte_length):
+            output.write(format_rows(values, config, args.epoch))
+
+
+def _plan(args: argparse.Namespace) -> None:
+    plan = plan_layout(args.ids_per_second, args.nodes, args.years, total_bits=args.total_bits, headroom=args.headroom)
+    lines = [
+        f"layout: {plan.config}",
+        f"lifespan: {plan.lifespan_years:.1f} years",
+        f"capacity: {plan.ids_per_second} IDs per second per node, {plan.nodes} nodes",
+    ]
+
+    if args.profile is not None:
+        report = simulate_stalls(plan.config, read_trace(args.profile))
+
+        stalled_share = report.stalled_ids / report.ids if report.ids else 0.0
+        lines += [
+            f"requests: {report.ids}",
+            f"stalled: {report.stalled_ids} ({stalled_share:.2%}), {report.exhausted_ticks} exhausted ticks",
+            f"stall time: {report.total_stall_ms:.3f} ms total, {report.max_stall_ms:.3f} ms max",
+        ]
+
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
+def _simulate(args: argparse.Namespace) -> None:
+    arrivals = read_trace(args.trace)
+    lines = [
+        (
+            f"{'layout':<10} {'ids':>10} {'ticks':>10} {'max/tick':>9} {'stalled':>10} {'stall_ms':>10} "
+            f"{'p50_ms':>8} {'p99_ms':>8} {'p99.9_ms':>8} {'max_ms':>8}"
+        )
+    ]
+
+    for name in args.layout or LAYOUTS:
+        generator_cls, _ = LAYOUTS[name]
+        report = replay_trace(generator_cls, arrivals, node_id=args.node_id)
+        lines.append(
+            f"{name:<10} {report.ids:>10} {report.ticks:>10} {report.max_ids_per_tick:>9} {report.stalled_ids:>10} "
+            f"{report.stall_ms:>10.3f} {report.p50_ms:>8.3f} {report.p99_ms:>8.3f} {report.p999_ms:>8.3f} "
+            f"{report.max_ms:>8.3f}"
+        )
+
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
+# Encoders: IDs -> output bytes
+
+
+def _encode_text(ids: Sequence[int], _byte_length: int) -> bytes:
+    return "".join([f"{id_}\n" for id_ in ids]).encode("ascii")
+
+
+def _encode_binary(ids: Sequence[int], byte_length: int) -> bytes:
+    return b"".join([id_.to_bytes(byte_length, "big") for id_ in ids])
+
+
+def _encode_base32(ids: Sequence[int], byte_length: int) -> bytes:
+    return b"".join([b32encode(id_.to_bytes(byte_length, "big")) + b"\n" for id_ in ids])
+
+
+_ENCODERS: dict[str, Callable[[Sequence[int], int], bytes]] = {
+    "text": _encode_text,
+    "binary": _encode_binary,
+    "base32": _encode_base32,
+}
+
+
+# Readers: input stream -> chunks of ID values
+
+
+def _read_text(input_: IO[bytes], _byte_length: int) -> Iterator[list[int]]:
+    while lines := input_.readlines(_CHUNK_SIZE * 20):
+        yield [int(line) for line in lines if not line.isspace()]
+
+
+def _read_binary(input_: IO[bytes], byte_length: int) -> Iterator[list[int]]:
+    while chunk := input_.read(_CHUNK_SIZE * byte_length):
+        if len(chunk) % byte_length:
+            raise ValueError(f"Binary input length must be a multiple of {byte_length} bytes")
+
+        if byte_length == 8:
+            yield [value for (value,) in struct.iter_unpack(">Q", chunk)]
+        else:
+            yield [int.from_bytes(chunk[i : i + byte_length], "big") for i in range(0, len(chunk), byte_length)]
+
+
+def _read_base32(input_: IO[bytes], _byte_length: int) -> Iterator[list[int]]:
+    while lines := input_.readlines(_CHUNK_SIZE * 20):
+        yield [int.from_bytes(b32decode(line.strip()), "big") for line in lines if not line.isspace()]
+
+
+_READERS: dict[str, Callable[[IO[bytes], int], Iterator[list[int]]]] = {
+    "text": _read_text,
+    "binary": _read_binary,
+    "base32": _read_base32,
+}
+
+
+# Row formatters: ID values -> output text
+
+
+def _format_csv(values: list[int], config: SnowflakeIDConfig, epoch: int) -> bytes:
+    if (rows := _format_compiled(values, config, epoch, jsonl=False)) is not None:
+        return rows
+
+    timestamp_shift = config.timestamp_shift
+    node_id_shift = config.node_id_shift
+    max_node_id = config.max_node_id
+    max_sequence = config.max_sequence
+    time_step_ms = config.time_step_ms
+
+    return "".join(
+        [
+            f"{value},{((value >> timestamp_shift) + epoch) * time_step_ms},"
+            f"{(value >> node_id_shift) & max_node_id},{value & max_sequence}\n"
+            for value in values
+        ]
+    ).encode("ascii")
+
+
+def _format_jsonl(values: list[int], config: SnowflakeIDConfig, epoch: int) -> bytes:
+    if (rows := _format_compiled(values, config, epoch, jsonl=True)) is not None:
+        return rows
+
+    timestamp_shift = config.timestamp_shift
+    node_id_shift = config.node_id_shift
+    max_node_id = config.max_node_id
+    max_sequence = config.max_sequence
+    time_step_ms = config.time_step_ms
+
+    return "".join(
+        [
+            f'{{"id":{value},"timestamp_ms":{((value >> timestamp_shift) + epoch) * time_step_ms},'
+            f'"node_id":{(value >> node_id_shift) & max_node_id},"sequence":{value & max_sequence}}}\n'
+            for value in values
+        ]
+    ).encode("ascii")
+
+
+def _format_compiled(values: list[int], config: SnowflakeIDConfig, epoch: int, *, jsonl: bool) -> bytes | None:
+    """
+    Format rows with the compiled accelerator, None if it is unavailable or the values do not fit into 64 bits.
+    """
+
+    if speedups is None or config.total_bits > 64 or not 0 <= epoch <= config.max_timestamp:
+        return None
+
+    try:
+        rows: bytes = speedups.format_rows(
+            values,
+            config.timestamp_shift,
+            config.node_id_shift,
+            config.max_node_id,
+            config.max_sequence,
+            epoch,
+            config.time_step_ms,
+            jsonl,
+        )
+    except OverflowError:
+        return None
+
+    return rows
+
+
+_ROW_FORMATTERS: dict[str, Callable[[list[int], SnowflakeIDConfig, int], bytes]] = {
+    "csv": _format_csv,
+    "jsonl": _format_jsonl,
+}
+
+
+@contextmanager
+def _open_input(path: Path | None) -> Iterator[IO[bytes]]:
+    if path is None:
+        yield sys.stdin.buffer
+    else:
+        with path.open("rb", buffering=1 << 20) as stream:
+            yield stream
+
+
+@contextmanager
+def _open_output(path: Path | None) -> Iterator[IO[bytes]]:
+    if path is None:
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+    else:
+        with path.open("wb", buffering=1 << 20) as stream:
+            yield stream
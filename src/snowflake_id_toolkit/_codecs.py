@@ -0,0 +1,180 @@
+from binascii import a2b_base64, b2a_base64
+
+_BASE16_ALPHABET = "0123456789ABCDEFabcdef"
+_BASE32_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+_BASE64_URLSAFE_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+# Digits, then upper and lower case letters, so fixed-width strings sort like the integers
+_BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# Two characters per entry, halving the per-character work of the encoding loops
+_BASE32_PAIRS = [first + second for first in _BASE32_ALPHABET for second in _BASE32_ALPHABET]
+_BASE62_PAIRS = [first + second for first in _BASE62_ALPHABET for second in _BASE62_ALPHABET]
+
+# Base32 digits of int(), 0-9a-v, which parse a translated base32 string in one call
+_BASE32_TO_INT_DIGITS = str.maketrans(_BASE32_ALPHABET, "0123456789abcdefghijklmnopqrstuv")
+_BASE62_VALUES = {char: value for value, char in enumerate(_BASE62_ALPHABET)}
+_BASE64_URLSAFE_VALUES = {char: value for value, char in enumerate(_BASE64_URLSAFE_ALPHABET)}
+
+# Base62 width of every byte length: digits needed for the largest value
+_base62_widths: dict[int, int] = {}
+
+
+def encode_base16(value: int, byte_length: int) -> str:
+    """
+    Encode an integer as upper-case base16, two digits per byte.
+    """
+
+    return f"{value:0{2 * byte_length}X}"
+
+
+def parse_base16(text: str, byte_length: int) -> int:
+    """Parse base16 of either case, two digits per byte.
+
+    Raises:
+        ValueError: If text has the wrong length or a character outside the alphabet.
+    """
+
+    if len(text) != 2 * byte_length or text.strip(_BASE16_ALPHABET):
+        raise ValueError(f"ID must be {2 * byte_length} base16 digits")
+
+    return int(text, 16)
+
+
+def encode_base32(value: int, byte_length: int, padding: bool) -> str:
+    """
+    Encode an integer as RFC 4648 base32 of its big-endian bytes, with or without "=" padding.
+    """
+
+    bits = 8 * byte_length
+    chars = -(-bits // 5)
+    # Align the last character with the integer's lowest bits
+    value <<= chars * 5 - bits
+
+    if chars & 1:
+        text = _BASE32_ALPHABET[value >> (chars - 1) * 5] + "".join(
+            [_BASE32_PAIRS[(value >> shift) & 1023] for shift in range((chars - 3) * 5, -1, -10)]
+        )
+    else:
+        text = "".join([_BASE32_PAIRS[(value >> shift) & 1023] for shift in range((chars - 2) * 5, -1, -10)])
+
+    return text + "=" * (-chars % 8) if padding else text
+
+
+def parse_base32(text: str, byte_length: int) -> int:
+    """Parse upper-case RFC 4648 base32, with or without "=" padding.
+
+    Raises:
+        ValueError: If text has the wrong length, a character outside the alphabet
+            or unused trailing bits set.
+    """
+
+    bits = 8 * byte_length
+    chars = -(-bits // 5)
+    body = text[:chars]
+
+    if len(body) != chars or text[chars:] not in ("", "=" * (-chars % 8)) or body.strip(_BASE32_ALPHABET):
+        raise ValueError(f"ID must be {chars} base32 characters")
+
+    return _drop_unused_bits(int(body.translate(_BASE32_TO_INT_DIGITS), 32), chars * 5 - bits)
+
+
+def encode_base64_urlsafe(value: int, byte_length: int, padding: bool) -> str:
+    """
+    Encode an integer as URL-safe base64 of its big-endian bytes, with or without "=" padding.
+    """
+
+    text = b2a_base64(value.to_bytes(byte_length, "big"), newline=False).decode("ascii")
+    text = text.replace("+", "-").replace("/", "_")
+    return text if padding else text.rstrip("=")
+
+
+def parse_base64_urlsafe(text: str, byte_length: int) -> int:
+    """Parse URL-safe base64, with or without "=" padding.
+
+    Raises:
+        ValueError: If text has the wrong length, a character outside the alphabet
+            or unused trailing bits set.
+    """
+
+    bits = 8 * byte_length
+    chars = -(-bits // 6)
+    padding = "=" * (-chars % 4)
+    body = text[:chars]
+
+    if len(body) != chars or text[chars:] not in ("", padding) or body.strip(_BASE64_URLSAFE_ALPHABET):
+        raise ValueError(f"ID must be {chars} URL-safe base64 characters")
+
+    if _BASE64_URLSAFE_VALUES[body[-1]] & ((1 << (chars * 6 - bits)) - 1):
+        raise ValueError("ID must not set unused trailing bits")
+
+    return int.from_bytes(a2b_base64(body.replace("-", "+").replace("_", "/") + padding), "big")
+
+
+def encode_base62(value: int, byte_length: int, padding: bool) -> str:
+    """
+    Encode an integer as base62, zero-padded to the width of the largest value unless padding is off.
+    """
+
+    parts = []
+
+    while value:
+        value, pair = divmod(value, 3844)
+        parts.append(_BASE62_PAIRS[pair])
+
+    text = "".join(reversed(parts)).lstrip("0")
+    return text.rjust(_base62_width(byte_length), "0") if padding else text or "0"
+
+
+def parse_base62(text: str, byte_length: int) -> int:
+    """Parse base62, zero-padded or not.
+
+    Raises:
+        ValueError: If text is empty, too long, has a character outside the alphabet
+            or a value that does not fit into byte_length bytes.
+    """
+
+    width = _base62_width(byte_length)
+
+    if not 0 < len(text) <= width or text.strip(_BASE62_ALPHABET):
+        raise ValueError(f"ID must be 1 to {width} base62 characters")
+
+    values = _BASE62_VALUES
+    value = 0
+
+    for char in text:
+        value = value * 62 + values[char]
+
+    if value >> 8 * byte_length:
+        raise ValueError(f"ID must fit into {byte_length} bytes")
+
+    return value
+
+
+def _base62_width(byte_length: int) -> int:
+    """
+    Number of base62 digits of the largest integer of byte_length bytes.
+    """
+
+    try:
+        return _base62_widths[byte_length]
+    except KeyError:
+        width = 1
+
+        while 62**width < 1 << 8 * byte_length:
+            width += 1
+
+        _base62_widths[byte_length] = width
+        return width
+
+
+def _drop_unused_bits(value: int, unused_bits: int) -> int:
+    """Shift off the bits a text encoding appends to fill its last character.
+
+    Raises:
+        ValueError: If any of them is set, which would give one ID several encodings.
+    """
+
+    if value & ((1 << unused_bits) - 1):
+        raise ValueError("ID must not set unused trailing bits")
+
+    return value >> unused_bits
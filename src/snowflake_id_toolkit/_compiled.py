@@ -0,0 +1,23 @@
+"""
+Optional compiled accelerator, built from _speedups.c when a C compiler is available.
+
+Set SNOWFLAKE_ID_TOOLKIT_PURE_PYTHON=1 to use the pure-Python implementation even if it is built.
+"""
+
+import os
+from types import ModuleType
+
+
+def _load() -> ModuleType | None:
+    if os.environ.get("SNOWFLAKE_ID_TOOLKIT_PURE_PYTHON"):
+        return None
+
+    try:
+        from snowflake_id_toolkit import _speedups  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    return _speedups
+
+
+speedups = _load()
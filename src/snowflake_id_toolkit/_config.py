@@ -1,16 +1,28 @@
-from dataclasses import dataclass
-from functools import cached_property
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
 class SnowflakeIDConfig:
     """Configuration for snowflake-like ID.
 
+    Immutable and hashable. Derived values (shifts, maxima, byte length) are
+    computed once on construction and excluded from comparison and repr.
+
     Attributes:
         timestamp_bits: Number of bits for timestamp.
         node_id_bits: Number of bits for node/machine ID.
         sequence_bits: Number of bits for sequence number.
         time_step_ms: Time resolution in milliseconds (default: 1).
+        total_bits: Width of the encoded ID in bits, a multiple of 8 (default: 64).
+            Component bits that do not fill the whole width are left unused
+            at the top, like the sign bit of Twitter Snowflake.
+
+    Raises:
+        ValueError: If any component width is negative, time_step_ms is not positive,
+            total_bits is not a positive multiple of 8, or the components do not fit
+            into total_bits.
     """
 
     timestamp_bits: int
@@ -19,22 +31,35 @@ class SnowflakeIDConfig:
 
     time_step_ms: int = 1
 
-    @cached_property
-    def node_id_shift(self) -> int:
-        return self.sequence_bits
+    total_bits: int = 64
+
+    node_id_shift: int = field(init=False, repr=False, compare=False)
+    timestamp_shift: int = field(init=False, repr=False, compare=False)
+    max_timestamp: int = field(init=False, repr=False, compare=False)
+    max_node_id: int = field(init=False, repr=False, compare=False)
+    max_sequence: int = field(init=False, repr=False, compare=False)
+    byte_length: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.timestamp_bits <= 0:
+            raise ValueError("Timestamp bits must be positive")
+
+        if self.node_id_bits < 0 or self.sequence_bits < 0:
+            raise ValueError("Node ID bits and sequence bits must not be negative")
 
-    @cached_property
-    def timestamp_shift(self) -> int:
-        return self.node_id_bits + self.node_id_shift
+        if self.time_step_ms <= 0:
+            raise ValueError("Time step must be positive")
 
-    @cached_property
-    def max_timestamp(self) -> int:
-        return -1 ^ (-1 << self.timestamp_bits)
+        if self.total_bits <= 0 or self.total_bits % 8:
+            raise ValueError("Total bits must be a positive multiple of 8")
 
-    @cached_property
-    def max_node_id(self) -> int:
-        return -1 ^ (-1 << self.node_id_bits)
+        if self.timestamp_bits + self.node_id_bits + self.sequence_bits > self.total_bits:
+            raise ValueError(f"Timestamp, node ID and sequence bits must fit into {self.total_bits} bits")
 
-    @cached_property
-    def max_sequence(self) -> int:
-        return -1 ^ (-1 << self.sequence_bits)
+        # Frozen, so derived values bypass the generated __setattr__
+        object.__setattr__(self, "node_id_shift", self.sequence_bits)
+        object.__setattr__(self, "timestamp_shift", self.node_id_bits + self.sequence_bits)
+        object.__setattr__(self, "max_timestamp", -1 ^ (-1 << self.timestamp_bits))
+        object.__setattr__(self, "max_node_id", -1 ^ (-1 << self.node_id_bits))
+        object.__setattr__(self, "max_sequence", -1 ^ (-1 << self.sequence_bits))
+        object.__setattr__(self, "byte_length", self.total_bits // 8)
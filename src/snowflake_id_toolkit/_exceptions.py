@@ -11,3 +11,13 @@ class MaxTimestampHasReachedError(OverflowError, SnowflakeIDToolkitError):
 
 class LastGenerationTimestampIsGreaterError(SnowflakeIDToolkitError):
     detail: str = "Last generation timestamp is greater than current timestamp"
+
+
+class CopiedGeneratorError(SnowflakeIDToolkitError):
+    detail: str = "Generator is a copy sharing its node ID with the original, reassign it a node ID of its own"
+
+
+class LifetimeWarning(UserWarning):
+    """
+    Warning that a generator's timestamp range runs out within a watched threshold, see watch_lifetime().
+    """
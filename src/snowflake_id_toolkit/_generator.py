@@ -1,16 +1,54 @@
+from __future__ import annotations
+
+import math
+import os
 import threading
 import time
-from typing import Generic, TypeVar
+import warnings
+import weakref
+from typing import Any, Generic, TypeVar
 
+from snowflake_id_toolkit._compiled import speedups
 from snowflake_id_toolkit._config import SnowflakeIDConfig
 from snowflake_id_toolkit._exceptions import (
+    CopiedGeneratorError,
     LastGenerationTimestampIsGreaterError,
+    LifetimeWarning,
     MaxTimestampHasReachedError,
 )
-from snowflake_id_toolkit._id import SnowflakeID
+from snowflake_id_toolkit._id import DEFAULT_MAX_SKEW_MS, SnowflakeID
+from snowflake_id_toolkit._ordering import ProcessOrdering, get_process_ordering
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Callable, Iterable
+    from datetime import timedelta
+
+    from snowflake_id_toolkit._planning import ExhaustionStats, GeneratorHealth, TickUtilization
+    from snowflake_id_toolkit._waiting import WaitStrategy
 
 TID = TypeVar("TID", bound=SnowflakeID)
 
+_MASK_64 = (1 << 64) - 1
+
+# Number of completed ticks whose utilization exhaustion tracking keeps
+_UTILIZATION_TICKS = 4096
+
+# Attributes set up by _bind(), not carried over by pickling or copying
+_PROCESS_LOCAL_ATTRIBUTES = (
+    "_lock",
+    "_ordering",
+    "_id_type",
+    "_fast_path",
+    "_compose",
+    "_advance",
+    "_advance_untracked",
+    "_advance_unordered",
+    "_compose_unordered",
+)
+
 
 class SnowflakeIDGenerator(Generic[TID]):
     """Base class for snowflake-like ID generators.
@@ -23,20 +61,45 @@ class SnowflakeIDGenerator(Generic[TID]):
 
     _id_cls: type[TID]
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         node_id: int,
         *,
         epoch: int = 0,
+        monotonic: bool = False,
+        track_exhaustion: bool = False,
+        random_sequence: bool = False,
+        hybrid_clock: bool = False,
+        wait_strategy: WaitStrategy | None = None,
     ) -> None:
         """Initialize the generator.
 
         Args:
             node_id: Unique identifier for this node/machine.
             epoch: Custom epoch timestamp in milliseconds (default: Unix epoch).
+            monotonic: Order IDs after every ID issued by other monotonic generators
+                of the same layout and epoch in this process, so that all of their IDs
+                are strictly increasing as integers. These generators share one lock,
+                and an ID following one of a higher node ID within a tick continues
+                that ID's node ID and sequence.
+            track_exhaustion: Count ticks, ticks that used up their sequence numbers
+                and time spent waiting past them, see exhaustion_stats(), and record
+                the IDs of recent ticks, see tick_utilization().
+            random_sequence: Start every tick's sequence at a random offset and wrap
+                around, so low bits are spread and hard to guess while every tick
+                still holds max_sequence + 1 IDs. IDs stay unique and ordered by tick,
+                but not within a tick.
+            hybrid_clock: Run as a hybrid logical clock: the timestamp never falls behind
+                the last generated or observed ID and the sequence counts IDs within it.
+                Instead of waiting for the clock, an exhausted sequence carries into the
+                next tick, and a clock behind the last ID is outrun instead of raising
+                LastGenerationTimestampIsGreaterError. See observe().
+            wait_strategy: How to wait for the next tick once a tick's sequence
+                numbers are used up (default: busy-wait).
 
         Raises:
-            ValueError: If node_id or epoch is out of valid range.
+            ValueError: If node_id or epoch is out of valid range, or random_sequence
+                is set together with monotonic or hybrid_clock.
             MaxTimestampHasReachedError: If current time exceeds max representable.
         """
 
@@ -51,12 +114,127 @@ class SnowflakeIDGenerator(Generic[TID]):
         if current_timestamp - epoch > self._config.max_timestamp:
             raise MaxTimestampHasReachedError
 
-        self._lock = threading.Lock()
+        if monotonic and random_sequence:
+            raise ValueError("Monotonic generators cannot randomize the sequence")
+
+        if hybrid_clock and random_sequence:
+            raise ValueError("Hybrid clock generators cannot randomize the sequence")
 
         self._node_id = node_id
         self._epoch = epoch
-        self._sequence = 0
-        self._last_generation_timestamp = -1
+        self._monotonic = monotonic
+
+        # Timestamp and sequence of the last generated ID packed into one integer,
+        # timestamp << sequence_bits | sequence. Absolute timestamps, so the
+        # initial state sits one tick before any reachable clock value.
+        self._state = -1 << self._config.sequence_bits
+
+        self._max_generation_timestamp = epoch + self._config.max_timestamp
+
+        # Key of the per-tick sequence offsets, None for sequences starting at 0
+        self._sequence_key: int | None = int.from_bytes(os.urandom(8), "big") if random_sequence else None
+        # Timestamp of the last tick _compose_random() composed and the tick's offset
+        self._offset_cache = (-1, 0)
+
+        self._hybrid_clock = hybrid_clock
+        # Smallest state the next ID of a hybrid clock may take, raised by observe()
+        self._observed_state = 0
+
+        self._wait_strategy = wait_strategy
+        # Remaining lifetimes in milliseconds watch_lifetime() has yet to report, largest first
+        self._lifetime_thresholds: list[int] = []
+        self._lifetime_hook: Callable[[GeneratorHealth], None] | None = None
+        self._tracking = track_exhaustion
+
+        if track_exhaustion:
+            self._ticks = self._exhausted_ticks = self._stall_ns = 0
+            # Ring buffer of the IDs generated in each of the last completed ticks
+            self._tick_ids = [0] * _UTILIZATION_TICKS
+            # Sequence the current tick started at
+            self._tick_start = 0
+
+        self._bind()
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickled state of the generator.
+
+        The lock, the process ordering and the compiled fast path belong to this
+        process and are left out; they are rebuilt on unpickling.
+        """
+
+        state = vars(self).copy()
+
+        for name in _PROCESS_LOCAL_ATTRIBUTES:
+            state.pop(name, None)
+
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore a pickled or copied generator.
+
+        The copy keeps the original's node ID and last generated ID, so the two would
+        issue the same IDs. It refuses to generate until given a node ID of its own
+        with reassign().
+        """
+
+        vars(self).update(state)
+        self._bind()
+        self._invalidate()
+
+    def reassign(self, node_id: int) -> None:
+        """Move the generator to another node ID.
+
+        Enables generators that were copied, unpickled or inherited by a forked
+        child process, which refuse to generate until then. The last generated ID
+        is kept, so IDs stay ordered across the reassignment.
+
+        Args:
+            node_id: Node ID no other generator of the layout and epoch is using.
+
+        Raises:
+            ValueError: If node_id is out of valid range or is the generator's current node ID.
+        """
+
+        if not 0 <= node_id <= self._config.max_node_id:
+            raise ValueError(f"Node ID must be between 0 and {self._config.max_node_id}")
+
+        if node_id == self._node_id:
+            raise ValueError("Node ID must differ from the current one")
+
+        self._node_id = node_id
+        self._bind()
+
+    @property
+    def config(self) -> SnowflakeIDConfig:
+        """
+        Bit layout and time resolution of generated IDs.
+        """
+
+        return self._config
+
+    @property
+    def node_id(self) -> int:
+        """
+        Node ID encoded into generated IDs.
+        """
+
+        return self._node_id
+
+    @property
+    def epoch(self) -> int:
+        """
+        Custom epoch of generated IDs, in generator-specific time units.
+        """
+
+        return self._epoch
+
+    @property
+    def id_type(self) -> type[TID]:
+        """
+        ID class of generated IDs, bound to the generator's epoch unless it is 0, see SnowflakeID.with_epoch().
+        """
+
+        return self._id_type
 
     def generate_next_id(self) -> TID:
         """Generate the next unique snowflake ID.
@@ -69,45 +247,815 @@ class SnowflakeIDGenerator(Generic[TID]):
             LastGenerationTimestampIsGreaterError: If clock moved backwards.
         """
 
+        current_timestamp = self.get_current_timestamp()
+
+        if current_timestamp > self._max_generation_timestamp:
+            raise MaxTimestampHasReachedError
+
         with self._lock:
-            current_timestamp = self.get_current_timestamp()
+            state = self._advance(current_timestamp)
+
+        return self._id_type(self._compose(state))
+
+    # Pure-Python implementation, also the fallback of the compiled generate_next_id
+    _generate_next_id = generate_next_id
 
-            if current_timestamp - self._epoch > self._config.max_timestamp:
-                raise MaxTimestampHasReachedError
+    def generate_next_raw_id(self) -> int:
+        """Generate the next unique snowflake ID as a plain integer.
+
+        Skips building the ID class instance, for callers that store or send the
+        ID without decoding it. Shares state with generate_next_id().
+
+        Raises:
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        current_timestamp = self.get_current_timestamp()
+
+        if current_timestamp > self._max_generation_timestamp:
+            raise MaxTimestampHasReachedError
+
+        with self._lock:
+            state = self._advance(current_timestamp)
 
-            if current_timestamp == self._last_generation_timestamp:
-                if self._sequence == self._config.max_sequence:
-                    # Wait for the next timestamp
-                    current_timestamp = self._wait_for_next_timestamp()
-                self._sequence += 1
-            elif current_timestamp > self._last_generation_timestamp:
-                self._sequence = 0
+        return self._compose(state)
+
+    # Pure-Python implementation, also the fallback of the compiled generate_next_raw_id
+    _generate_next_raw_id = generate_next_raw_id
+
+    def generate_ids(self, count: int) -> list[TID]:
+        """Generate a batch of unique snowflake IDs.
+
+        The whole batch is generated under a single lock acquisition,
+        so IDs in the batch are strictly increasing. The clock is read once
+        per tick the batch spans rather than once per ID.
+
+        Args:
+            count: Number of IDs to generate.
+
+        Returns:
+            A list of count unique SnowflakeID instances.
+
+        Raises:
+            ValueError: If count is negative.
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        id_cls = self._id_type
+        ids: list[TID] = []
+
+        for start, stop in self._reserve(count):
+            if speedups is not None:
+                # Offsets from start, IDs of wide layouts can outgrow a C ssize_t
+                ids.extend(speedups.make_ids(id_cls, start, 0, stop - start - 1))
             else:
-                raise LastGenerationTimestampIsGreaterError
+                ids.extend([id_cls(value) for value in range(start, stop)])
+
+        return ids
+
+    def generate_raw_ids(self, count: int) -> list[int]:
+        """Generate a batch of unique snowflake IDs as plain integers.
+
+        Like generate_ids(), without building the ID class instances.
+
+        Args:
+            count: Number of IDs to generate.
+
+        Returns:
+            A list of count unique integers.
+
+        Raises:
+            ValueError: If count is negative.
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        ids: list[int] = []
+
+        for start, stop in self._reserve(count):
+            ids.extend(range(start, stop))
+
+        return ids
+
+    def generate_id_array(self, count: int) -> array[int]:
+        """Generate a batch of unique snowflake IDs into an array of unsigned 64-bit integers.
+
+        Like generate_ids(), with the IDs stored unboxed, 8 bytes each. The array
+        supports the buffer protocol, so NumPy, Arrow and file writes take it
+        without copying.
+
+        Args:
+            count: Number of IDs to generate.
+
+        Returns:
+            An array of typecode "Q" holding count unique IDs.
+
+        Raises:
+            ValueError: If count is negative or the layout is wider than 64 bits.
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        from array import array  # noqa: PLC0415
+
+        if self._config.total_bits > 64:
+            raise ValueError("ID arrays support layouts of up to 64 bits")
+
+        ids = array("Q")
+
+        for start, stop in self._reserve(count):
+            if speedups is not None:
+                ids.frombytes(speedups.pack_ids(start, stop - start))
+            else:
+                ids.fromlist(list(range(start, stop)))
+
+        return ids
+
+    def exhaustion_stats(self) -> ExhaustionStats:
+        """Current sequence-exhaustion counters.
+
+        A high exhaustion rate means the layout's ticks are too short or its sequence
+        too narrow for the load, see plan_layout().
+
+        Raises:
+            ValueError: If the generator was created without track_exhaustion.
+        """
+
+        from snowflake_id_toolkit._planning import ExhaustionStats  # noqa: PLC0415
+
+        if not self._tracking:
+            raise ValueError("Exhaustion tracking is not enabled")
+
+        with self._lock:
+            return ExhaustionStats(ticks=self._ticks, exhausted_ticks=self._exhausted_ticks, stall_ns=self._stall_ns)
+
+    def tick_utilization(self, window: int | None = None) -> TickUtilization:
+        """Sequence utilization of the most recent completed ticks.
+
+        Shows how close the generator runs to the sequence ceiling before exhausted
+        ticks make IDs wait. Ticks without IDs are not recorded, and neither is the
+        current tick until the generator moves past it.
+
+        Args:
+            window: Number of most recent completed ticks to cover, or None for all
+                of the last 4096.
+
+        Returns:
+            Percentiles of the IDs per tick as fractions of max_sequence + 1, all
+            zero before the first tick completes.
+
+        Raises:
+            ValueError: If the generator was created without track_exhaustion or
+                window is out of range.
+        """
+
+        from snowflake_id_toolkit._planning import TickUtilization  # noqa: PLC0415
+
+        if not self._tracking:
+            raise ValueError("Exhaustion tracking is not enabled")
+
+        if window is None:
+            window = _UTILIZATION_TICKS
+        elif not 1 <= window <= _UTILIZATION_TICKS:
+            raise ValueError(f"Window must be between 1 and {_UTILIZATION_TICKS}")
+
+        with self._lock:
+            completed = self._ticks - 1
+            tick_ids = self._tick_ids[:]
+
+        count = min(window, max(completed, 0))
+
+        if not count:
+            return TickUtilization(ticks=0, p50=0.0, p99=0.0, max=0.0)
+
+        # The last count completed ticks end just before the next ring position
+        stop = completed % _UTILIZATION_TICKS
+        recent = sorted(tick_ids[(stop - count + index) % _UTILIZATION_TICKS] for index in range(count))
+        capacity = self._config.max_sequence + 1
+
+        def percentile(fraction: float) -> float:
+            return recent[min(count - 1, math.floor(fraction * count))] / capacity
 
-            self._last_generation_timestamp = current_timestamp
+        return TickUtilization(ticks=count, p50=percentile(0.5), p99=percentile(0.99), max=recent[-1] / capacity)
 
-            return self._id_cls(
-                (current_timestamp - self._epoch) << self._config.timestamp_shift
-                | self._node_id << self._config.node_id_shift
-                | self._sequence
+    def health(self) -> GeneratorHealth:
+        """Remaining timestamp range and sequence headroom of the generator.
+
+        Cheap enough to poll from monitoring; generation itself never checks the
+        remaining lifetime. Reports thresholds of watch_lifetime() crossed since
+        the last call.
+
+        Returns:
+            The generator's remaining lifetime and the IDs its current tick has left.
+        """
+
+        from snowflake_id_toolkit._planning import GeneratorHealth  # noqa: PLC0415
+
+        config = self._config
+        current_timestamp = self.get_current_timestamp()
+
+        with self._lock:
+            state = self._state
+
+        if state >> config.sequence_bits >= current_timestamp:
+            sequence_headroom = max(config.max_sequence - (state & config.max_sequence), 0)
+        else:
+            sequence_headroom = config.max_sequence + 1
+
+        remaining_ticks = max(self._max_generation_timestamp + 1 - current_timestamp, 0)
+        health = GeneratorHealth(
+            remaining_ms=remaining_ticks * config.time_step_ms,
+            lifetime_used=min((current_timestamp - self._epoch) / (config.max_timestamp + 1), 1.0),
+            sequence_headroom=sequence_headroom,
+        )
+
+        if self._lifetime_thresholds and health.remaining_ms <= self._lifetime_thresholds[0]:
+            self._report_lifetime(health)
+
+        return health
+
+    def watch_lifetime(
+        self,
+        thresholds: Iterable[timedelta],
+        hook: Callable[[GeneratorHealth], None] | None = None,
+    ) -> None:
+        """Report once each time the remaining lifetime drops below a threshold.
+
+        Thresholds are checked now and on every health() call, so a generator
+        already within one reports right away and monitoring that polls health()
+        learns of an expiring epoch years ahead. Replaces earlier thresholds.
+
+        Args:
+            thresholds: Remaining lifetimes to report at, e.g. a year and a month.
+            hook: Called with the generator's health once per threshold crossed,
+                at most once per health() call (default: emit a LifetimeWarning).
+
+        Raises:
+            ValueError: If a threshold is negative.
+        """
+
+        thresholds_ms = sorted({int(threshold.total_seconds() * 1000) for threshold in thresholds}, reverse=True)
+
+        if thresholds_ms and thresholds_ms[-1] < 0:
+            raise ValueError("Thresholds must not be negative")
+
+        with self._lock:
+            self._lifetime_thresholds = thresholds_ms
+            self._lifetime_hook = hook
+
+        self.health()
+
+    def _report_lifetime(self, health: GeneratorHealth) -> None:
+        """
+        Drop the thresholds the remaining lifetime has crossed and report them with a single call.
+        """
+
+        with self._lock:
+            thresholds = self._lifetime_thresholds
+            crossed = [threshold for threshold in thresholds if health.remaining_ms <= threshold]
+            self._lifetime_thresholds = thresholds[len(crossed) :]
+            hook = self._lifetime_hook
+
+        if not crossed:
+            # Another thread reported them first
+            return
+
+        if hook is not None:
+            hook(health)
+        else:
+            warnings.warn(
+                f"{type(self).__name__} with node ID {self._node_id} runs out of timestamps "
+                f"in {health.remaining_years:.2f} years, move to a later epoch",
+                LifetimeWarning,
+                stacklevel=3,
             )
 
+    def observe(self, id_: int, *, max_skew_ms: int | None = DEFAULT_MAX_SKEW_MS) -> None:
+        """Advance the hybrid clock past an ID received from another node.
+
+        Every ID generated afterwards sorts after the observed one, so IDs order
+        events causally across nodes without synchronized clocks. The observed ID
+        must be of the generator's layout and epoch.
+
+        Args:
+            id_: ID issued by any node, e.g. the version of a received event.
+            max_skew_ms: How far ahead of the local clock the observed ID may be,
+                which bounds how far a node with a wrong clock can drag others along,
+                or None for no bound.
+
+        Raises:
+            ValueError: If the generator was created without hybrid_clock, or the ID
+                does not fit into the layout or is more than max_skew_ms in the future.
+        """
+
+        if not self._hybrid_clock:
+            raise ValueError("Hybrid clock is not enabled")
+
+        self.id_type.validate(id_, max_skew_ms=max_skew_ms)
+        state = self._successor_state(id_)
+
+        with self._lock:
+            self._observed_state = max(self._observed_state, state)
+
+    @property
+    def _sequence(self) -> int:
+        """
+        Sequence number of the last generated ID.
+        """
+
+        return self._state & self._config.max_sequence
+
+    @property
+    def _last_generation_timestamp(self) -> int:
+        """
+        Timestamp of the last generated ID, -1 before the first one.
+        """
+
+        return self._state >> self._config.sequence_bits
+
+    def _reserve(self, count: int) -> list[tuple[int, int]]:
+        """Advance the state past count IDs under a single lock acquisition.
+
+        A wait strategy that releases the lock while sleeping lets other threads
+        generate between the ranges of different ticks.
+
+        Args:
+            count: Number of IDs to reserve.
+
+        Returns:
+            The reserved IDs as ranges of consecutive integers, (start, stop) pairs
+            with stop exclusive, in generation order.
+
+        Raises:
+            ValueError: If count is negative.
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        if count < 0:
+            raise ValueError("Count must not be negative")
+
+        max_sequence = self._config.max_sequence
+        runs: list[tuple[int, int]] = []
+
+        with self._lock:
+            while count:
+                current_timestamp = self.get_current_timestamp()
+
+                if current_timestamp > self._max_generation_timestamp:
+                    raise MaxTimestampHasReachedError
+
+                first = self._advance(current_timestamp)
+                # Take the rest of the tick's sequence space in one step
+                last = min(first | max_sequence, first + count - 1)
+                self._state += last - first
+
+                if self._ordering is not None:
+                    self._ordering.last_id = self._compose(last)
+
+                runs.append((first, last))
+                count -= last - first + 1
+
+        ranges = []
+
+        for first, last in runs:
+            start = self._compose(first)
+            end = (start & max_sequence) + last - first
+
+            if end <= max_sequence:
+                ranges.append((start, start + last - first + 1))
+            else:
+                # A randomized sequence wraps around within the tick
+                base = start & ~max_sequence
+                ranges.append((start, base + max_sequence + 1))
+                ranges.append((base, base + end - max_sequence))
+
+        return ranges
+
+    def _advance(self, current_timestamp: int) -> int:
+        """Advance the packed state past the last generated ID.
+
+        Must be called with _lock held. The critical section is a single integer
+        increment and comparison in the common case, which keeps lock hold times
+        short enough to scale on free-threaded builds.
+
+        Args:
+            current_timestamp: Clock reading taken before acquiring the lock.
+
+        Returns:
+            The new packed state.
+        """
+
+        sequence_bits = self._config.sequence_bits
+        state = self._state + 1
+
+        if state < current_timestamp << sequence_bits:
+            # The clock moved past the last tick, start its sequence over
+            state = current_timestamp << sequence_bits
+        elif state >> sequence_bits != current_timestamp:
+            # Sequence exhausted, clock moved backwards or the reading went stale
+            # while waiting for the lock
+            state = self._advance_slow(state)
+
+        self._state = state
+        return state
+
+    def _advance_hybrid(self, current_timestamp: int) -> int:
+        """Advance the packed state like a hybrid logical clock.
+
+        Replaces _advance() on generators created with hybrid_clock. The new state
+        is the largest of the next one, the clock's tick and the observed bound,
+        so the generator never waits and never rejects a clock that fell behind.
+
+        Raises:
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+        """
+
+        sequence_bits = self._config.sequence_bits
+        state = max(self._state + 1, current_timestamp << sequence_bits, self._observed_state)
+
+        if state >> sequence_bits > self._max_generation_timestamp:
+            raise MaxTimestampHasReachedError
+
+        self._state = state
+        return state
+
+    def _advance_tracking(self, current_timestamp: int) -> int:
+        """Advance the packed state like _advance(), updating the exhaustion counters.
+
+        Replaces _advance() on generators created with track_exhaustion. Returns what
+        the replaced _advance() returns, the ID itself on monotonic generators.
+        """
+
+        previous = self._state
+        max_sequence = self._config.max_sequence
+
+        if previous & max_sequence == max_sequence:
+            # The last tick is used up, so the advance may have to wait for the next one
+            start = time.perf_counter_ns()
+            advanced = self._advance_untracked(current_timestamp)
+            self._stall_ns += time.perf_counter_ns() - start
+        else:
+            advanced = self._advance_untracked(current_timestamp)
+
+        state = self._state
+        sequence_bits = self._config.sequence_bits
+
+        if state >> sequence_bits != previous >> sequence_bits:
+            if previous >= 0:
+                # The ticks counted so far are completed, the previous one included
+                self._tick_ids[(self._ticks - 1) % _UTILIZATION_TICKS] = (
+                    (previous & max_sequence) - self._tick_start + 1
+                )
+
+            self._ticks += 1
+            self._exhausted_ticks += previous & max_sequence == max_sequence
+            # Monotonic and hybrid clock generators may start a tick past sequence 0
+            self._tick_start = state & max_sequence
+
+        return advanced
+
+    def _advance_slow(self, state: int) -> int:
+        """Resolve a state advance the fast path could not.
+
+        Must be called with _lock held.
+
+        Args:
+            state: Candidate state, one past the last generated ID.
+
+        Returns:
+            The new packed state.
+
+        Raises:
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        sequence_bits = self._config.sequence_bits
+        last_timestamp = self._last_generation_timestamp
+        current_timestamp = self.get_current_timestamp()
+
+        if current_timestamp < last_timestamp:
+            raise LastGenerationTimestampIsGreaterError
+
+        if current_timestamp == last_timestamp:
+            if state >> sequence_bits == current_timestamp:
+                # Stale reading, the tick still has sequence numbers left
+                return state
+
+            current_timestamp = self._wait_for_next_timestamp()
+
+            if self._state >> sequence_bits != last_timestamp:
+                # Another thread generated IDs while the wait released the lock
+                return self._advance_slow(max(self._state + 1, current_timestamp << sequence_bits))
+
+        if current_timestamp > self._max_generation_timestamp:
+            raise MaxTimestampHasReachedError
+
+        return current_timestamp << sequence_bits
+
+    def _advance_ordered(self, current_timestamp: int) -> int:
+        """Advance the state past the last ID issued in the process and compose the ID.
+
+        Replaces _advance() on monotonic generators. Must be called with _lock held,
+        which is the lock of the process ordering. Returns the ID rather than the
+        packed state, since the ID may carry another generator's node ID, see
+        _follow(); _compose() passes it through.
+
+        Raises:
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        ordering = self._ordering
+        assert ordering is not None
+        id_ = self._compose_unordered(self._advance_unordered(current_timestamp))
+
+        if id_ <= ordering.last_id:
+            id_ = self._follow(ordering.last_id)
+
+        ordering.last_id = id_
+        return id_
+
+    def _follow(self, last_id: int) -> int:
+        """Issue the smallest ID the generator may after the last ID issued in the process.
+
+        Node IDs sit between timestamp and sequence, so within a tick an ID of a lower
+        node ID cannot follow one of a higher node ID. Instead of waiting for the next
+        tick, the generator continues the last ID's sequence under its node ID, which
+        the process is issuing IDs of in that very tick; the IDs of one tick stay
+        unique since they are issued in increasing order under one lock. Only once
+        that sequence is used up does it move to the next tick, waiting for the clock
+        unless it is a hybrid clock.
+
+        Must be called with _lock held.
+
+        Args:
+            last_id: Last ID issued by the monotonic generators of the process.
+
+        Returns:
+            The ID, its timestamp and sequence recorded as the generator's state.
+
+        Raises:
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        config = self._config
+        sequence_bits = config.sequence_bits
+        timestamp = (last_id >> config.timestamp_shift) + self._epoch
+        node_id = (last_id >> config.node_id_shift) & config.max_node_id
+        sequence = last_id & config.max_sequence
+
+        if node_id < self._node_id:
+            # The generator's own node ID starts a sequence of its own within the tick
+            self._state = timestamp << sequence_bits
+            return self._compose_unordered(self._state)
+
+        if sequence < config.max_sequence:
+            self._state = (timestamp << sequence_bits) + sequence + 1
+            return last_id + 1
+
+        timestamp += 1
+
+        if timestamp > self._max_generation_timestamp:
+            raise MaxTimestampHasReachedError
+
+        if not self._hybrid_clock:
+            current_timestamp = self.get_current_timestamp()
+
+            if current_timestamp < timestamp - 1:
+                raise LastGenerationTimestampIsGreaterError
+
+            # The last ID never runs ahead of the clock, so this waits for at most one tick
+            while current_timestamp < timestamp:
+                current_timestamp = self.get_current_timestamp()
+
+        self._state = timestamp << sequence_bits
+        return self._compose_unordered(self._state)
+
+    def _compose_ordered(self, state: int) -> int:
+        """Pass through an ID composed by _advance_ordered().
+
+        Replaces _compose() on monotonic generators, whose advance yields the ID itself.
+        """
+
+        return state
+
+    def _successor_state(self, id_: int) -> int:
+        """Smallest state whose ID is greater than an ID of the same layout and epoch.
+
+        Node IDs sit between timestamp and sequence, so the successor of an ID of a
+        higher node ID lies in the next tick.
+        """
+
+        config = self._config
+        timestamp = (id_ >> config.timestamp_shift) + self._epoch
+        node_id = (id_ >> config.node_id_shift) & config.max_node_id
+        state = timestamp << config.sequence_bits
+
+        if self._node_id == node_id:
+            state += (id_ & config.max_sequence) + 1
+        elif self._node_id < node_id:
+            state += 1 << config.sequence_bits
+
+        return state
+
+    def _compose(self, state: int) -> int:
+        """
+        Compose the ID of a packed state.
+        """
+
+        config = self._config
+        return (
+            ((state >> config.sequence_bits) << config.timestamp_shift)
+            + (state & config.max_sequence)
+            + self._id_offset
+        )
+
+    def _compose_random(self, state: int) -> int:
+        """Compose the ID of a packed state, its sequence rotated by the tick's offset.
+
+        Replaces _compose() on generators created with random_sequence.
+        """
+
+        config = self._config
+        timestamp = state >> config.sequence_bits
+        cached_timestamp, offset = self._offset_cache
+
+        if cached_timestamp != timestamp:
+            offset = _sequence_offset(timestamp, self._sequence_key or 0, config.sequence_bits)
+            # One tuple, so concurrent composers never see a mismatched pair
+            self._offset_cache = (timestamp, offset)
+
+        return (timestamp << config.timestamp_shift) + ((state + offset) & config.max_sequence) + self._id_offset
+
+    def _bind(self) -> None:
+        """Set up the parts of the generator that belong to this process or its node ID.
+
+        Creates the lock or joins the process ordering, and installs the method
+        overrides and the compiled fast path of the generator's options.
+        """
+
+        # Drop the attributes of an earlier binding
+        for name in _PROCESS_LOCAL_ATTRIBUTES:
+            vars(self).pop(name, None)
+
+        config = self._config
+        self._ordering: ProcessOrdering | None = None
+
+        if self._monotonic:
+            self._ordering = get_process_ordering(config, self._epoch)
+            self._lock = self._ordering.lock
+        else:
+            self._lock = threading.Lock()
+
+        # Generated IDs convert timestamps with the generator's epoch
+        self._id_type = self._id_cls.with_epoch(self._epoch) if self._epoch else self._id_cls
+
+        # Node ID and epoch parts of every ID, added to the shifted timestamp and sequence
+        self._id_offset = (self._node_id << config.node_id_shift) - (self._epoch << config.timestamp_shift)
+
+        if self._sequence_key is not None:
+            self._compose = self._compose_random  # type: ignore[method-assign]
+
+        if self._hybrid_clock:
+            self._advance = self._advance_hybrid  # type: ignore[method-assign]
+
+        if self._monotonic:
+            self._advance_unordered = self._advance
+            self._advance = self._advance_ordered  # type: ignore[method-assign]
+            self._compose_unordered = self._compose
+            self._compose = self._compose_ordered  # type: ignore[method-assign]
+
+        if self._tracking:
+            self._advance_untracked = self._advance
+            self._advance = self._advance_tracking  # type: ignore[method-assign]
+
+        self._fast_path = self._make_fast_path()
+        _generators.add(self)
+
+    def _invalidate(self) -> None:
+        """Make the generator refuse to generate until reassign() is called.
+
+        Replaces the lock as well, since a forked child may inherit it locked.
+        """
+
+        self._lock = threading.Lock()
+        self._fast_path = None
+        self._advance = self._advance_copied  # type: ignore[method-assign]
+
+    def _advance_copied(self, current_timestamp: int) -> int:  # noqa: ARG002
+        """Refuse to advance, replacing _advance() on copied generators.
+
+        Raises:
+            CopiedGeneratorError: Always.
+        """
+
+        raise CopiedGeneratorError
+
+    def _make_fast_path(self) -> object | None:
+        """Collect the constants the compiled generate_next_id works with.
+
+        Returns:
+            The compiled accelerator's view of this generator, or None if it cannot
+            serve it: the accelerator is unavailable, the generator is monotonic,
+            runs a hybrid clock or tracks exhaustion, the layout does not fit into
+            64 bits, or a subclass reads a clock of its own.
+        """
+
+        config = self._config
+
+        if (
+            speedups is None
+            or self._ordering is not None
+            or self._tracking
+            or self._hybrid_clock
+            or config.total_bits > 64
+            or (self._max_generation_timestamp + 1) << config.sequence_bits >= 1 << 62
+        ):
+            return None
+
+        for cls in type(self).__mro__:
+            if cls is SnowflakeIDGenerator:
+                break
+
+            if "get_current_timestamp" in vars(cls):
+                return None
+
+        return speedups.FastPath(  # type: ignore[no-any-return]
+            lock=self._lock,
+            id_cls=self._id_type,
+            sequence_bits=config.sequence_bits,
+            timestamp_shift=config.timestamp_shift,
+            node_part=self._node_id << config.node_id_shift,
+            epoch=self._epoch,
+            max_generation_timestamp=self._max_generation_timestamp,
+            tick_ns=1_000_000 * config.time_step_ms,
+            clock=vars(SnowflakeIDGenerator)["get_current_timestamp"],
+            sequence_key=self._sequence_key,
+        )
+
     def _wait_for_next_timestamp(self) -> int:
         """Wait until the next timestamp becomes available.
 
         This method busy-waits until the current timestamp advances beyond
-        the last generation timestamp. It's extracted as a separate method
-        to facilitate testing.
+        the last generation timestamp, or spins and sleeps as the generator's
+        wait strategy says. It's extracted as a separate method to facilitate
+        testing. Must be called with _lock held, which a wait strategy may
+        release while sleeping.
 
         Returns:
             The next timestamp that is greater than last_timestamp.
         """
+        last_timestamp = self._last_generation_timestamp
         current_timestamp = self.get_current_timestamp()
-        while current_timestamp == self._last_generation_timestamp:
+
+        if self._wait_strategy is not None and current_timestamp == last_timestamp:
+            current_timestamp = self._spin_then_sleep(last_timestamp, self._wait_strategy)
+
+        while current_timestamp == last_timestamp:
             current_timestamp = self.get_current_timestamp()
         return current_timestamp
 
+    def _spin_then_sleep(self, last_timestamp: int, strategy: WaitStrategy) -> int:
+        """Busy-wait for the strategy's spin time, then sleep until the tick after last_timestamp.
+
+        Sleeps are computed from the wall clock. A subclass clock that lags behind it
+        gets further sleeps of at most one tick each.
+
+        Returns:
+            The last clock reading, greater than last_timestamp unless the clock
+            needs a final busy-wait.
+        """
+
+        tick_ns = 1_000_000 * self._config.time_step_ms
+        spin_deadline = time.perf_counter_ns() + strategy.spin_ns
+        current_timestamp = self.get_current_timestamp()
+
+        while current_timestamp == last_timestamp and time.perf_counter_ns() < spin_deadline:
+            current_timestamp = self.get_current_timestamp()
+
+        while current_timestamp == last_timestamp:
+            remaining_ns = (last_timestamp + 1) * tick_ns - time.time_ns()
+            delay = min(max(remaining_ns, 0), tick_ns) / 1e9
+
+            if strategy.release_lock:
+                self._lock.release()
+
+                try:
+                    time.sleep(delay)
+                finally:
+                    self._lock.acquire()
+            else:
+                time.sleep(delay)
+
+            current_timestamp = self.get_current_timestamp()
+
+        return current_timestamp
+
     @classmethod
     def get_current_timestamp(cls) -> int:
         """Get the current timestamp in the appropriate units for this generator.
@@ -138,3 +1086,41 @@ class SnowflakeIDGenerator(Generic[TID]):
         """
 
         return time.time_ns() // (1_000_000 * cls._config.time_step_ms)
+
+
+def _sequence_offset(timestamp: int, key: int, sequence_bits: int) -> int:
+    """Sequence offset of a tick: the top bits of a splitmix64 mix of the keyed timestamp.
+
+    Sequences wider than 64 bits take their higher bits from mixes with successive
+    keys. Mirrored by sequence_offset() in _speedups.c for sequences of up to 62 bits.
+    """
+
+    if sequence_bits > 64:
+        high = _sequence_offset(timestamp, (key + 1) & _MASK_64, sequence_bits - 64)
+        return high << 64 | _sequence_offset(timestamp, key, 64)
+
+    z = ((timestamp ^ key) + 0x9E3779B97F4A7C15) & _MASK_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return (z ^ (z >> 31)) >> (64 - sequence_bits)
+
+
+# Every generator of the process, invalidated in forked children
+_generators: weakref.WeakSet[SnowflakeIDGenerator[Any]] = weakref.WeakSet()
+
+
+def _invalidate_after_fork() -> None:
+    """
+    Invalidate the generators a forked child inherited, they share node IDs and state with the parent's.
+    """
+
+    for generator in list(_generators):
+        generator._invalidate()  # noqa: SLF001
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_invalidate_after_fork)
+
+if speedups is not None:
+    SnowflakeIDGenerator.generate_next_id = speedups.generate_next_id  # type: ignore[method-assign]
+    SnowflakeIDGenerator.generate_next_raw_id = speedups.generate_next_raw_id  # type: ignore[method-assign]
@@ -1,37 +1,307 @@
-from base64 import (
-    b16decode,
-    b16encode,
-    b32decode,
-    b32encode,
-    b64decode,
-    b64encode,
-    b85decode,
-    b85encode,
-    urlsafe_b64decode,
-    urlsafe_b64encode,
-)
-
-from typing_extensions import Self
+from __future__ import annotations
+
+import time
 
 from snowflake_id_toolkit._config import SnowflakeIDConfig
 
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from datetime import datetime, tzinfo
+    from functools import _CacheInfo
+    from types import ModuleType
+
+    from typing_extensions import Self
+
+# String codecs module, imported on first use. Held in a global, since an import
+# statement in every codec method would cost more than the encoding itself.
+_codecs: ModuleType | None = None
+
+# How far in the future validated IDs may be by default, in milliseconds
+DEFAULT_MAX_SKEW_MS = 1000
+
+# Epoch-bound subclasses created by SnowflakeID.with_epoch(), by unbound class and epoch
+_bound_classes: dict[tuple[type[SnowflakeID], int], type[SnowflakeID]] = {}
+
 
 class SnowflakeID(int):
     """Base class for snowflake-like ID.
 
     Uses a configuration instance to define bit layout and time resolution.
     Subclasses must set _config to a SnowflakeIDConfig instance.
+
+    The epoch timestamps are decoded against defaults to 0 (Unix epoch);
+    with_epoch() derives a subclass bound to a custom one.
     """
 
     _config: SnowflakeIDConfig
 
-    def timestamp_ms(self, epoch: int = 0) -> int:
+    _epoch = 0
+
+    # Set in the class namespace by enable_parse_cache(), never inherited
+    _parse_cache: Callable[[str, bytes, bool], SnowflakeID]
+
+    @classmethod
+    def with_epoch(cls, epoch: int) -> type[Self]:
+        """Get a subclass bound to a custom epoch.
+
+        Timestamp and datetime conversions of the subclass use the epoch unless
+        one is passed explicitly. Subclasses are cached, so repeated calls return
+        the same class.
+
+        Args:
+            epoch: Custom epoch in generator-specific time units.
+
+        Returns:
+            A subclass of the unbound ID class with the epoch attached.
+
+        Raises:
+            ValueError: If epoch is negative.
+        """
+
+        if epoch < 0:
+            raise ValueError("Epoch must not be negative")
+
+        base = cls.__dict__.get("_unbound", cls)
+
+        try:
+            return _bound_classes[base, epoch]  # type: ignore[return-value]
+        except KeyError:
+            bound = _bound_classes[base, epoch] = type(
+                base.__name__,
+                (base,),
+                {
+                    "__module__": base.__module__,
+                    "__qualname__": base.__qualname__,
+                    "__reduce__": _reduce_bound,
+                    "_epoch": epoch,
+                    "_unbound": base,
+                },
+            )
+            return bound
+
+    def timestamp_ms(self, epoch: int | None = None) -> int:
         """
         Extract timestamp in milliseconds since Unix epoch.
+
+        The class epoch is used unless epoch is given.
         """
 
+        if epoch is None:
+            epoch = self._epoch
+
         return ((self >> self._config.timestamp_shift) + epoch) * self._config.time_step_ms
 
+    def to_datetime(self, tz: tzinfo | None = None, *, epoch: int | None = None) -> datetime:
+        """Convert the ID's timestamp to an aware datetime.
+
+        Args:
+            tz: Time zone of the result (default: UTC).
+            epoch: Custom epoch (default: the class epoch).
+
+        Returns:
+            The datetime the ID was generated at, truncated to the layout's time resolution.
+        """
+
+        from datetime import datetime, timedelta, timezone  # noqa: PLC0415
+
+        moment = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(milliseconds=self.timestamp_ms(epoch))
+        return moment if tz is None or tz is timezone.utc else moment.astimezone(tz)
+
+    @classmethod
+    def to_datetimes(
+        cls,
+        ids: Iterable[int],
+        tz: tzinfo | None = None,
+        *,
+        epoch: int | None = None,
+    ) -> list[datetime]:
+        """Convert the timestamps of many IDs to aware datetimes.
+
+        Each tick is converted once: IDs sharing a tick share one datetime
+        object, so batches of IDs generated close together convert at the cost
+        of a shift and a dictionary lookup per ID.
+
+        Args:
+            ids: IDs of this layout, plain integers or instances.
+            tz: Time zone of the results (default: UTC).
+            epoch: Custom epoch (default: the class epoch).
+
+        Returns:
+            One datetime per ID, in input order.
+        """
+
+        from datetime import datetime, timedelta, timezone  # noqa: PLC0415
+
+        if epoch is None:
+            epoch = cls._epoch
+
+        unix_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        timestamp_shift = cls._config.timestamp_shift
+        time_step_ms = cls._config.time_step_ms
+        convert = tz is not None and tz is not timezone.utc
+        cache: dict[int, datetime] = {}
+        datetimes: list[datetime] = []
+
+        for id_ in ids:
+            tick = id_ >> timestamp_shift
+
+            try:
+                moment = cache[tick]
+            except KeyError:
+                moment = unix_epoch + timedelta(milliseconds=(tick + epoch) * time_step_ms)
+                moment = cache[tick] = moment.astimezone(tz) if convert else moment
+
+            datetimes.append(moment)
+
+        return datetimes
+
+    @classmethod
+    def from_datetime(
+        cls,
+        moment: datetime,
+        node_id: int = 0,
+        sequence: int = 0,
+        *,
+        epoch: int | None = None,
+    ) -> Self:
+        """Build the ID of a moment, e.g. as a bound for range queries over IDs.
+
+        The moment is truncated to the layout's time resolution. With the default
+        node ID and sequence the result is the smallest ID of its tick.
+
+        Args:
+            moment: Timezone-aware datetime.
+            node_id: Node ID component.
+            sequence: Sequence component.
+            epoch: Custom epoch (default: the class epoch).
+
+        Returns:
+            An ID of the moment's tick with the given components.
+
+        Raises:
+            ValueError: If moment is naive, or a component is out of valid range.
+        """
+
+        from datetime import datetime, timedelta, timezone  # noqa: PLC0415
+
+        config = cls._config
+
+        if epoch is None:
+            epoch = cls._epoch
+
+        if moment.utcoffset() is None:
+            raise ValueError("Datetime must be timezone-aware")
+
+        unix_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        timestamp = (moment - unix_epoch) // timedelta(milliseconds=config.time_step_ms) - epoch
+
+        if not 0 <= timestamp <= config.max_timestamp:
+            raise ValueError("Datetime must be between the epoch and the layout's max timestamp")
+
+        if not 0 <= node_id <= config.max_node_id:
+            raise ValueError(f"Node ID must be between 0 and {config.max_node_id}")
+
+        if not 0 <= sequence <= config.max_sequence:
+            raise ValueError(f"Sequence must be between 0 and {config.max_sequence}")
+
+        return cls((timestamp << config.timestamp_shift) | (node_id << config.node_id_shift) | sequence)
+
+    @classmethod
+    def max_valid_id(cls, *, max_skew_ms: int | None = DEFAULT_MAX_SKEW_MS, epoch: int | None = None) -> int:
+        """Largest integer that is a plausible ID of this layout right now.
+
+        Node ID and sequence bits sit below the timestamp, so the IDs whose timestamp
+        is at most max_skew_ms in the future are exactly the integers from 0 to this
+        bound, and checking an ID takes one chained comparison. Integers outside are
+        negative, set bits above the layout (such as the sign bit of 63-bit layouts)
+        or carry a timestamp too far ahead of the clock. The bound also serves
+        vectorized checks, e.g. over NumPy or Arrow arrays.
+
+        Args:
+            max_skew_ms: How far in the future timestamps may be, in milliseconds,
+                or None to accept any timestamp the layout can represent.
+            epoch: Custom epoch (default: the class epoch).
+
+        Returns:
+            The bound, -1 if even the epoch lies beyond the skew bound.
+
+        Raises:
+            ValueError: If max_skew_ms is negative.
+        """
+
+        config = cls._config
+
+        if epoch is None:
+            epoch = cls._epoch
+
+        max_tick = config.max_timestamp
+
+        if max_skew_ms is not None:
+            if max_skew_ms < 0:
+                raise ValueError("Max skew must not be negative")
+
+            now_ms = time.time_ns() // 1_000_000
+            max_tick = max(-1, min(max_tick, (now_ms + max_skew_ms) // config.time_step_ms - epoch))
+
+        return ((max_tick + 1) << config.timestamp_shift) - 1
+
+    @classmethod
+    def validate(cls, value: int, *, max_skew_ms: int | None = DEFAULT_MAX_SKEW_MS, epoch: int | None = None) -> Self:
+        """Check an untrusted integer against the layout and the clock.
+
+        Args:
+            value: Integer to check.
+            max_skew_ms: How far in the future the timestamp may be, see max_valid_id().
+            epoch: Custom epoch (default: the class epoch).
+
+        Returns:
+            The integer as an ID of this class.
+
+        Raises:
+            ValueError: If the integer does not fit into the layout, or its timestamp
+                is more than max_skew_ms in the future.
+        """
+
+        config = cls._config
+
+        if not 0 <= value < 1 << (config.timestamp_bits + config.timestamp_shift):
+            raise ValueError("ID must fit into the layout's timestamp, node ID and sequence bits")
+
+        if value > cls.max_valid_id(max_skew_ms=max_skew_ms, epoch=epoch):
+            raise ValueError(f"ID timestamp must not be more than {max_skew_ms} ms in the future")
+
+        return cls(value)
+
+    @classmethod
+    def validate_ids(
+        cls,
+        ids: Iterable[int],
+        *,
+        max_skew_ms: int | None = DEFAULT_MAX_SKEW_MS,
+        epoch: int | None = None,
+    ) -> list[bool]:
+        """Check a batch of untrusted integers in one pass.
+
+        The clock is read once for the whole batch, and each ID costs one
+        chained comparison against max_valid_id().
+
+        Args:
+            ids: Integers to check.
+            max_skew_ms: How far in the future timestamps may be, see max_valid_id().
+            epoch: Custom epoch (default: the class epoch).
+
+        Returns:
+            One flag per integer, in input order, True for plausible IDs.
+
+        Raises:
+            ValueError: If max_skew_ms is negative.
+        """
+
+        max_id = cls.max_valid_id(max_skew_ms=max_skew_ms, epoch=epoch)
+        return [0 <= id_ <= max_id for id_ in ids]
+
     def node_id(self) -> int:
         """
         Extract node ID component from ID.
@@ -48,17 +318,28 @@ class SnowflakeID(int):
 
     def as_bytes(self) -> bytes:
         """
-        Convert ID to 8-byte representation.
+        Convert ID to big-endian bytes, config.byte_length wide (8 bytes for 64-bit layouts).
         """
 
-        return self.to_bytes(8, "big", signed=False)
+        return self.to_bytes(self._config.byte_length, "big", signed=False)
 
     @classmethod
-    def parse_bytes(cls, data: bytes) -> Self:
+    def parse_bytes(cls, data: bytes, *, strict: bool = False) -> Self:
         """
-        Parse ID from 8-byte representation.
+        Parse ID from big-endian bytes, config.byte_length wide (8 bytes for 64-bit layouts).
+
+        With strict, the ID is also checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If data length does not match the layout width, or strict checks fail.
         """
 
+        if len(data) != cls._config.byte_length:
+            raise ValueError(f"ID must be exactly {cls._config.byte_length} bytes long")
+
+        if strict:
+            return cls.validate(int.from_bytes(data, "big", signed=False))
+
         return cls.from_bytes(data, "big", signed=False)
 
     def as_base16(self) -> bytes:
@@ -66,72 +347,331 @@ class SnowflakeID(int):
         Encode ID as base16 (hexadecimal).
         """
 
+        from base64 import b16encode  # noqa: PLC0415
+
         return b16encode(self.as_bytes())
 
     @classmethod
-    def parse_base16(cls, data: bytes) -> Self:
+    def parse_base16(cls, data: bytes, *, strict: bool = False) -> Self:
         """
         Parse ID from base16 (hexadecimal).
+
+        With strict, the ID is also checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If data is not base16 of config.byte_length bytes, or strict checks fail.
         """
 
-        return cls.parse_bytes(b16decode(data))
+        cache: Callable[[str, bytes, bool], Self] | None = cls.__dict__.get("_parse_cache")
+
+        if cache is not None and isinstance(data, (bytes, str)):
+            return cache("b16", data, strict)
+
+        return cls.parse_bytes(_decode("b16", data, strict=strict), strict=strict)
 
     def as_base32(self) -> bytes:
         """
         Encode ID as base32.
         """
 
+        from base64 import b32encode  # noqa: PLC0415
+
         return b32encode(self.as_bytes())
 
     @classmethod
-    def parse_base32(cls, data: bytes) -> Self:
+    def parse_base32(cls, data: bytes, *, strict: bool = False) -> Self:
         """
         Parse ID from base32.
+
+        With strict, the ID is also checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If data is not base32 of config.byte_length bytes, or strict checks fail.
         """
 
-        return cls.parse_bytes(b32decode(data))
+        cache: Callable[[str, bytes, bool], Self] | None = cls.__dict__.get("_parse_cache")
+
+        if cache is not None and isinstance(data, (bytes, str)):
+            return cache("b32", data, strict)
+
+        return cls.parse_bytes(_decode("b32", data, strict=strict), strict=strict)
 
     def as_base64(self) -> bytes:
         """
         Encode ID as base64.
         """
 
+        from base64 import b64encode  # noqa: PLC0415
+
         return b64encode(self.as_bytes())
 
     @classmethod
-    def parse_base64(cls, data: bytes) -> Self:
+    def parse_base64(cls, data: bytes, *, strict: bool = False) -> Self:
         """
         Parse ID from base64.
+
+        With strict, characters outside the base64 alphabet are rejected instead of
+        skipped, and the ID is checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If data is not base64 of config.byte_length bytes, or strict checks fail.
         """
 
-        return cls.parse_bytes(b64decode(data))
+        cache: Callable[[str, bytes, bool], Self] | None = cls.__dict__.get("_parse_cache")
+
+        if cache is not None and isinstance(data, (bytes, str)):
+            return cache("b64", data, strict)
+
+        return cls.parse_bytes(_decode("b64", data, strict=strict), strict=strict)
 
     def as_base64_urlsafe(self) -> bytes:
         """
         Encode ID as URL-safe base64.
         """
 
+        from base64 import urlsafe_b64encode  # noqa: PLC0415
+
         return urlsafe_b64encode(self.as_bytes())
 
     @classmethod
-    def parse_base64_urlsafe(cls, data: bytes) -> Self:
+    def parse_base64_urlsafe(cls, data: bytes, *, strict: bool = False) -> Self:
         """
         Parse ID from URL-safe base64.
+
+        With strict, characters outside the URL-safe base64 alphabet are rejected instead
+        of skipped, and the ID is checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If data is not URL-safe base64 of config.byte_length bytes, or strict checks fail.
         """
 
-        return cls.parse_bytes(urlsafe_b64decode(data))
+        cache: Callable[[str, bytes, bool], Self] | None = cls.__dict__.get("_parse_cache")
+
+        if cache is not None and isinstance(data, (bytes, str)):
+            return cache("urlsafe_b64", data, strict)
+
+        return cls.parse_bytes(_decode("urlsafe_b64", data, strict=strict), strict=strict)
 
     def as_base85(self) -> bytes:
         """
         Encode ID as base85.
         """
 
+        from base64 import b85encode  # noqa: PLC0415
+
         return b85encode(self.as_bytes())
 
     @classmethod
-    def parse_base85(cls, data: bytes) -> Self:
+    def parse_base85(cls, data: bytes, *, strict: bool = False) -> Self:
         """
         Parse ID from base85.
+
+        With strict, the ID is also checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If data is not base85 of config.byte_length bytes, or strict checks fail.
         """
 
-        return cls.parse_bytes(b85decode(data))
+        cache: Callable[[str, bytes, bool], Self] | None = cls.__dict__.get("_parse_cache")
+
+        if cache is not None and isinstance(data, (bytes, str)):
+            return cache("b85", data, strict)
+
+        return cls.parse_bytes(_decode("b85", data, strict=strict), strict=strict)
+
+    def as_base16_str(self) -> str:
+        """
+        Encode ID as upper-case base16 (hexadecimal) text, without a bytes round trip.
+        """
+
+        text: str = (_codecs or _import_codecs()).encode_base16(self, self._config.byte_length)
+        return text
+
+    @classmethod
+    def parse_base16_str(cls, text: str, *, strict: bool = False) -> Self:
+        """
+        Parse ID from base16 (hexadecimal) text of either case.
+
+        With strict, the ID is also checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If text is not base16 of config.byte_length bytes, or strict checks fail.
+        """
+
+        value = (_codecs or _import_codecs()).parse_base16(text, cls._config.byte_length)
+        return cls.validate(value) if strict else cls(value)
+
+    def as_base32_str(self, *, padding: bool = True) -> str:
+        """
+        Encode ID as base32 text, the same characters as as_base32(), optionally without "=" padding.
+        """
+
+        text: str = (_codecs or _import_codecs()).encode_base32(self, self._config.byte_length, padding)
+        return text
+
+    @classmethod
+    def parse_base32_str(cls, text: str, *, strict: bool = False) -> Self:
+        """
+        Parse ID from upper-case base32 text, with or without "=" padding.
+
+        With strict, the ID is also checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If text is not base32 of config.byte_length bytes, or strict checks fail.
+        """
+
+        value = (_codecs or _import_codecs()).parse_base32(text, cls._config.byte_length)
+        return cls.validate(value) if strict else cls(value)
+
+    def as_base64_urlsafe_str(self, *, padding: bool = True) -> str:
+        """
+        Encode ID as URL-safe base64 text, optionally without "=" padding.
+        """
+
+        text: str = (_codecs or _import_codecs()).encode_base64_urlsafe(self, self._config.byte_length, padding)
+        return text
+
+    @classmethod
+    def parse_base64_urlsafe_str(cls, text: str, *, strict: bool = False) -> Self:
+        """
+        Parse ID from URL-safe base64 text, with or without "=" padding.
+
+        With strict, the ID is also checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If text is not URL-safe base64 of config.byte_length bytes, or strict checks fail.
+        """
+
+        value = (_codecs or _import_codecs()).parse_base64_urlsafe(text, cls._config.byte_length)
+        return cls.validate(value) if strict else cls(value)
+
+    def as_base62_str(self, *, padding: bool = True) -> str:
+        """
+        Encode ID as base62 text (0-9, A-Z, a-z).
+
+        Padded to the width of the layout's largest ID with leading zeros, so IDs
+        of one layout sort as text like they do as integers. Without padding,
+        leading zeros are dropped.
+        """
+
+        text: str = (_codecs or _import_codecs()).encode_base62(self, self._config.byte_length, padding)
+        return text
+
+    @classmethod
+    def parse_base62_str(cls, text: str, *, strict: bool = False) -> Self:
+        """
+        Parse ID from base62 text, zero-padded or not.
+
+        With strict, the ID is also checked against the layout and the clock, see validate().
+
+        Raises:
+            ValueError: If text is not base62, its value does not fit into config.byte_length bytes,
+                or strict checks fail.
+        """
+
+        value = (_codecs or _import_codecs()).parse_base62(text, cls._config.byte_length)
+        return cls.validate(value) if strict else cls(value)
+
+    @classmethod
+    def enable_parse_cache(cls, maxsize: int = 4096) -> None:
+        """Cache the IDs this class parses from text.
+
+        Repeated calls of parse_base16(), parse_base32(), parse_base64(),
+        parse_base64_urlsafe() and parse_base85() with the same data return the
+        cached instance without decoding again. Least recently used entries are
+        evicted once maxsize IDs are cached. The cache belongs to this class alone,
+        subclasses including epoch-bound ones parse without it. Enabling it again
+        starts over with an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached IDs.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+
+        from functools import lru_cache  # noqa: PLC0415
+
+        if maxsize <= 0:
+            raise ValueError("Max size must be positive")
+
+        def parse(codec: str, data: bytes, strict: bool) -> SnowflakeID:
+            return cls.parse_bytes(_decode(codec, data, strict=strict), strict=strict)
+
+        cls._parse_cache = lru_cache(maxsize)(parse)
+
+    @classmethod
+    def disable_parse_cache(cls) -> None:
+        """
+        Drop the parse cache of this class, see enable_parse_cache().
+        """
+
+        if "_parse_cache" in cls.__dict__:
+            del cls._parse_cache
+
+    @classmethod
+    def parse_cache_info(cls) -> _CacheInfo:
+        """Hit and miss counters of the parse cache of this class.
+
+        Returns:
+            Hits, misses, maxsize and current size, like functools.lru_cache's cache_info().
+
+        Raises:
+            ValueError: If the parse cache is not enabled on this class.
+        """
+
+        cache = cls.__dict__.get("_parse_cache")
+
+        if cache is None:
+            raise ValueError("Parse cache is not enabled")
+
+        return cache.cache_info()  # type: ignore[no-any-return]
+
+
+def _import_codecs() -> ModuleType:
+    """
+    Import the string codecs module and keep it for later calls.
+    """
+
+    global _codecs  # noqa: PLW0603
+
+    from snowflake_id_toolkit import _codecs as codecs  # noqa: PLC0415
+
+    _codecs = codecs
+    return codecs
+
+
+def _decode(codec: str, data: bytes, *, strict: bool = False) -> bytes:
+    """
+    Decode text of a base64 module codec, e.g. "b32" or "urlsafe_b64", into the bytes of an ID.
+
+    With strict, base64 text with characters outside its alphabet is rejected; the
+    other codecs reject those anyway.
+    """
+
+    import base64  # noqa: PLC0415
+
+    if strict and codec == "b64":
+        return base64.b64decode(data, validate=True)
+
+    if strict and codec == "urlsafe_b64":
+        return base64.b64decode(data, altchars=b"-_", validate=True)
+
+    decoded: bytes = getattr(base64, f"{codec}decode")(data)
+    return decoded
+
+
+def _reduce_bound(self: SnowflakeID) -> tuple[object, ...]:
+    """
+    Pickle an ID of an epoch-bound class by its unbound class and epoch.
+    """
+
+    return _restore_bound, (type(self).__dict__["_unbound"], self._epoch, int(self))
+
+
+def _restore_bound(cls: type[SnowflakeID], epoch: int, value: int) -> SnowflakeID:
+    """
+    Unpickle an ID of an epoch-bound class.
+    """
+
+    return cls.with_epoch(epoch)(value)
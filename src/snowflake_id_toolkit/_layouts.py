@@ -0,0 +1,19 @@
+"""
+Built-in layouts by name, as chosen on the command line of the snowflake-id command and the ID server.
+"""
+
+from typing import Any
+
+from snowflake_id_toolkit._config import SnowflakeIDConfig
+from snowflake_id_toolkit._generator import SnowflakeIDGenerator
+from snowflake_id_toolkit.instagram import INSTAGRAM_SNOWFLAKE_CONFIG, InstagramSnowflakeIDGenerator
+from snowflake_id_toolkit.sony import SONYFLAKE_CONFIG, SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TWITTER_SNOWFLAKE_CONFIG, TwitterSnowflakeIDGenerator
+from snowflake_id_toolkit.wide import WIDE_SNOWFLAKE_CONFIG, WideSnowflakeIDGenerator
+
+LAYOUTS: dict[str, tuple[type[SnowflakeIDGenerator[Any]], SnowflakeIDConfig]] = {
+    "twitter": (TwitterSnowflakeIDGenerator, TWITTER_SNOWFLAKE_CONFIG),
+    "instagram": (InstagramSnowflakeIDGenerator, INSTAGRAM_SNOWFLAKE_CONFIG),
+    "sonyflake": (SonyflakeIDGenerator, SONYFLAKE_CONFIG),
+    "wide": (WideSnowflakeIDGenerator, WIDE_SNOWFLAKE_CONFIG),
+}
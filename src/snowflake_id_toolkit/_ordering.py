@@ -0,0 +1,61 @@
+import os
+import threading
+
+from snowflake_id_toolkit._config import SnowflakeIDConfig
+
+
+class ProcessOrdering:
+    """Last ID issued by the monotonic generators of one layout and epoch in the process.
+
+    Monotonic generators sharing an ordering also share its lock, so every ID they
+    issue is compared against, and recorded as, the last one under that lock.
+
+    Attributes:
+        lock: Lock of every generator sharing the ordering.
+        last_id: Last ID issued by any of them, -1 before the first one.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.last_id = -1
+
+
+_orderings: dict[tuple[SnowflakeIDConfig, int], ProcessOrdering] = {}
+_orderings_lock = threading.Lock()
+
+
+def get_process_ordering(config: SnowflakeIDConfig, epoch: int) -> ProcessOrdering:
+    """Get the ordering shared by monotonic generators of a layout and epoch.
+
+    IDs of different epochs do not compare meaningfully, so each epoch gets
+    an ordering of its own.
+
+    Args:
+        config: Bit layout of the generator.
+        epoch: Custom epoch of the generator.
+
+    Returns:
+        The process-wide ordering, created on first use.
+    """
+
+    with _orderings_lock:
+        try:
+            return _orderings[config, epoch]
+        except KeyError:
+            ordering = _orderings[config, epoch] = ProcessOrdering()
+            return ordering
+
+
+def _reset_after_fork() -> None:
+    """
+    Start a forked child with no orderings, the parent's lock may have been held while forking.
+    """
+
+    global _orderings_lock  # noqa: PLW0603
+
+    _orderings.clear()
+    _orderings_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from snowflake_id_toolkit._config import SnowflakeIDConfig
+
+# Average Gregorian year
+_MS_PER_YEAR = 365.2425 * 24 * 60 * 60 * 1000
+
+# Time steps plan_layout() considers, finest first
+_TIME_STEPS_MS = (1, 2, 5, 10, 20, 50, 100, 1000)
+
+
+@dataclass(frozen=True)
+class ExhaustionStats:
+    """Snapshot of a generator's sequence-exhaustion counters.
+
+    Attributes:
+        ticks: Number of ticks the generator issued IDs in.
+        exhausted_ticks: Number of those ticks whose sequence numbers were all used.
+        stall_ns: Time spent advancing past exhausted ticks, in nanoseconds.
+    """
+
+    ticks: int
+    exhausted_ticks: int
+    stall_ns: int
+
+    @property
+    def exhaustion_rate(self) -> float:
+        """
+        Fraction of ticks that ran out of sequence numbers.
+        """
+
+        return self.exhausted_ticks / self.ticks if self.ticks else 0.0
+
+
+@dataclass(frozen=True)
+class TickUtilization:
+    """Sequence utilization of a generator's recent ticks.
+
+    Utilizations are fractions of the max_sequence + 1 IDs a tick holds, so 1.0
+    means a tick used up its sequence numbers and the next ID had to wait.
+
+    Attributes:
+        ticks: Number of completed ticks in the window.
+        p50: Median utilization.
+        p99: 99th percentile utilization.
+        max: Highest utilization.
+    """
+
+    ticks: int
+    p50: float
+    p99: float
+    max: float
+
+
+@dataclass(frozen=True)
+class GeneratorHealth:
+    """Snapshot of how much timestamp range and sequence space a generator has left.
+
+    Attributes:
+        remaining_ms: Time until the generator's timestamps run out for its epoch
+            and raise MaxTimestampHasReachedError, in milliseconds.
+        lifetime_used: Fraction of the timestamp range elapsed since the epoch.
+        sequence_headroom: Number of IDs the current tick can still issue.
+    """
+
+    remaining_ms: int
+    lifetime_used: float
+    sequence_headroom: int
+
+    @property
+    def remaining_years(self) -> float:
+        """
+        Time until the generator's timestamps run out, in average Gregorian years.
+        """
+
+        return self.remaining_ms / _MS_PER_YEAR
+
+
+@dataclass(frozen=True)
+class LayoutPlan:
+    """Layout recommended by plan_layout().
+
+    Attributes:
+        config: Recommended bit layout and time resolution.
+        lifespan_years: Years of timestamps the layout covers from its epoch.
+        ids_per_second: Sustained IDs per second per node the layout can issue.
+        nodes: Number of node IDs the layout can address.
+    """
+
+    config: SnowflakeIDConfig
+    lifespan_years: float
+    ids_per_second: int
+    nodes: int
+
+
+@dataclass(frozen=True)
+class StallReport:
+    """Result of replaying a load profile with simulate_stalls().
+
+    Attributes:
+        ids: Number of IDs requested.
+        stalled_ids: Number of IDs that waited for a later tick.
+        exhausted_ticks: Number of ticks that ran out of sequence numbers for a request.
+        total_stall_ms: Sum of waits over all IDs, in milliseconds.
+        max_stall_ms: Longest single wait, in milliseconds.
+    """
+
+    ids: int
+    stalled_ids: int
+    exhausted_ticks: int
+    total_stall_ms: float
+    max_stall_ms: float
+
+
+def plan_layout(
+    ids_per_second: int,
+    nodes: int,
+    lifespan_years: float,
+    *,
+    total_bits: int = 64,
+    headroom: float = 2.0,
+) -> LayoutPlan:
+    """Recommend a bit layout for a deployment.
+
+    Picks the finest time step whose ticks still hold headroom times the target
+    rate, with node ID bits for every node and timestamp bits for the lifespan.
+    Bits left over go to the sequence, raising burst capacity. The top bit stays
+    unused, so IDs fit signed integer columns.
+
+    Args:
+        ids_per_second: Target sustained IDs per second per node.
+        nodes: Number of nodes generating IDs concurrently.
+        lifespan_years: Years the layout must cover from its epoch.
+        total_bits: Width of the encoded ID in bits, a multiple of 8.
+        headroom: Factor of burst capacity over the target rate.
+
+    Returns:
+        The recommended layout with its capacities.
+
+    Raises:
+        ValueError: If a parameter is out of valid range or no layout fits into total_bits.
+    """
+
+    if ids_per_second <= 0:
+        raise ValueError("IDs per second must be positive")
+
+    if nodes <= 0:
+        raise ValueError("Nodes must be positive")
+
+    if lifespan_years <= 0:
+        raise ValueError("Lifespan must be positive")
+
+    if headroom < 1:
+        raise ValueError("Headroom must be at least 1")
+
+    if total_bits <= 0 or total_bits % 8:
+        raise ValueError("Total bits must be a positive multiple of 8")
+
+    node_id_bits = (nodes - 1).bit_length()
+    available_bits = total_bits - 1 - node_id_bits
+
+    for time_step_ms in _TIME_STEPS_MS:
+        timestamp_bits = math.ceil(lifespan_years * _MS_PER_YEAR / time_step_ms).bit_length()
+        sequence_bits = (math.ceil(ids_per_second * headroom * time_step_ms / 1000) - 1).bit_length()
+
+        if timestamp_bits + sequence_bits <= available_bits:
+            sequence_bits = available_bits - timestamp_bits
+            config = SnowflakeIDConfig(timestamp_bits, node_id_bits, sequence_bits, time_step_ms, total_bits)
+            return LayoutPlan(
+                config=config,
+                lifespan_years=(config.max_timestamp + 1) * time_step_ms / _MS_PER_YEAR,
+                ids_per_second=(config.max_sequence + 1) * 1000 // time_step_ms,
+                nodes=config.max_node_id + 1,
+            )
+
+    raise ValueError(f"No layout of {total_bits} bits covers {lifespan_years} years at {ids_per_second} IDs per second")
+
+
+def simulate_stalls(config: SnowflakeIDConfig, arrivals_ms: Iterable[float]) -> StallReport:
+    """Replay ID requests of one node against a layout's sequence space.
+
+    Models the generator without lock contention: a request takes the next sequence
+    number of the tick it arrives in, or of the generator's current tick if earlier
+    requests exhausted their own and pushed it ahead. Requests served in a tick that
+    has not started yet wait for it.
+
+    Args:
+        config: Bit layout and time resolution to simulate.
+        arrivals_ms: Request arrival times in milliseconds, in non-decreasing order.
+
+    Returns:
+        Stall counters of the replay.
+
+    Raises:
+        ValueError: If arrival times decrease.
+    """
+
+    time_step_ms = config.time_step_ms
+    max_sequence = config.max_sequence
+    tick = -math.inf
+    sequence = max_sequence
+    previous = -math.inf
+    ids = stalled_ids = exhausted_ticks = 0
+    total_stall_ms = max_stall_ms = 0.0
+
+    for arrival in arrivals_ms:
+        if arrival < previous:
+            raise ValueError("Arrival times must not decrease")
+
+        previous = arrival
+        arrival_tick = arrival // time_step_ms
+        ids += 1
+
+        if arrival_tick > tick:
+            tick = arrival_tick
+            sequence = 0
+            continue
+
+        if sequence < max_sequence:
+            sequence += 1
+        else:
+            exhausted_ticks += 1
+            tick += 1
+            sequence = 0
+
+        if tick > arrival_tick:
+            stall_ms = tick * time_step_ms - arrival
+            stalled_ids += 1
+            total_stall_ms += stall_ms
+            max_stall_ms = max(max_stall_ms, stall_ms)
+
+    return StallReport(
+        ids=ids,
+        stalled_ids=stalled_ids,
+        exhausted_ticks=exhausted_ticks,
+        total_stall_ms=total_stall_ms,
+        max_stall_ms=max_stall_ms,
+    )
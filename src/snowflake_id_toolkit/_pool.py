@@ -0,0 +1,145 @@
+import itertools
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from typing import Generic, Literal
+
+from snowflake_id_toolkit._generator import TID, SnowflakeIDGenerator
+
+
+class SnowflakeIDGeneratorPool(Generic[TID]):
+    """Pool of generators with distinct node IDs sharing one layout and epoch.
+
+    Every member has its own lock, so threads drawing from different members
+    never contend with each other. IDs from the pool are unique, but only IDs
+    from the same member are ordered relative to each other.
+
+    Strategies:
+        - "thread": each thread is pinned to one member on its first call,
+          members are assigned round-robin. With as many members as threads
+          there is no lock contention at all.
+        - "round_robin": every call goes to the next member in turn.
+
+    Example:
+        >>> pool = SnowflakeIDGeneratorPool(
+        ...     TwitterSnowflakeIDGenerator,
+        ...     range(32, 64),
+        ...     epoch=1288834974657,
+        ... )
+        >>> pool.generate_next_id()
+        >>> pool.generate_ids(10_000)
+    """
+
+    def __init__(
+        self,
+        generator_cls: type[SnowflakeIDGenerator[TID]],
+        node_ids: Iterable[int],
+        *,
+        epoch: int = 0,
+        strategy: Literal["thread", "round_robin"] = "thread",
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            generator_cls: Generator class of the layout to use.
+            node_ids: Distinct node IDs, one member per node ID. Required, since the
+                node IDs must not overlap with those of other hosts or processes.
+            epoch: Custom epoch shared by all members.
+            strategy: How calls are distributed over members, "thread" or "round_robin".
+
+        Raises:
+            ValueError: If node_ids is empty, contains duplicates or out-of-range values,
+                or if strategy is unknown.
+            MaxTimestampHasReachedError: If current time exceeds max representable.
+        """
+
+        node_ids = tuple(node_ids)
+
+        if not node_ids:
+            raise ValueError("Pool must contain at least one node ID")
+
+        if len(set(node_ids)) != len(node_ids):
+            raise ValueError("Node IDs must be distinct")
+
+        if strategy == "thread":
+            self._pick = self._pick_thread_generator
+        elif strategy == "round_robin":
+            self._pick = self._pick_next_generator
+        else:
+            raise ValueError(f"Unknown strategy: {strategy!r}")
+
+        self._generators = tuple(generator_cls(node_id, epoch=epoch) for node_id in node_ids)
+        self._counter = itertools.count()
+        self._local = threading.local()
+
+    @property
+    def generators(self) -> tuple[SnowflakeIDGenerator[TID], ...]:
+        """
+        Member generators, in node ID order as given.
+        """
+
+        return self._generators
+
+    def generate_next_id(self) -> TID:
+        """Generate the next unique snowflake ID from one of the members.
+
+        Returns:
+            A unique SnowflakeID instance.
+
+        Raises:
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        return self._pick().generate_next_id()
+
+    def generate_ids(self, count: int, *, executor: Executor | None = None) -> list[TID]:
+        """Generate a batch of unique snowflake IDs from all members.
+
+        The batch is split evenly over members. Each member fills its share under
+        its own lock, so IDs are grouped by member and increasing within a group.
+
+        Args:
+            count: Number of IDs to generate.
+            executor: Executor to fill the shares in parallel
+                (default: fill them one after another in the calling thread).
+
+        Returns:
+            A list of count unique SnowflakeID instances.
+
+        Raises:
+            ValueError: If count is negative.
+            MaxTimestampHasReachedError: If timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If clock moved backwards.
+        """
+
+        if count < 0:
+            raise ValueError("Count must not be negative")
+
+        share, remainder = divmod(count, len(self._generators))
+        shares = [
+            (generator, share + 1 if i < remainder else share)
+            for i, generator in enumerate(self._generators)
+            if share or i < remainder
+        ]
+
+        ids: list[TID] = []
+
+        if executor is None:
+            for generator, size in shares:
+                ids.extend(generator.generate_ids(size))
+        else:
+            for future in [executor.submit(generator.generate_ids, size) for generator, size in shares]:
+                ids.extend(future.result())
+
+        return ids
+
+    def _pick_thread_generator(self) -> SnowflakeIDGenerator[TID]:
+        try:
+            return self._local.generator  # type: ignore[no-any-return]
+        except AttributeError:
+            generator = self._local.generator = self._pick_next_generator()
+            return generator
+
+    def _pick_next_generator(self) -> SnowflakeIDGenerator[TID]:
+        return self._generators[next(self._counter) % len(self._generators)]
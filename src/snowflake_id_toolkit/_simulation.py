@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import csv
+import itertools
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from snowflake_id_toolkit._generator import SnowflakeIDGenerator
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    """Result of replaying a trace with replay_trace().
+
+    Latency is the time between a request's arrival and its ID, which is
+    zero unless the request waited for a tick with free sequence numbers.
+
+    Attributes:
+        ids: Number of IDs generated.
+        ticks: Number of ticks the IDs were generated in.
+        max_ids_per_tick: Largest number of IDs generated in one tick.
+        stall_ms: Virtual time spent waiting in _wait_for_next_timestamp(), in milliseconds.
+        stalled_ids: Number of IDs with a non-zero latency.
+        p50_ms: Median latency, in milliseconds.
+        p99_ms: 99th percentile latency, in milliseconds.
+        p999_ms: 99.9th percentile latency, in milliseconds.
+        max_ms: Highest latency, in milliseconds.
+    """
+
+    ids: int
+    ticks: int
+    max_ids_per_tick: int
+    stall_ms: float
+    stalled_ids: int
+    p50_ms: float
+    p99_ms: float
+    p999_ms: float
+    max_ms: float
+
+    @property
+    def mean_ids_per_tick(self) -> float:
+        """
+        Average number of IDs per tick the IDs were generated in.
+        """
+
+        return self.ids / self.ticks if self.ticks else 0.0
+
+
+class _VirtualClock:
+    """
+    Simulated wall time of a replay, in milliseconds.
+    """
+
+    def __init__(self, now_ms: float) -> None:
+        self.now_ms = now_ms
+        self.stall_ms = 0.0
+
+
+def replay_trace(
+    generator_cls: type[SnowflakeIDGenerator[Any]],
+    arrivals_ms: Iterable[float],
+    *,
+    node_id: int = 0,
+) -> SimulationReport:
+    """Replay request arrival times against a generator running on a virtual clock.
+
+    Runs the generator's own code on a subclass whose clock only moves with the trace,
+    so replays are deterministic and run as fast as IDs can be generated. Requests are
+    served one at a time in arrival order; waiting for the next tick moves the clock
+    to that tick's start instead of spinning, and requests arriving in the meantime
+    queue behind it.
+
+    Args:
+        generator_cls: Generator class of the layout to replay against.
+        arrivals_ms: Request arrival times in milliseconds since the generator's epoch
+            (the Unix epoch), in non-decreasing order.
+        node_id: Node ID of the simulated generator.
+
+    Returns:
+        Tick and latency counters of the replay.
+
+    Raises:
+        ValueError: If arrival times are negative or decrease, or node_id is out of valid range.
+        MaxTimestampHasReachedError: If an arrival time exceeds the layout's max timestamp.
+    """
+
+    arrivals = iter(arrivals_ms)
+    first = next(arrivals, None)
+
+    if first is None:
+        return SimulationReport(0, 0, 0, 0.0, 0, 0.0, 0.0, 0.0, 0.0)
+
+    if first < 0:
+        raise ValueError("Arrival times must not be negative")
+
+    clock = _VirtualClock(first)
+    time_step_ms = generator_cls._config.time_step_ms  # noqa: SLF001
+
+    class SimulatedGenerator(generator_cls):  # type: ignore[valid-type,misc]
+        @classmethod
+        def get_current_timestamp(cls) -> int:
+            return math.floor(clock.now_ms / time_step_ms)
+
+        def _wait_for_next_timestamp(self) -> int:
+            start_ms = clock.now_ms
+            clock.now_ms = max(start_ms, (self._last_generation_timestamp + 1) * time_step_ms)
+            clock.stall_ms += clock.now_ms - start_ms
+            return self.get_current_timestamp()
+
+    generator = SimulatedGenerator(node_id)
+    timestamp_shift = generator.config.timestamp_shift
+
+    latencies: list[float] = []
+    ticks = max_ids_per_tick = tick_ids = 0
+    last_tick = -1
+    previous = first
+
+    for arrival in itertools.chain((first,), arrivals):
+        if arrival < previous:
+            raise ValueError("Arrival times must not decrease")
+
+        previous = arrival
+        clock.now_ms = max(clock.now_ms, arrival)
+        tick = generator.generate_next_id() >> timestamp_shift
+        latencies.append(clock.now_ms - arrival)
+
+        if tick != last_tick:
+            ticks += 1
+            last_tick = tick
+            tick_ids = 0
+
+        tick_ids += 1
+        max_ids_per_tick = max(max_ids_per_tick, tick_ids)
+
+    latencies.sort()
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(len(latencies) - 1, math.floor(fraction * len(latencies)))]
+
+    return SimulationReport(
+        ids=len(latencies),
+        ticks=ticks,
+        max_ids_per_tick=max_ids_per_tick,
+        stall_ms=clock.stall_ms,
+        stalled_ids=sum(1 for latency in latencies if latency > 0),
+        p50_ms=percentile(0.5),
+        p99_ms=percentile(0.99),
+        p999_ms=percentile(0.999),
+        max_ms=latencies[-1],
+    )
+
+
+def read_trace(path: Path) -> list[float]:
+    """Read request arrival times from a CSV file.
+
+    Takes the first column of every row, in milliseconds. A first row that
+    is not a number is taken as a header and skipped, as are empty rows.
+
+    Args:
+        path: CSV file to read.
+
+    Returns:
+        Arrival times in file order.
+
+    Raises:
+        ValueError: If a row other than the header is not a number.
+    """
+
+    with path.open(newline="") as stream:
+        rows = [row[0] for row in csv.reader(stream) if row and row[0].strip()]
+
+    if rows:
+        try:
+            float(rows[0])
+        except ValueError:
+            del rows[0]
+
+    return [float(row) for row in rows]
@@ -0,0 +1,662 @@
+/*
+ * Optional compiled accelerator for the ID generation and decoding hot paths.
+ *
+ * Every function here has a pure-Python counterpart it is checked against, and
+ * falls back to it for anything outside the fast path: layouts wider than 64 bits,
+ * a patched clock, sequence exhaustion, clock regression and all error reporting.
+ * Generator state stays in the Python instance, guarded by the generator's own lock,
+ * so both implementations can serve the same generator.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+
+typedef struct {
+    PyTypeObject *fast_path_type;
+    PyObject *time_module;
+    /* time.time_ns as of import, clock mocking libraries replace the module attribute */
+    PyObject *time_ns;
+    PyObject *str_fast_path;
+    PyObject *str_state;
+    PyObject *str_generate_next_id;
+    PyObject *str_generate_next_raw_id;
+    PyObject *str_acquire;
+    PyObject *str_release;
+    PyObject *str_time_ns;
+    PyObject *str_get_current_timestamp;
+} speedups_state;
+
+static inline speedups_state *
+get_state(PyObject *module)
+{
+    return (speedups_state *)PyModule_GetState(module);
+}
+
+/* FastPath: per-generator constants, parsed once on generator initialization */
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *lock;
+    PyObject *id_cls;
+    /* The base get_current_timestamp classmethod, the only clock served */
+    PyObject *clock;
+    int sequence_bits;
+    int timestamp_shift;
+    int64_t max_sequence;
+    uint64_t node_part;
+    int64_t epoch;
+    int64_t max_generation_timestamp;
+    int64_t tick_ns;
+    int random_sequence;
+    uint64_t sequence_key;
+} FastPathObject;
+
+static PyObject *
+FastPath_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    static char *keywords[] = {
+        "lock", "id_cls", "sequence_bits", "timestamp_shift", "node_part", "epoch",
+        "max_generation_timestamp", "tick_ns", "clock", "sequence_key", NULL,
+    };
+    PyObject *lock, *id_cls, *clock, *sequence_key = Py_None;
+    int sequence_bits, timestamp_shift;
+    unsigned long long node_part;
+    long long epoch, max_generation_timestamp, tick_ns;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOiiKLLLO|O:FastPath", keywords, &lock, &id_cls,
+                                     &sequence_bits, &timestamp_shift, &node_part, &epoch,
+                                     &max_generation_timestamp, &tick_ns, &clock, &sequence_key)) {
+        return NULL;
+    }
+
+    uint64_t key = 0;
+    if (sequence_key != Py_None) {
+        key = PyLong_AsUnsignedLongLong(sequence_key);
+        if (key == (uint64_t)-1 && PyErr_Occurred()) {
+            return NULL;
+        }
+    }
+
+    if (sequence_bits < 0 || sequence_bits > 62 || timestamp_shift < 0 || timestamp_shift > 63) {
+        PyErr_SetString(PyExc_ValueError, "Layout does not fit into 64 bits");
+        return NULL;
+    }
+
+    if (tick_ns <= 0 || epoch < 0 || max_generation_timestamp < epoch ||
+        max_generation_timestamp >= (INT64_MAX >> sequence_bits)) {
+        PyErr_SetString(PyExc_ValueError, "Timestamps do not fit into 64 bits");
+        return NULL;
+    }
+
+    FastPathObject *self = (FastPathObject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+
+    self->lock = Py_NewRef(lock);
+    self->id_cls = Py_NewRef(id_cls);
+    self->clock = Py_NewRef(clock);
+    self->sequence_bits = sequence_bits;
+    self->timestamp_shift = timestamp_shift;
+    self->max_sequence = ((int64_t)1 << sequence_bits) - 1;
+    self->node_part = node_part;
+    self->epoch = epoch;
+    self->max_generation_timestamp = max_generation_timestamp;
+    self->tick_ns = tick_ns;
+    self->random_sequence = sequence_key != Py_None;
+    self->sequence_key = key;
+    return (PyObject *)self;
+}
+
+static int
+FastPath_traverse(FastPathObject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(Py_TYPE(self));
+    Py_VISIT(self->lock);
+    Py_VISIT(self->id_cls);
+    Py_VISIT(self->clock);
+    return 0;
+}
+
+static int
+FastPath_clear(FastPathObject *self)
+{
+    Py_CLEAR(self->lock);
+    Py_CLEAR(self->id_cls);
+    Py_CLEAR(self->clock);
+    return 0;
+}
+
+static void
+FastPath_dealloc(FastPathObject *self)
+{
+    PyTypeObject *type = Py_TYPE(self);
+    PyObject_GC_UnTrack(self);
+    FastPath_clear(self);
+    type->tp_free((PyObject *)self);
+    Py_DECREF(type);
+}
+
+static PyType_Slot FastPath_slots[] = {
+    {Py_tp_doc, "Constants of a generator the compiled generate_next_id can serve."},
+    {Py_tp_new, FastPath_new},
+    {Py_tp_traverse, FastPath_traverse},
+    {Py_tp_clear, FastPath_clear},
+    {Py_tp_dealloc, FastPath_dealloc},
+    {0, NULL},
+};
+
+static PyType_Spec FastPath_spec = {
+    .name = "snowflake_id_toolkit._speedups.FastPath",
+    .basicsize = sizeof(FastPathObject),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = FastPath_slots,
+};
+
+/* generate_next_id */
+
+/* Sequence offset of a tick: the top bits of a splitmix64 mix of the keyed timestamp.
+ * Mirrors _sequence_offset() in _generator.py. */
+static inline uint64_t
+sequence_offset(int64_t timestamp, uint64_t key, int sequence_bits)
+{
+    if (sequence_bits == 0) {
+        return 0;
+    }
+
+    uint64_t z = ((uint64_t)timestamp ^ key) + 0x9E3779B97F4A7C15ULL;
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return (z ^ (z >> 31)) >> (64 - sequence_bits);
+}
+
+/* Whether get_current_timestamp of the generator resolves to anything but the base classmethod.
+ * Returns 1 or 0, -1 on error. Looks the name up without binding a method. */
+static int
+has_own_clock(speedups_state *st, FastPathObject *fast_path, PyObject *generator)
+{
+    PyObject *descriptor = _PyType_Lookup(Py_TYPE(generator), st->str_get_current_timestamp);
+    if (descriptor == NULL || fast_path->clock != descriptor) {
+        return 1;
+    }
+
+    PyObject **dict = _PyObject_GetDictPtr(generator);
+    if (dict == NULL || *dict == NULL) {
+        return 0;
+    }
+    return PyDict_Contains(*dict, st->str_get_current_timestamp);
+}
+
+static PyObject *
+fall_back(speedups_state *st, PyObject *generator, int raw)
+{
+    return PyObject_CallMethodNoArgs(generator, raw ? st->str_generate_next_raw_id : st->str_generate_next_id);
+}
+
+/* Advance the generator state under its lock.
+ * Returns 1 with *next set, 0 if the pure-Python path must take over, -1 on error. */
+static int
+advance(speedups_state *st, FastPathObject *fast_path, PyObject *generator, int64_t current,
+        int64_t *next)
+{
+    PyObject *result = PyObject_CallMethodNoArgs(fast_path->lock, st->str_acquire);
+    if (result == NULL) {
+        return -1;
+    }
+    Py_DECREF(result);
+
+    int status = -1;
+    PyObject *type, *value, *traceback;
+    PyObject *state_obj = PyObject_GetAttr(generator, st->str_state);
+    if (state_obj == NULL) {
+        goto release;
+    }
+
+    int64_t state = PyLong_AsLongLong(state_obj);
+    Py_DECREF(state_obj);
+    if (state == -1 && PyErr_Occurred()) {
+        goto release;
+    }
+
+    int64_t floor = current << fast_path->sequence_bits;
+    *next = state + 1;
+
+    if (*next < floor) {
+        *next = floor;
+    }
+    else if ((*next >> fast_path->sequence_bits) != current) {
+        status = 0;
+        goto release;
+    }
+
+    PyObject *next_obj = PyLong_FromLongLong(*next);
+    if (next_obj == NULL) {
+        goto release;
+    }
+    status = PyObject_SetAttr(generator, st->str_state, next_obj) < 0 ? -1 : 1;
+    Py_DECREF(next_obj);
+
+release:
+    /* Keep an error raised under the lock across the release call */
+    PyErr_Fetch(&type, &value, &traceback);
+    result = PyObject_CallMethodNoArgs(fast_path->lock, st->str_release);
+    if (result == NULL) {
+        Py_XDECREF(type);
+        Py_XDECREF(value);
+        Py_XDECREF(traceback);
+        return -1;
+    }
+    Py_DECREF(result);
+    PyErr_Restore(type, value, traceback);
+    return status;
+}
+
+/* Generate the next ID of a generator, as an instance of its ID class or, if raw, a plain int */
+static PyObject *
+generate(PyObject *module, PyObject *generator, int raw)
+{
+    speedups_state *st = get_state(module);
+
+    PyObject *fast_path_obj = PyObject_GetAttr(generator, st->str_fast_path);
+    if (fast_path_obj == NULL) {
+        return NULL;
+    }
+    if (!Py_IS_TYPE(fast_path_obj, st->fast_path_type)) {
+        Py_DECREF(fast_path_obj);
+        return fall_back(st, generator, raw);
+    }
+    FastPathObject *fast_path = (FastPathObject *)fast_path_obj;
+    PyObject *result = NULL;
+
+    /* The clock may have been patched on the class or the instance after binding */
+    int own_clock = has_own_clock(st, fast_path, generator);
+    if (own_clock < 0) {
+        goto done;
+    }
+    if (own_clock) {
+        result = fall_back(st, generator, raw);
+        goto done;
+    }
+
+    PyObject *time_ns = PyObject_GetAttr(st->time_module, st->str_time_ns);
+    if (time_ns == NULL) {
+        goto done;
+    }
+    if (time_ns != st->time_ns) {
+        Py_DECREF(time_ns);
+        result = fall_back(st, generator, raw);
+        goto done;
+    }
+    PyObject *now_obj = PyObject_CallNoArgs(time_ns);
+    Py_DECREF(time_ns);
+    if (now_obj == NULL) {
+        goto done;
+    }
+    int64_t now = PyLong_AsLongLong(now_obj);
+    Py_DECREF(now_obj);
+    if (now == -1 && PyErr_Occurred()) {
+        goto done;
+    }
+
+    int64_t current = now / fast_path->tick_ns;
+    if (current > fast_path->max_generation_timestamp) {
+        result = fall_back(st, generator, raw);
+        goto done;
+    }
+
+    int64_t next;
+    int status = advance(st, fast_path, generator, current, &next);
+    if (status < 0) {
+        goto done;
+    }
+    if (status == 0) {
+        result = fall_back(st, generator, raw);
+        goto done;
+    }
+
+    int64_t timestamp = next >> fast_path->sequence_bits;
+    uint64_t sequence = (uint64_t)next;
+    if (fast_path->random_sequence) {
+        sequence += sequence_offset(timestamp, fast_path->sequence_key, fast_path->sequence_bits);
+    }
+
+    uint64_t value = ((uint64_t)(timestamp - fast_path->epoch) << fast_path->timestamp_shift) |
+                     fast_path->node_part | (sequence & (uint64_t)fast_path->max_sequence);
+    PyObject *value_obj = PyLong_FromUnsignedLongLong(value);
+    if (value_obj == NULL || raw) {
+        result = value_obj;
+        goto done;
+    }
+    result = PyObject_CallOneArg(fast_path->id_cls, value_obj);
+    Py_DECREF(value_obj);
+
+done:
+    Py_DECREF(fast_path_obj);
+    return result;
+}
+
+static PyObject *
+generate_next_id(PyObject *module, PyObject *generator)
+{
+    return generate(module, generator, 0);
+}
+
+static PyObject *
+generate_next_raw_id(PyObject *module, PyObject *generator)
+{
+    return generate(module, generator, 1);
+}
+
+/* make_ids(id_cls, base, first, last) -> [id_cls(base + sequence) for sequence in range(first, last + 1)] */
+
+static PyObject *
+make_ids(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 4) {
+        PyErr_SetString(PyExc_TypeError, "make_ids() takes exactly 4 arguments");
+        return NULL;
+    }
+
+    PyObject *id_cls = args[0];
+    PyObject *base_obj = args[1];
+    Py_ssize_t first = PyLong_AsSsize_t(args[2]);
+    if (first == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    Py_ssize_t last = PyLong_AsSsize_t(args[3]);
+    if (last == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    Py_ssize_t count = last >= first ? last - first + 1 : 0;
+    PyObject *ids = PyList_New(count);
+    if (ids == NULL) {
+        return NULL;
+    }
+
+    uint64_t base = PyLong_AsUnsignedLongLong(base_obj);
+    int wide = base == (uint64_t)-1 && PyErr_Occurred();
+    if (wide) {
+        if (!PyErr_ExceptionMatches(PyExc_OverflowError)) {
+            Py_DECREF(ids);
+            return NULL;
+        }
+        PyErr_Clear();
+    }
+    else if ((uint64_t)last > UINT64_MAX - base) {
+        wide = 1;
+    }
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *value;
+
+        if (wide) {
+            PyObject *sequence = PyLong_FromSsize_t(first + i);
+            if (sequence == NULL) {
+                Py_DECREF(ids);
+                return NULL;
+            }
+            value = PyNumber_Add(base_obj, sequence);
+            Py_DECREF(sequence);
+        }
+        else {
+            value = PyLong_FromUnsignedLongLong(base + (uint64_t)(first + i));
+        }
+        if (value == NULL) {
+            Py_DECREF(ids);
+            return NULL;
+        }
+
+        PyObject *id = PyObject_CallOneArg(id_cls, value);
+        Py_DECREF(value);
+        if (id == NULL) {
+            Py_DECREF(ids);
+            return NULL;
+        }
+        PyList_SET_ITEM(ids, i, id);
+    }
+
+    return ids;
+}
+
+/* pack_ids(start, count) -> native-endian uint64 values start to start + count - 1, as bytes */
+
+static PyObject *
+pack_ids(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 2) {
+        PyErr_SetString(PyExc_TypeError, "pack_ids() takes exactly 2 arguments");
+        return NULL;
+    }
+
+    uint64_t start = PyLong_AsUnsignedLongLong(args[0]);
+    if (start == (uint64_t)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    Py_ssize_t count = PyLong_AsSsize_t(args[1]);
+    if (count == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    if (count < 0 || (uint64_t)count > PY_SSIZE_T_MAX / sizeof(uint64_t) ||
+        (count > 0 && (uint64_t)(count - 1) > UINT64_MAX - start)) {
+        PyErr_SetString(PyExc_OverflowError, "IDs do not fit into 64 bits");
+        return NULL;
+    }
+
+    PyObject *output = PyBytes_FromStringAndSize(NULL, count * (Py_ssize_t)sizeof(uint64_t));
+    if (output == NULL) {
+        return NULL;
+    }
+    uint64_t *values = (uint64_t *)PyBytes_AS_STRING(output);
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        values[i] = start + (uint64_t)i;
+    }
+
+    return output;
+}
+
+/* format_rows(values, timestamp_shift, node_id_shift, max_node_id, max_sequence, epoch, time_step_ms, jsonl)
+ * -> CSV or JSON Lines rows of ID components, as ASCII bytes */
+
+static PyObject *
+format_rows(PyObject *module, PyObject *args)
+{
+    PyObject *values;
+    int timestamp_shift, node_id_shift, jsonl;
+    unsigned long long max_node_id, max_sequence;
+    long long epoch, time_step_ms;
+
+    if (!PyArg_ParseTuple(args, "O!iiKKLLp:format_rows", &PyList_Type, &values, &timestamp_shift,
+                          &node_id_shift, &max_node_id, &max_sequence, &epoch, &time_step_ms, &jsonl)) {
+        return NULL;
+    }
+
+    if (timestamp_shift < 0 || timestamp_shift > 63 || node_id_shift < 0 || node_id_shift > 63) {
+        PyErr_SetString(PyExc_ValueError, "Layout does not fit into 64 bits");
+        return NULL;
+    }
+
+    /* Longest row: 4 numbers of at most 20 digits plus the JSON keys */
+    const Py_ssize_t max_row = 4 * 21 + 64;
+    Py_ssize_t count = PyList_GET_SIZE(values);
+
+    PyObject *output = PyBytes_FromStringAndSize(NULL, count * max_row);
+    if (output == NULL) {
+        return NULL;
+    }
+    char *start = PyBytes_AS_STRING(output);
+    char *cursor = start;
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        uint64_t value = PyLong_AsUnsignedLongLong(PyList_GET_ITEM(values, i));
+        if (value == (uint64_t)-1 && PyErr_Occurred()) {
+            Py_DECREF(output);
+            return NULL;
+        }
+
+        long long timestamp_ms = ((long long)(value >> timestamp_shift) + epoch) * time_step_ms;
+        unsigned long long node_id = (value >> node_id_shift) & max_node_id;
+        unsigned long long sequence = value & max_sequence;
+
+        if (jsonl) {
+            cursor += snprintf(cursor, max_row, "{\"id\":%llu,\"timestamp_ms\":%lld,\"node_id\":%llu,\"sequence\":%llu}\n",
+                               (unsigned long long)value, timestamp_ms, node_id, sequence);
+        }
+        else {
+            cursor += snprintf(cursor, max_row, "%llu,%lld,%llu,%llu\n", (unsigned long long)value, timestamp_ms,
+                               node_id, sequence);
+        }
+    }
+
+    if (_PyBytes_Resize(&output, cursor - start) < 0) {
+        return NULL;
+    }
+    return output;
+}
+
+/* Module */
+
+static PyMethodDef speedups_methods[] = {
+    {"_generate_next_id", (PyCFunction)generate_next_id, METH_O,
+     "Compiled SnowflakeIDGenerator.generate_next_id, unbound."},
+    {"_generate_next_raw_id", (PyCFunction)generate_next_raw_id, METH_O,
+     "Compiled SnowflakeIDGenerator.generate_next_raw_id, unbound."},
+    {"make_ids", (PyCFunction)(void (*)(void))make_ids, METH_FASTCALL,
+     "make_ids(id_cls, base, first, last)\n--\n\n"
+     "Build id_cls(base + sequence) for every sequence from first to last inclusive."},
+    {"pack_ids", (PyCFunction)(void (*)(void))pack_ids, METH_FASTCALL,
+     "pack_ids(start, count)\n--\n\n"
+     "Pack count consecutive 64-bit IDs from start as native-endian bytes."},
+    {"format_rows", format_rows, METH_VARARGS,
+     "format_rows(values, timestamp_shift, node_id_shift, max_node_id, max_sequence, epoch, time_step_ms, jsonl)\n"
+     "--\n\n"
+     "Decode 64-bit IDs into CSV or JSON Lines rows."},
+    {NULL, NULL, 0, NULL},
+};
+
+/* Add the module function of function_name, wrapped as an instance method, as method_name */
+static int
+add_method(PyObject *module, const char *function_name, const char *method_name)
+{
+    PyObject *function = PyObject_GetAttrString(module, function_name);
+    if (function == NULL) {
+        return -1;
+    }
+    PyObject *method = PyInstanceMethod_New(function);
+    Py_DECREF(function);
+    if (method == NULL) {
+        return -1;
+    }
+    if (PyModule_AddObject(module, method_name, method) < 0) {
+        Py_DECREF(method);
+        return -1;
+    }
+    return 0;
+}
+
+static int
+speedups_exec(PyObject *module)
+{
+    speedups_state *st = get_state(module);
+
+    st->fast_path_type = (PyTypeObject *)PyType_FromModuleAndSpec(module, &FastPath_spec, NULL);
+    if (st->fast_path_type == NULL || PyModule_AddType(module, st->fast_path_type) < 0) {
+        return -1;
+    }
+
+    st->time_module = PyImport_ImportModule("time");
+    if (st->time_module == NULL) {
+        return -1;
+    }
+    st->time_ns = PyObject_GetAttrString(st->time_module, "time_ns");
+    if (st->time_ns == NULL) {
+        return -1;
+    }
+
+    if ((st->str_fast_path = PyUnicode_InternFromString("_fast_path")) == NULL ||
+        (st->str_state = PyUnicode_InternFromString("_state")) == NULL ||
+        (st->str_generate_next_id = PyUnicode_InternFromString("_generate_next_id")) == NULL ||
+        (st->str_generate_next_raw_id = PyUnicode_InternFromString("_generate_next_raw_id")) == NULL ||
+        (st->str_acquire = PyUnicode_InternFromString("acquire")) == NULL ||
+        (st->str_release = PyUnicode_InternFromString("release")) == NULL ||
+        (st->str_time_ns = PyUnicode_InternFromString("time_ns")) == NULL ||
+        (st->str_get_current_timestamp = PyUnicode_InternFromString("get_current_timestamp")) == NULL) {
+        return -1;
+    }
+
+    /* Bind as methods, so they can replace the pure-Python ones on the generator class */
+    if (add_method(module, "_generate_next_id", "generate_next_id") < 0 ||
+        add_method(module, "_generate_next_raw_id", "generate_next_raw_id") < 0) {
+        return -1;
+    }
+
+    return 0;
+}
+
+static int
+speedups_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    speedups_state *st = get_state(module);
+    Py_VISIT(st->fast_path_type);
+    Py_VISIT(st->time_module);
+    Py_VISIT(st->time_ns);
+    return 0;
+}
+
+static int
+speedups_clear(PyObject *module)
+{
+    speedups_state *st = get_state(module);
+    Py_CLEAR(st->fast_path_type);
+    Py_CLEAR(st->time_module);
+    Py_CLEAR(st->time_ns);
+    Py_CLEAR(st->str_fast_path);
+    Py_CLEAR(st->str_state);
+    Py_CLEAR(st->str_generate_next_id);
+    Py_CLEAR(st->str_generate_next_raw_id);
+    Py_CLEAR(st->str_acquire);
+    Py_CLEAR(st->str_release);
+    Py_CLEAR(st->str_time_ns);
+    Py_CLEAR(st->str_get_current_timestamp);
+    return 0;
+}
+
+static void
+speedups_free(void *module)
+{
+    speedups_clear((PyObject *)module);
+}
+
+static PyModuleDef_Slot speedups_slots[] = {
+    {Py_mod_exec, speedups_exec},
+#ifdef Py_mod_multiple_interpreters
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+#endif
+#ifdef Py_mod_gil
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+#endif
+    {0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "snowflake_id_toolkit._speedups",
+    .m_doc = "Optional compiled accelerator for snowflake_id_toolkit.",
+    .m_size = sizeof(speedups_state),
+    .m_methods = speedups_methods,
+    .m_slots = speedups_slots,
+    .m_traverse = speedups_traverse,
+    .m_clear = speedups_clear,
+    .m_free = speedups_free,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModuleDef_Init(&speedups_module);
+}
@@ -0,0 +1,37 @@
+from collections.abc import Callable
+from threading import Lock
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+class FastPath:
+    def __init__(
+        self,
+        lock: Lock,
+        id_cls: Callable[[int], object],
+        sequence_bits: int,
+        timestamp_shift: int,
+        node_part: int,
+        epoch: int,
+        max_generation_timestamp: int,
+        tick_ns: int,
+        clock: classmethod[Any, [], int],
+        sequence_key: int | None = None,
+    ) -> None: ...
+
+generate_next_id: Callable[..., object]
+generate_next_raw_id: Callable[..., int]
+
+def make_ids(id_cls: Callable[[int], _T], base: int, first: int, last: int, /) -> list[_T]: ...
+def pack_ids(start: int, count: int, /) -> bytes: ...
+def format_rows(
+    values: list[int],
+    timestamp_shift: int,
+    node_id_shift: int,
+    max_node_id: int,
+    max_sequence: int,
+    epoch: int,
+    time_step_ms: int,
+    jsonl: bool,
+    /,
+) -> bytes: ...
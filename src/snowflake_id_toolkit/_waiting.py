@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class WaitStrategy:
+    """How a generator waits for the next tick once a tick's sequence numbers are used up.
+
+    The generator busy-waits for up to spin_ns, which keeps the latency of short
+    waits low, then sleeps until the next tick boundary instead of burning a core.
+    Sleeping trades some wake-up latency, typically tens of microseconds, for CPU
+    time; Sonyflake waits of up to 10 ms spend nearly all of it asleep.
+
+    Attributes:
+        spin_ns: Time to busy-wait before sleeping, in nanoseconds.
+        release_lock: Release the generator's lock while sleeping, so that other
+            threads calling the generator sleep as well instead of queueing on the
+            lock, and other monotonic generators of the layout keep generating.
+    """
+
+    spin_ns: int = 50_000
+    release_lock: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the spin time.
+
+        Raises:
+            ValueError: If spin_ns is negative.
+        """
+
+        if self.spin_ns < 0:
+            raise ValueError("Spin time must not be negative")
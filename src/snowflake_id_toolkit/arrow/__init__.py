@@ -0,0 +1,11 @@
+from snowflake_id_toolkit.arrow._convert import LayoutConversion, convert_ids
+from snowflake_id_toolkit.arrow._export import id_schema, to_record_batch, to_table, write_parquet
+
+__all__ = (
+    "LayoutConversion",
+    "convert_ids",
+    "id_schema",
+    "to_record_batch",
+    "to_table",
+    "write_parquet",
+)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from snowflake_id_toolkit._id import SnowflakeID
+from snowflake_id_toolkit.arrow._export import _to_array, id_schema
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as error:  # pragma: no cover
+    raise ImportError("snowflake_id_toolkit.arrow requires pyarrow, install snowflake-id-toolkit[arrow]") from error
+
+
+@dataclass(frozen=True)
+class LayoutConversion:
+    """IDs re-encoded by convert_ids().
+
+    Attributes:
+        ids: Converted IDs in input order, null where an ID does not fit the target.
+        unencodable: Number of IDs that do not fit the target: timestamps before its
+            epoch or past its range, node IDs or sequences too wide for its bits.
+        collisions: Number of converted IDs equal to an earlier one. The conversion
+            maps distinct IDs to distinct IDs, so these come from duplicate input IDs.
+    """
+
+    ids: pa.Array
+    unencodable: int
+    collisions: int
+
+
+def convert_ids(
+    ids: Iterable[int] | pa.Array | pa.ChunkedArray,
+    source: type[SnowflakeID],
+    target: type[SnowflakeID],
+    *,
+    source_epoch: int | None = None,
+    target_epoch: int | None = None,
+) -> LayoutConversion:
+    """Re-encode IDs into another layout or epoch with vectorized Arrow kernels.
+
+    Timestamps are carried over in absolute time, node IDs as they are. Where a
+    target tick spans several source ticks, e.g. Twitter to Sonyflake, a source
+    tick's sequences move up by its position within the target tick times the
+    source's sequence space, so the conversion never merges two IDs. Converted IDs
+    keep the order of their source IDs per node; across nodes, they keep it down
+    to the coarser of the two ticks.
+
+    Args:
+        ids: IDs of the source layout, see to_record_batch().
+        source: ID class of the source layout.
+        target: ID class of the target layout.
+        source_epoch: Custom epoch of the IDs (default: the source class epoch).
+        target_epoch: Custom epoch to encode into (default: the target class epoch).
+
+    Returns:
+        The converted IDs, typed like the id column of id_schema(target), with the
+        numbers of unencodable and colliding IDs.
+
+    Raises:
+        ValueError: If either layout is wider than 64 bits, or an ID is null or out of the source layout's range.
+    """
+
+    source_config = source._config  # noqa: SLF001
+    target_config = target._config  # noqa: SLF001
+
+    if source_epoch is None:
+        source_epoch = source._epoch  # noqa: SLF001
+
+    if target_epoch is None:
+        target_epoch = target._epoch  # noqa: SLF001
+
+    target_type = id_schema(target).field("id").type
+    array = _to_array(ids, id_schema(source).field("id").type)
+    id_type = array.type
+    source_step = source_config.time_step_ms
+    target_step = target_config.time_step_ms
+
+    # Unix milliseconds of each ID's tick, then the target tick holding it and the
+    # source tick's position within it
+    ticks = pc.shift_right(array, pa.scalar(source_config.timestamp_shift, id_type)).cast(pa.int64())
+    times = pc.multiply(pc.add(ticks, source_epoch), source_step)
+    target_ticks = pc.divide(times, target_step)
+    positions = pc.divide(pc.subtract(times, pc.multiply(target_ticks, target_step)), source_step)
+
+    timestamps = pc.subtract(target_ticks, target_epoch)
+    node_ids = pc.bit_wise_and(
+        pc.shift_right(array, pa.scalar(source_config.node_id_shift, id_type)),
+        pa.scalar(source_config.max_node_id, id_type),
+    ).cast(pa.int64())
+    sequences = pc.add(
+        pc.multiply(positions, source_config.max_sequence + 1),
+        pc.bit_wise_and(array, pa.scalar(source_config.max_sequence, id_type)).cast(pa.int64()),
+    )
+
+    valid = pc.and_(
+        pc.and_(pc.greater_equal(timestamps, 0), pc.less_equal(timestamps, target_config.max_timestamp)),
+        pc.and_(
+            pc.less_equal(node_ids, target_config.max_node_id),
+            pc.less_equal(sequences, target_config.max_sequence),
+        ),
+    )
+
+    def component(values: pa.Array, shift: int) -> pa.Array:
+        unsigned = pc.if_else(valid, values, 0).cast(pa.uint64())
+        return pc.shift_left(unsigned, pa.scalar(shift, pa.uint64())) if shift else unsigned
+
+    converted = pc.if_else(
+        valid,
+        pc.bit_wise_or(
+            pc.bit_wise_or(
+                component(timestamps, target_config.timestamp_shift),
+                component(node_ids, target_config.node_id_shift),
+            ),
+            component(sequences, 0),
+        ),
+        pa.scalar(None, pa.uint64()),
+    ).cast(target_type)
+
+    return LayoutConversion(ids=converted, unencodable=converted.null_count, collisions=_count_duplicates(converted))
+
+
+def _count_duplicates(array: pa.Array) -> int:
+    """
+    Number of non-null values equal to an earlier one, sorting only arrays that are not sorted already.
+    """
+
+    values = array.drop_null()
+
+    if len(values) < 2:
+        return 0
+
+    if not pc.all(pc.less_equal(values[:-1], values[1:])).as_py():
+        values = values.take(pc.sort_indices(values))
+
+    return int(pc.sum(pc.equal(values[:-1], values[1:])).as_py())
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import itertools
+from array import ArrayType
+from collections.abc import Iterable, Iterator, Sized
+from typing import BinaryIO
+
+from snowflake_id_toolkit._config import SnowflakeIDConfig
+from snowflake_id_toolkit._id import SnowflakeID
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as error:  # pragma: no cover
+    raise ImportError("snowflake_id_toolkit.arrow requires pyarrow, install snowflake-id-toolkit[arrow]") from error
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+# Row group size of write_parquet(), in rows
+_ROW_GROUP_SIZE = 1 << 20
+
+# Arrow types of buffer item formats, for items of 8 bytes
+_BUFFER_TYPES = {"Q": pa.uint64(), "L": pa.uint64(), "q": pa.int64(), "l": pa.int64()}
+
+
+def id_schema(id_cls: type[SnowflakeID]) -> pa.Schema:
+    """Schema of the batches and tables decoded from IDs of a layout.
+
+    The id column is int64, or uint64 if the layout uses all 64 bits. Timestamps
+    are UTC with millisecond precision, and node ID and sequence columns take
+    the smallest signed integer type that holds them.
+
+    Args:
+        id_cls: ID class of the layout.
+
+    Returns:
+        Schema with id, timestamp, node_id and sequence columns.
+
+    Raises:
+        ValueError: If the layout is wider than 64 bits.
+    """
+
+    config = id_cls._config  # noqa: SLF001
+    used_bits = config.timestamp_bits + config.node_id_bits + config.sequence_bits
+
+    if config.total_bits > 64:
+        raise ValueError("Arrow export supports layouts of up to 64 bits")
+
+    return pa.schema(
+        [
+            pa.field("id", pa.uint64() if used_bits == 64 else pa.int64(), nullable=False),
+            pa.field("timestamp", pa.timestamp("ms", tz="UTC"), nullable=False),
+            pa.field("node_id", _component_type(config.node_id_bits), nullable=False),
+            pa.field("sequence", _component_type(config.sequence_bits), nullable=False),
+        ]
+    )
+
+
+def to_record_batch(
+    ids: Iterable[int] | pa.Array | pa.ChunkedArray,
+    id_cls: type[SnowflakeID],
+    *,
+    epoch: int | None = None,
+) -> pa.RecordBatch:
+    """Decode IDs into a record batch of their components.
+
+    Components are extracted with vectorized Arrow kernels using the layout's
+    shifts and masks, without creating an ID instance per row.
+
+    Args:
+        ids: IDs of the layout, as integers, an Arrow integer array or anything
+            pyarrow.array() accepts, such as a NumPy array. Buffers of 64-bit
+            integers, such as generate_id_array() results, are read without copying.
+        id_cls: ID class of the layout.
+        epoch: Custom epoch (default: the class epoch).
+
+    Returns:
+        A record batch with the columns of id_schema(), one row per ID in input order.
+
+    Raises:
+        ValueError: If the layout is wider than 64 bits, or an ID is null or out of the layout's range.
+    """
+
+    schema = id_schema(id_cls)
+    array = _to_array(ids, schema.field("id").type)
+    return _decode(array, id_cls._config, id_cls._epoch if epoch is None else epoch, schema)  # noqa: SLF001
+
+
+def to_table(
+    ids: Iterable[int] | pa.Array | pa.ChunkedArray,
+    id_cls: type[SnowflakeID],
+    *,
+    epoch: int | None = None,
+) -> pa.Table:
+    """Decode IDs into a table of their components.
+
+    A chunked array is decoded chunk by chunk into a table of the same chunks.
+
+    Args:
+        ids: IDs of the layout, see to_record_batch().
+        id_cls: ID class of the layout.
+        epoch: Custom epoch (default: the class epoch).
+
+    Returns:
+        A table with the columns of id_schema(), one row per ID in input order.
+
+    Raises:
+        ValueError: If the layout is wider than 64 bits, or an ID is null or out of the layout's range.
+    """
+
+    schema = id_schema(id_cls)
+    config = id_cls._config  # noqa: SLF001
+
+    if epoch is None:
+        epoch = id_cls._epoch  # noqa: SLF001
+
+    chunks = ids.chunks if isinstance(ids, pa.ChunkedArray) else [ids]
+    batches = [_decode(_to_array(chunk, schema.field("id").type), config, epoch, schema) for chunk in chunks]
+    return pa.Table.from_batches(batches, schema=schema)
+
+
+def write_parquet(
+    ids: Iterable[int] | pa.Array | pa.ChunkedArray,
+    id_cls: type[SnowflakeID],
+    where: str | PathLike[str] | BinaryIO,
+    *,
+    epoch: int | None = None,
+    row_group_size: int = _ROW_GROUP_SIZE,
+) -> int:
+    """Decode IDs into a Parquet file, one row group at a time.
+
+    IDs are consumed in slices of row_group_size, so iterables of any length
+    are written with a bounded amount of memory.
+
+    Args:
+        ids: IDs of the layout, see to_record_batch().
+        id_cls: ID class of the layout.
+        where: Path or binary file object to write to.
+        epoch: Custom epoch (default: the class epoch).
+        row_group_size: Number of rows per row group.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If row_group_size is not positive, the layout is wider than 64 bits,
+            or an ID is null or out of the layout's range.
+    """
+
+    if row_group_size <= 0:
+        raise ValueError("Row group size must be positive")
+
+    schema = id_schema(id_cls)
+    config = id_cls._config  # noqa: SLF001
+
+    if epoch is None:
+        epoch = id_cls._epoch  # noqa: SLF001
+
+    rows = 0
+
+    with pq.ParquetWriter(where, schema) as writer:
+        for chunk in _slices(ids, row_group_size):
+            batch = _decode(_to_array(chunk, schema.field("id").type), config, epoch, schema)
+            writer.write_batch(batch, row_group_size=row_group_size)
+            rows += batch.num_rows
+
+    return rows
+
+
+def _component_type(bits: int) -> pa.DataType:
+    """
+    Smallest signed integer type holding an unsigned value of the given width.
+    """
+
+    if bits < 8:
+        return pa.int8()
+
+    if bits < 16:
+        return pa.int16()
+
+    return pa.int32() if bits < 32 else pa.int64()
+
+
+def _to_array(ids: Iterable[int] | pa.Array | pa.ChunkedArray, id_type: pa.DataType) -> pa.Array:
+    """
+    Convert IDs into an Arrow array of the schema's id type.
+    """
+
+    if isinstance(ids, pa.ChunkedArray):
+        ids = ids.combine_chunks()
+    elif isinstance(ids, (ArrayType, memoryview)):
+        ids = _wrap_buffer(ids)
+
+    try:
+        if isinstance(ids, pa.Array):
+            array = ids.cast(id_type)
+        else:
+            array = pa.array(ids if isinstance(ids, Sized) else list(ids), type=id_type)
+    except (OverflowError, pa.ArrowInvalid):
+        raise ValueError(f"IDs must fit into {id_type}") from None
+
+    if array.null_count:
+        raise ValueError("IDs must not be null")
+
+    return array
+
+
+def _wrap_buffer(ids: ArrayType[int] | memoryview) -> Iterable[int] | pa.Array:
+    """
+    Arrow array sharing the memory of a buffer of 64-bit integers, or the buffer itself if it holds other items.
+    """
+
+    view = memoryview(ids)
+
+    if view.itemsize != 8 or view.format not in _BUFFER_TYPES or not view.c_contiguous:
+        return ids
+
+    return pa.Array.from_buffers(_BUFFER_TYPES[view.format], len(view), [None, pa.py_buffer(view)])
+
+
+def _slices(ids: Iterable[int] | pa.Array | pa.ChunkedArray, size: int) -> Iterator[Iterable[int] | pa.Array]:
+    """
+    Split IDs into consecutive slices of at most size IDs.
+    """
+
+    if isinstance(ids, (pa.Array, pa.ChunkedArray)):
+        for offset in range(0, len(ids), size):
+            yield ids.slice(offset, size)
+        return
+
+    iterator = iter(ids)
+
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _decode(array: pa.Array, config: SnowflakeIDConfig, epoch: int, schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Extract the components of an array of IDs with the layout's shifts and masks.
+    """
+
+    id_type = array.type
+    used_bits = config.timestamp_bits + config.node_id_bits + config.sequence_bits
+
+    if len(array) and id_type == pa.int64():
+        bounds = pc.min_max(array)
+
+        if bounds["min"].as_py() < 0 or bounds["max"].as_py() >> used_bits:
+            raise ValueError(f"IDs must be between 0 and {(1 << used_bits) - 1}")
+
+    ticks = pc.shift_right(array, pa.scalar(config.timestamp_shift, id_type)).cast(pa.int64())
+    timestamps = pc.multiply(pc.add(ticks, epoch), config.time_step_ms)
+    node_ids = pc.bit_wise_and(
+        pc.shift_right(array, pa.scalar(config.node_id_shift, id_type)),
+        pa.scalar(config.max_node_id, id_type),
+    )
+    sequences = pc.bit_wise_and(array, pa.scalar(config.max_sequence, id_type))
+
+    return pa.RecordBatch.from_arrays(
+        [
+            array,
+            timestamps.cast(schema.field("timestamp").type),
+            node_ids.cast(schema.field("node_id").type),
+            sequences.cast(schema.field("sequence").type),
+        ],
+        schema=schema,
+    )
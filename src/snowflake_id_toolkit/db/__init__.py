@@ -0,0 +1,50 @@
+"""
+Database integration: batched primary key sources, framework adapters and SQL-side decoding.
+
+The adapters are imported on first access, so each needs only its own framework installed.
+"""
+
+from importlib import import_module
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from snowflake_id_toolkit.db._django import SnowflakeIDField
+    from snowflake_id_toolkit.db._psycopg import copy_with_ids
+    from snowflake_id_toolkit.db._source import BatchedIDSource
+    from snowflake_id_toolkit.db._sql import SQLExpressions, sql_expressions
+    from snowflake_id_toolkit.db._sqlalchemy import snowflake_id_column
+
+__all__ = (
+    "BatchedIDSource",
+    "SQLExpressions",
+    "SnowflakeIDField",
+    "copy_with_ids",
+    "snowflake_id_column",
+    "sql_expressions",
+)
+
+# Module each public name is imported from on first access
+_LAZY_IMPORTS = {
+    "BatchedIDSource": "snowflake_id_toolkit.db._source",
+    "SQLExpressions": "snowflake_id_toolkit.db._sql",
+    "SnowflakeIDField": "snowflake_id_toolkit.db._django",
+    "copy_with_ids": "snowflake_id_toolkit.db._psycopg",
+    "snowflake_id_column": "snowflake_id_toolkit.db._sqlalchemy",
+    "sql_expressions": "snowflake_id_toolkit.db._sql",
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from snowflake_id_toolkit.db._source import BatchedIDSource
+
+try:
+    from django.db import models
+except ImportError as error:  # pragma: no cover
+    raise ImportError("SnowflakeIDField requires Django, install snowflake-id-toolkit[django]") from error
+
+
+class SnowflakeIDField(models.BigIntegerField):  # type: ignore[misc]
+    """Django BigIntegerField filled from a batched ID source on insert.
+
+    Rows saved or bulk-created without a value get the next ID of the source, so
+    primary keys are known before the INSERT and bulk_create() needs no per-row
+    generator call. The source is runtime state and is left out of migrations.
+
+    Example:
+        >>> class Order(models.Model):
+        ...     id = SnowflakeIDField(
+        ...         primary_key=True,
+        ...         source=BatchedIDSource(
+        ...             TwitterSnowflakeIDGenerator(node_id=0)
+        ...         ),
+        ...     )
+    """
+
+    def __init__(self, *args: object, source: BatchedIDSource | None = None, **kwargs: object) -> None:
+        """Initialize the field.
+
+        Args:
+            *args: Positional arguments of BigIntegerField.
+            source: Source of IDs for rows inserted without one; without it the
+                field behaves like a plain BigIntegerField.
+            **kwargs: Keyword arguments of BigIntegerField.
+        """
+
+        self.source = source
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self) -> tuple[str | None, str, list[object], dict[str, object]]:
+        """
+        Field definition for migrations, importing the field from its public module.
+        """
+
+        name, _, args, kwargs = super().deconstruct()
+        return name, "snowflake_id_toolkit.db.SnowflakeIDField", args, kwargs
+
+    def get_pk_value_on_save(self, instance: models.Model) -> object:
+        """
+        Primary key of a row inserted without one, drawn from the source.
+        """
+
+        if self.source is not None:
+            return self.source()
+
+        return super().get_pk_value_on_save(instance)
+
+    def pre_save(self, model_instance: models.Model, add: bool) -> object:
+        """
+        Value of the field before saving, drawn from the source for new rows without one.
+        """
+
+        value = getattr(model_instance, self.attname)
+
+        if add and value is None and self.source is not None:
+            value = self.source()
+            setattr(model_instance, self.attname, value)
+
+        return value
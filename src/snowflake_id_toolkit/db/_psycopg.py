@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Sequence
+
+from snowflake_id_toolkit.db._source import BatchedIDSource
+
+try:
+    from psycopg import Cursor, sql
+except ImportError as error:  # pragma: no cover
+    raise ImportError("copy_with_ids() requires psycopg, install snowflake-id-toolkit[psycopg]") from error
+
+
+def copy_with_ids(
+    cursor: Cursor[object],
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[object]],
+    source: BatchedIDSource,
+) -> int:
+    """Bulk load rows with COPY, keying each row with the next ID of a batched source.
+
+    Rows are keyed batch_size rows of the source at a time, with one take() per
+    batch instead of one source call per row.
+
+    Args:
+        cursor: psycopg 3 cursor.
+        table: Table name, optionally schema-qualified with a dot.
+        columns: Columns to fill, the ID column first.
+        rows: Rows of values for the other columns in order, consumed lazily.
+        source: Source of the IDs.
+
+    Returns:
+        Number of rows copied.
+    """
+
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(*table.split(".")),
+        sql.SQL(", ").join([sql.Identifier(column) for column in columns]),
+    )
+    iterator = iter(rows)
+    count = 0
+
+    with cursor.copy(statement) as copy:
+        while chunk := list(itertools.islice(iterator, source.batch_size)):
+            for id_, row in zip(source.take(len(chunk)), chunk, strict=True):
+                copy.write_row((id_, *row))
+
+            count += len(chunk)
+
+    return count
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from snowflake_id_toolkit._config import SnowflakeIDConfig
+
+
+@dataclass(frozen=True)
+class SQLExpressions:
+    """SQL expressions decoding the components of an ID column.
+
+    Attributes:
+        timestamp_ms: Unix timestamp in milliseconds.
+        node_id: Node ID.
+        sequence: Sequence number.
+    """
+
+    timestamp_ms: str
+    node_id: str
+    sequence: str
+
+
+def sql_expressions(config: SnowflakeIDConfig, column: str = "id", *, epoch: int = 0) -> SQLExpressions:
+    """Build SQL expressions that decode IDs of a layout inside the database.
+
+    The expressions use only parentheses, +, *, >> and &, so they run on PostgreSQL,
+    MySQL, SQLite and DuckDB alike, e.g. in views, indexes or range filters. Each
+    component is masked after shifting, so IDs that set the top bit and are stored
+    as negative signed 64-bit integers decode correctly.
+
+    Args:
+        config: Bit layout of the IDs.
+        column: SQL expression of the ID, inserted as is, e.g. a quoted column name.
+            Never pass untrusted input.
+        epoch: Custom epoch of the IDs, in generator-specific time units.
+
+    Returns:
+        The expressions of the ID's timestamp, node ID and sequence.
+
+    Raises:
+        ValueError: If the layout is wider than 64 bits or epoch is negative.
+    """
+
+    if config.total_bits > 64:
+        raise ValueError("SQL decoding supports layouts of up to 64 bits")
+
+    if epoch < 0:
+        raise ValueError("Epoch must not be negative")
+
+    timestamp = _component(column, config.timestamp_shift, config.max_timestamp)
+
+    if epoch:
+        timestamp = f"({timestamp} + {epoch})"
+
+    if config.time_step_ms != 1:
+        timestamp = f"({timestamp} * {config.time_step_ms})"
+
+    return SQLExpressions(
+        timestamp_ms=timestamp,
+        node_id=_component(column, config.node_id_shift, config.max_node_id),
+        sequence=_component(column, 0, config.max_sequence),
+    )
+
+
+def _component(column: str, shift: int, mask: int) -> str:
+    """
+    Expression of the component at shift, mask wide.
+    """
+
+    if shift:
+        return f"(({column} >> {shift}) & {mask})"
+
+    return f"({column} & {mask})"
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+from snowflake_id_toolkit.db._source import BatchedIDSource
+
+try:
+    from sqlalchemy import BigInteger, Column
+except ImportError as error:  # pragma: no cover
+    raise ImportError("snowflake_id_column() requires SQLAlchemy, install snowflake-id-toolkit[sqlalchemy]") from error
+
+
+def snowflake_id_column(source: BatchedIDSource, name: str | None = None, **kwargs: Any) -> Column[int]:  # noqa: ANN401
+    """SQLAlchemy BigInteger primary key column whose default draws from a batched ID source.
+
+    Rows inserted without an ID, including executemany-style bulk inserts, get the
+    next ID of the source, a deque pop instead of a generator call per row.
+
+    Args:
+        source: Source of IDs for rows inserted without one.
+        name: Column name, or None to take the attribute name in declarative models.
+        **kwargs: Further Column arguments, e.g. primary_key=False for secondary keys.
+
+    Returns:
+        The column.
+    """
+
+    kwargs.setdefault("primary_key", True)
+    kwargs.setdefault("autoincrement", False)
+
+    if name is None:
+        return Column(BigInteger, default=source, **kwargs)
+
+    return Column(name, BigInteger, default=source, **kwargs)
@@ -0,0 +1,7 @@
+from snowflake_id_toolkit.server._client import SnowflakeIDClient
+from snowflake_id_toolkit.server._server import SnowflakeIDServer
+
+__all__ = (
+    "SnowflakeIDClient",
+    "SnowflakeIDServer",
+)
@@ -0,0 +1,70 @@
+"""
+Run an ID server: python -m snowflake_id_toolkit.server
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Sequence
+
+from snowflake_id_toolkit._exceptions import SnowflakeIDToolkitError
+from snowflake_id_toolkit._layouts import LAYOUTS
+from snowflake_id_toolkit.server._server import SnowflakeIDServer
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ID server until interrupted.
+
+    Args:
+        argv: Command-line arguments without the program name (default: sys.argv[1:]).
+
+    Returns:
+        Process exit code.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m snowflake_id_toolkit.server",
+        description="Serve snowflake IDs over a Unix socket or TCP.",
+    )
+    listen = parser.add_mutually_exclusive_group(required=True)
+    listen.add_argument("--unix", metavar="PATH", help="Unix socket path to listen on")
+    listen.add_argument("--port", type=int, help="TCP port to listen on")
+    parser.add_argument("--host", help="TCP host to listen on (default: all interfaces)")
+    parser.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        default="twitter",
+        help="ID bit layout (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--epoch",
+        type=int,
+        default=0,
+        help="custom epoch in layout time units, 10 ms for sonyflake, 1 ms otherwise (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--node-id",
+        type=int,
+        action="append",
+        dest="node_ids",
+        help="node ID owned by the server, repeat for several (default: 0)",
+    )
+    parser.add_argument("--max-count", type=int, default=1 << 16, help="maximum IDs per request (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    generator_cls, _ = LAYOUTS[args.layout]
+
+    try:
+        server = SnowflakeIDServer(generator_cls, args.node_ids or [0], epoch=args.epoch, max_count=args.max_count)
+        asyncio.run(server.serve(args.unix if args.unix is not None else (args.host, args.port)))
+    except (ValueError, OSError, SnowflakeIDToolkitError) as exc:
+        sys.stderr.write(f"{parser.prog}: error: {exc}\n")
+        return 1
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import os
+import queue
+import socket
+import threading
+from collections import deque
+from contextlib import suppress
+from types import TracebackType
+from typing import Generic
+
+from snowflake_id_toolkit._exceptions import (
+    CopiedGeneratorError,
+    LastGenerationTimestampIsGreaterError,
+    MaxTimestampHasReachedError,
+    SnowflakeIDToolkitError,
+)
+from snowflake_id_toolkit._generator import TID
+from snowflake_id_toolkit.server import _protocol as protocol
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class SnowflakeIDClient(Generic[TID]):
+    """Client of a SnowflakeIDServer, prefetching IDs in blocks.
+
+    generate_next_id() takes IDs from a local block; a background thread fetches
+    the next block once half of the current one is used up. Requests go over a
+    pool of connections, so threads calling generate_ids() do not queue behind
+    each other.
+
+    IDs are unique and increasing within a block. Blocks may come from different
+    server generators, so IDs across blocks are not ordered.
+
+    Example:
+        >>> with SnowflakeIDClient(
+        ...     TwitterSnowflakeID,
+        ...     "/run/snowflake-id.sock",
+        ... ) as client:
+        ...     client.generate_next_id()
+    """
+
+    def __init__(
+        self,
+        id_cls: type[TID],
+        address: str | os.PathLike[str] | tuple[str, int],
+        *,
+        block_size: int = 4096,
+        pool_size: int = 4,
+        timeout: float | None = 5.0,
+    ) -> None:
+        """Connect to the server and fetch the first block.
+
+        Args:
+            id_cls: ID class of the layout the server generates.
+            address: Unix socket path, or (host, port) of a TCP server.
+            block_size: Number of IDs fetched per block.
+            pool_size: Maximum number of idle connections kept open.
+            timeout: Socket timeout in seconds, None to block indefinitely.
+
+        Raises:
+            ValueError: If a parameter is out of valid range or the server
+                generates a different layout.
+            OSError: If the server cannot be reached.
+        """
+
+        if block_size <= 0:
+            raise ValueError("Block size must be positive")
+
+        if pool_size <= 0:
+            raise ValueError("Pool size must be positive")
+
+        self._id_cls = id_cls
+        self._address = address if isinstance(address, tuple) else os.fspath(address)
+        self._block_size = block_size
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._idle: queue.SimpleQueue[socket.socket] = queue.SimpleQueue()
+
+        config, self._epoch, self._max_count = protocol.unpack_info(self._request(bytes([protocol.REQUEST_INFO])))
+
+        if config != id_cls._config:  # noqa: SLF001
+            self._close_idle()
+            raise ValueError(f"Server generates {config}, which does not match {id_cls.__name__}")
+
+        self._block: deque[TID] = deque(self.generate_ids(block_size))
+
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="snowflake-id-prefetch", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def epoch(self) -> int:
+        """
+        Custom epoch of the server's generators, in generator-specific time units.
+        """
+
+        return self._epoch
+
+    def generate_next_id(self) -> TID:
+        """Take the next ID from the local block.
+
+        Returns:
+            A unique SnowflakeID instance.
+
+        Raises:
+            MaxTimestampHasReachedError: If the block is empty and the server's timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If the block is empty and the server's clock moved backwards.
+            CopiedGeneratorError: If the block is empty and the server's generator is a copy.
+            OSError: If the block is empty and the server cannot be reached.
+        """
+
+        block = self._block
+
+        try:
+            snowflake_id = block.popleft()
+        except IndexError:
+            ids = self.generate_ids(self._block_size)
+            block.extend(ids[1:])
+            return ids[0]
+
+        if len(block) == self._block_size // 2:
+            self._wakeup.set()
+
+        return snowflake_id
+
+    def generate_ids(self, count: int) -> list[TID]:
+        """Fetch a batch of unique snowflake IDs from the server.
+
+        Batches larger than the server's per-request limit are fetched in several requests.
+
+        Args:
+            count: Number of IDs to fetch.
+
+        Returns:
+            A list of count unique SnowflakeID instances, increasing within each request.
+
+        Raises:
+            ValueError: If count is negative.
+            MaxTimestampHasReachedError: If the server's timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If the server's clock moved backwards.
+            CopiedGeneratorError: If the server's generator is a copy.
+            OSError: If the server cannot be reached.
+        """
+
+        if count < 0:
+            raise ValueError("Count must not be negative")
+
+        id_cls = self._id_cls
+        byte_length = id_cls._config.byte_length  # noqa: SLF001
+        ids: list[TID] = []
+
+        while count:
+            size = min(count, self._max_count)
+            data = self._request(bytes([protocol.REQUEST_IDS]) + protocol.COUNT.pack(size))
+            ids.extend(map(id_cls, protocol.unpack_ids(data, byte_length)))
+            count -= size
+
+        return ids
+
+    def close(self) -> None:
+        """Stop prefetching and close idle connections.
+
+        IDs left in the block are still handed out, after that every request
+        opens a new connection.
+        """
+
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join()
+        self._close_idle()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+
+            if self._stopped.is_set():
+                return
+
+            self._wakeup.clear()
+
+            # Errors reach callers through the synchronous path once the block runs empty
+            with suppress(SnowflakeIDToolkitError, OSError):
+                self._block.extend(self.generate_ids(self._block_size))
+
+    def _close_idle(self) -> None:
+        with suppress(queue.Empty):
+            while True:
+                self._idle.get_nowait().close()
+
+    def _request(self, payload: bytes) -> bytes:
+        """Send a request and return the payload of a successful response.
+
+        Raises:
+            ValueError: If the server rejects the request.
+            MaxTimestampHasReachedError: If the server's timestamp exceeds max representable.
+            LastGenerationTimestampIsGreaterError: If the server's clock moved backwards.
+            CopiedGeneratorError: If the server's generator is a copy, e.g. in a forked server.
+            OSError: If the server cannot be reached.
+        """
+
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+
+        try:
+            connection.sendall(protocol.frame(payload))
+            (length,) = protocol.HEADER.unpack(_receive(connection, protocol.HEADER.size))
+            response = _receive(connection, length)
+        except BaseException:
+            connection.close()
+            raise
+
+        if self._idle.qsize() < self._pool_size:
+            self._idle.put(connection)
+        else:
+            connection.close()
+
+        status, body = response[0], response[1:]
+
+        if status == protocol.STATUS_OK:
+            return body
+
+        if status == protocol.STATUS_MAX_TIMESTAMP_HAS_REACHED:
+            raise MaxTimestampHasReachedError
+
+        if status == protocol.STATUS_LAST_GENERATION_TIMESTAMP_IS_GREATER:
+            raise LastGenerationTimestampIsGreaterError
+
+        if status == protocol.STATUS_COPIED_GENERATOR:
+            raise CopiedGeneratorError
+
+        raise ValueError(f"Server rejected request: {body.decode(errors='replace')}")
+
+    def _connect(self) -> socket.socket:
+        if isinstance(self._address, str):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self._timeout)
+
+            try:
+                connection.connect(self._address)
+            except BaseException:
+                connection.close()
+                raise
+
+            return connection
+
+        connection = socket.create_connection(self._address, timeout=self._timeout)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection
+
+
+def _receive(connection: socket.socket, size: int) -> bytes:
+    """
+    Read exactly size bytes.
+    """
+
+    data = bytearray()
+
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+
+        if not chunk:
+            raise ConnectionError("ID server closed the connection")
+
+        data += chunk
+
+    return bytes(data)
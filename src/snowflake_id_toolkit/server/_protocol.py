@@ -0,0 +1,99 @@
+"""
+Wire protocol of the ID server.
+
+Every message is a frame: a 4-byte big-endian payload length followed by the payload.
+
+Request payloads start with a 1-byte request type:
+    INFO: no arguments.
+    IDS: 4-byte big-endian number of IDs.
+
+Response payloads start with a 1-byte status:
+    OK to INFO: timestamp bits, node ID bits, sequence bits, total bits (2 bytes each),
+        time step in milliseconds (4 bytes), epoch (8 bytes) and maximum number
+        of IDs per request (4 bytes), all big-endian.
+    OK to IDS: the IDs, config.byte_length bytes each, big-endian.
+    Any other status: a UTF-8 error message.
+"""
+
+import struct
+from collections.abc import Sequence
+
+from snowflake_id_toolkit._config import SnowflakeIDConfig
+
+HEADER = struct.Struct(">I")
+COUNT = struct.Struct(">I")
+INFO = struct.Struct(">HHHHIQI")
+
+# Largest request payload the server accepts
+MAX_REQUEST_SIZE = 64
+
+REQUEST_INFO = 0
+REQUEST_IDS = 1
+
+STATUS_OK = 0
+STATUS_MAX_TIMESTAMP_HAS_REACHED = 1
+STATUS_LAST_GENERATION_TIMESTAMP_IS_GREATER = 2
+STATUS_BAD_REQUEST = 3
+STATUS_COPIED_GENERATOR = 4
+
+
+def frame(payload: bytes) -> bytes:
+    """
+    Prefix payload with its length.
+    """
+
+    return HEADER.pack(len(payload)) + payload
+
+
+def pack_info(config: SnowflakeIDConfig, epoch: int, max_count: int) -> bytes:
+    """
+    Encode the layout and epoch of a server's generators and its per-request limit.
+    """
+
+    return INFO.pack(
+        config.timestamp_bits,
+        config.node_id_bits,
+        config.sequence_bits,
+        config.total_bits,
+        config.time_step_ms,
+        epoch,
+        max_count,
+    )
+
+
+def unpack_info(data: bytes) -> tuple[SnowflakeIDConfig, int, int]:
+    """
+    Decode the layout and epoch of a server's generators and its per-request limit.
+    """
+
+    timestamp_bits, node_id_bits, sequence_bits, total_bits, time_step_ms, epoch, max_count = INFO.unpack(data)
+    config = SnowflakeIDConfig(timestamp_bits, node_id_bits, sequence_bits, time_step_ms, total_bits)
+    return config, epoch, max_count
+
+
+def pack_ids(ids: Sequence[int], byte_length: int) -> bytes:
+    """
+    Encode IDs as big-endian values, byte_length bytes each.
+    """
+
+    if byte_length == 8:
+        return struct.pack(f">{len(ids)}Q", *ids)
+
+    return b"".join([id_.to_bytes(byte_length, "big") for id_ in ids])
+
+
+def unpack_ids(data: bytes, byte_length: int) -> list[int]:
+    """
+    Decode big-endian values, byte_length bytes each.
+
+    Raises:
+        ValueError: If data length is not a multiple of byte_length.
+    """
+
+    if len(data) % byte_length:
+        raise ValueError(f"ID data length must be a multiple of {byte_length} bytes")
+
+    if byte_length == 8:
+        return list(struct.unpack(f">{len(data) // 8}Q", data))
+
+    return [int.from_bytes(data[i : i + byte_length], "big") for i in range(0, len(data), byte_length)]
@@ -0,0 +1,170 @@
+import asyncio
+import itertools
+import os
+from collections.abc import Iterable
+from contextlib import suppress
+from typing import Generic
+
+from snowflake_id_toolkit._exceptions import (
+    CopiedGeneratorError,
+    LastGenerationTimestampIsGreaterError,
+    MaxTimestampHasReachedError,
+)
+from snowflake_id_toolkit._generator import TID, SnowflakeIDGenerator
+from snowflake_id_toolkit.server import _protocol as protocol
+
+
+class SnowflakeIDServer(Generic[TID]):
+    """Asyncio server handing out IDs of generators it owns.
+
+    Owns one generator per node ID and serves batched ID requests over a
+    Unix socket or TCP, see _protocol for the wire format. Requests are spread
+    round-robin over the generators; every response is a block of increasing
+    IDs from a single generator. IDs are generated in the default executor, so
+    requests that wait for the next tick do not block the event loop.
+
+    Example:
+        >>> server = SnowflakeIDServer(
+        ...     TwitterSnowflakeIDGenerator,
+        ...     [0, 1],
+        ...     epoch=1288834974657,
+        ... )
+        >>> asyncio.run(server.serve("/run/snowflake-id.sock"))
+    """
+
+    def __init__(
+        self,
+        generator_cls: type[SnowflakeIDGenerator[TID]],
+        node_ids: Iterable[int] = (0,),
+        *,
+        epoch: int = 0,
+        max_count: int = 1 << 16,
+    ) -> None:
+        """Initialize the server's generators.
+
+        Args:
+            generator_cls: Generator class of the layout to serve.
+            node_ids: Distinct node IDs, one generator per node ID.
+            epoch: Custom epoch shared by all generators.
+            max_count: Maximum number of IDs per request.
+
+        Raises:
+            ValueError: If node_ids is empty, contains duplicates or out-of-range values,
+                or if max_count is not positive.
+            MaxTimestampHasReachedError: If current time exceeds max representable.
+        """
+
+        node_ids = tuple(node_ids)
+
+        if not node_ids:
+            raise ValueError("Server must own at least one node ID")
+
+        if len(set(node_ids)) != len(node_ids):
+            raise ValueError("Node IDs must be distinct")
+
+        if max_count <= 0:
+            raise ValueError("Max count must be positive")
+
+        self._generators = tuple(generator_cls(node_id, epoch=epoch) for node_id in node_ids)
+        self._next_generator = itertools.cycle(self._generators).__next__
+        self._max_count = max_count
+        self._info = protocol.pack_info(self._generators[0].config, epoch, max_count)
+
+    @property
+    def generators(self) -> tuple[SnowflakeIDGenerator[TID], ...]:
+        """
+        Generators serving requests, in node ID order as given.
+        """
+
+        return self._generators
+
+    async def start(self, address: str | os.PathLike[str] | tuple[str | None, int]) -> asyncio.Server:
+        """Start listening on a Unix socket or TCP.
+
+        Args:
+            address: Unix socket path, or (host, port) to listen on TCP. A None host
+                listens on all interfaces, port 0 picks a free port.
+
+        Returns:
+            The listening asyncio server.
+        """
+
+        if isinstance(address, tuple):
+            host, port = address
+            return await asyncio.start_server(self._handle, host, port)
+
+        return await asyncio.start_unix_server(self._handle, address)
+
+    async def serve(self, address: str | os.PathLike[str] | tuple[str | None, int]) -> None:
+        """Serve requests on a Unix socket or TCP until cancelled.
+
+        Args:
+            address: Unix socket path, or (host, port) to listen on TCP.
+        """
+
+        server = await self.start(address)
+
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(protocol.HEADER.size)
+                except asyncio.IncompleteReadError:
+                    # Client closed the connection between requests
+                    break
+
+                (length,) = protocol.HEADER.unpack(header)
+
+                if length > protocol.MAX_REQUEST_SIZE:
+                    break
+
+                writer.write(protocol.frame(await self._respond(await reader.readexactly(length))))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, request: bytes) -> bytes:
+        """
+        Build the response payload to a request payload.
+        """
+
+        if request == bytes([protocol.REQUEST_INFO]):
+            return bytes([protocol.STATUS_OK]) + self._info
+
+        if len(request) != 1 + protocol.COUNT.size or request[0] != protocol.REQUEST_IDS:
+            return _error(protocol.STATUS_BAD_REQUEST, "Unknown request")
+
+        (count,) = protocol.COUNT.unpack_from(request, 1)
+
+        if not 0 < count <= self._max_count:
+            return _error(protocol.STATUS_BAD_REQUEST, f"Count must be between 1 and {self._max_count}")
+
+        return await asyncio.get_running_loop().run_in_executor(None, _generate, self._next_generator(), count)
+
+
+def _generate(generator: SnowflakeIDGenerator[TID], count: int) -> bytes:
+    """
+    Generate and encode a block of IDs, or an error payload. Runs in an executor thread.
+    """
+
+    try:
+        ids = generator.generate_raw_ids(count)
+    except MaxTimestampHasReachedError as exc:
+        return _error(protocol.STATUS_MAX_TIMESTAMP_HAS_REACHED, str(exc))
+    except LastGenerationTimestampIsGreaterError as exc:
+        return _error(protocol.STATUS_LAST_GENERATION_TIMESTAMP_IS_GREATER, str(exc))
+    except CopiedGeneratorError as exc:
+        return _error(protocol.STATUS_COPIED_GENERATOR, str(exc))
+
+    return bytes([protocol.STATUS_OK]) + protocol.pack_ids(ids, generator.config.byte_length)
+
+
+def _error(status: int, message: str) -> bytes:
+    return bytes([status]) + message.encode()
@@ -0,0 +1,9 @@
+from snowflake_id_toolkit.wide._config import WIDE_SNOWFLAKE_CONFIG
+from snowflake_id_toolkit.wide._generator import WideSnowflakeIDGenerator
+from snowflake_id_toolkit.wide._id import WideSnowflakeID
+
+__all__ = (
+    "WIDE_SNOWFLAKE_CONFIG",
+    "WideSnowflakeID",
+    "WideSnowflakeIDGenerator",
+)
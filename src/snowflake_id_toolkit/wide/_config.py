@@ -0,0 +1,11 @@
+from snowflake_id_toolkit._config import SnowflakeIDConfig
+
+# Wide Snowflake ID configuration
+# Bit layout (128 bits total):
+#     [48 bits timestamp][16 bits node ID][64 bits sequence]
+WIDE_SNOWFLAKE_CONFIG = SnowflakeIDConfig(
+    timestamp_bits=48,
+    node_id_bits=16,
+    sequence_bits=64,
+    total_bits=128,
+)
@@ -0,0 +1,31 @@
+from snowflake_id_toolkit._generator import SnowflakeIDGenerator
+from snowflake_id_toolkit.wide._config import WIDE_SNOWFLAKE_CONFIG
+from snowflake_id_toolkit.wide._id import WideSnowflakeID
+
+
+class WideSnowflakeIDGenerator(SnowflakeIDGenerator[WideSnowflakeID]):
+    """Wide Snowflake ID generator.
+
+    Generates unsigned 128-bit integers that are roughly time-sortable.
+    The 64-bit sequence never runs out within a millisecond in practice,
+    so a single node can sustain any throughput without sharding generation
+    across several node IDs.
+
+    Bit layout (128 bits total):
+        [48 bits timestamp][16 bits node ID][64 bits sequence]
+
+    Capacity:
+        - ~8,900 years of timestamps (from epoch)
+        - 65,536 unique nodes (2^16)
+        - 2^64 IDs per millisecond per node
+
+    Example:
+        >>> generator = WideSnowflakeIDGenerator(
+        ...     node_id=0, epoch=1735689600000
+        ... )
+        >>> generator.generate_next_id()
+    """
+
+    _config = WIDE_SNOWFLAKE_CONFIG
+
+    _id_cls = WideSnowflakeID
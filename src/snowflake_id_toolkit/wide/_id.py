@@ -0,0 +1,15 @@
+from snowflake_id_toolkit._id import SnowflakeID
+from snowflake_id_toolkit.wide._config import WIDE_SNOWFLAKE_CONFIG
+
+
+class WideSnowflakeID(SnowflakeID):
+    """Wide Snowflake ID.
+
+    A 128-bit integer ID that encodes timestamp, node ID, and sequence number.
+    Byte and text encodings are 16 bytes wide, the same size as a UUID.
+
+    Bit layout (128 bits total):
+        [48 bits timestamp][16 bits node ID][64 bits sequence]
+    """
+
+    _config = WIDE_SNOWFLAKE_CONFIG
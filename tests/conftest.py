@@ -4,4 +4,5 @@ pytest_plugins = [
     "tests.fixtures.configs",
     "tests.fixtures.generators",
     "tests.fixtures.ids",
+    "tests.fixtures.servers",
 ]
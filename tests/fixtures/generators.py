@@ -3,6 +3,7 @@ import pytest
 from snowflake_id_toolkit.instagram import InstagramSnowflakeIDGenerator
 from snowflake_id_toolkit.sony import SonyflakeIDGenerator
 from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+from snowflake_id_toolkit.wide import WideSnowflakeIDGenerator
 
 
 @pytest.fixture
@@ -23,6 +24,12 @@ def sonyflake_generator() -> SonyflakeIDGenerator:
     return SonyflakeIDGenerator(node_id=0)
 
 
+@pytest.fixture
+def wide_generator() -> WideSnowflakeIDGenerator:
+    """Create a WideSnowflakeIDGenerator with node_id=0."""
+    return WideSnowflakeIDGenerator(node_id=0)
+
+
 @pytest.fixture
 def twitter_generators_multi_node() -> list[TwitterSnowflakeIDGenerator]:
     """Create multiple TwitterSnowflakeIDGenerator instances with node_ids 3, 4, 5."""
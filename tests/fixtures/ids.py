@@ -3,6 +3,7 @@ import pytest
 from snowflake_id_toolkit.instagram import InstagramSnowflakeID, InstagramSnowflakeIDGenerator
 from snowflake_id_toolkit.sony import SonyflakeID, SonyflakeIDGenerator
 from snowflake_id_toolkit.twitter import TwitterSnowflakeID, TwitterSnowflakeIDGenerator
+from snowflake_id_toolkit.wide import WideSnowflakeID, WideSnowflakeIDGenerator
 
 
 @pytest.fixture
@@ -21,3 +22,9 @@ def instagram_id(instagram_generator: InstagramSnowflakeIDGenerator) -> Instagra
 def sonyflake_id(sonyflake_generator: SonyflakeIDGenerator) -> SonyflakeID:
     """Create a sample SonyflakeID."""
     return sonyflake_generator.generate_next_id()
+
+
+@pytest.fixture
+def wide_id(wide_generator: WideSnowflakeIDGenerator) -> WideSnowflakeID:
+    """Create a sample WideSnowflakeID."""
+    return wide_generator.generate_next_id()
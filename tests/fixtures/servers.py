@@ -0,0 +1,63 @@
+import asyncio
+import os
+import tempfile
+import threading
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from snowflake_id_toolkit.server import SnowflakeIDServer
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID, TwitterSnowflakeIDGenerator
+
+
+@contextmanager
+def serving(
+    server: SnowflakeIDServer[TwitterSnowflakeID],
+    address: str | os.PathLike[str] | tuple[str | None, int],
+) -> Iterator[asyncio.Server]:
+    """
+    Run the server in a background event loop, yield the listening asyncio server.
+    """
+
+    loop = asyncio.new_event_loop()
+    listening = loop.run_until_complete(server.start(address))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    async def shutdown() -> None:
+        listening.close()
+        handlers = asyncio.all_tasks() - {asyncio.current_task()}
+        for handler in handlers:
+            handler.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+
+    try:
+        yield listening
+    finally:
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+@pytest.fixture
+def id_server() -> SnowflakeIDServer[TwitterSnowflakeID]:
+    """Create a Twitter layout server owning node IDs 1 and 2."""
+    return SnowflakeIDServer(TwitterSnowflakeIDGenerator, [1, 2], epoch=1288834974657, max_count=1000)
+
+
+@pytest.fixture
+def id_server_path(id_server: SnowflakeIDServer[TwitterSnowflakeID]) -> Generator[str]:
+    """
+    Run the server on a Unix socket, yield the socket path.
+    """
+
+    # Unix socket paths are limited to about 100 characters, too short for pytest's tmp_path
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "ids.sock")
+
+        with serving(id_server, path):
+            yield path
@@ -0,0 +1,73 @@
+from collections.abc import Generator
+
+import pytest
+
+django = pytest.importorskip("django")
+
+from django.conf import settings  # noqa: E402
+
+if not settings.configured:
+    settings.configure(DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}})
+    django.setup()
+
+from django.db import connection, models  # noqa: E402
+
+from snowflake_id_toolkit.db import BatchedIDSource, SnowflakeIDField  # noqa: E402
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator  # noqa: E402
+
+source = BatchedIDSource(TwitterSnowflakeIDGenerator(node_id=5), batch_size=64)
+
+
+class Order(models.Model):  # type: ignore[misc]
+    id = SnowflakeIDField(primary_key=True, source=source)
+    external_id = SnowflakeIDField(null=True, source=source)
+    name = models.CharField(max_length=20)
+
+    class Meta:
+        app_label = "snowflake_id_toolkit_tests"
+
+
+@pytest.fixture
+def order_table() -> Generator[None]:
+    with connection.schema_editor() as editor:
+        editor.create_model(Order)
+
+    yield
+
+    with connection.schema_editor() as editor:
+        editor.delete_model(Order)
+
+
+@pytest.mark.usefixtures("order_table")
+def test_save_draws_primary_key() -> None:
+    order = Order(name="first")
+    order.save()
+
+    assert order.pk is not None
+    assert order.external_id > order.pk
+    assert Order.objects.get(pk=order.pk).name == "first"
+
+
+@pytest.mark.usefixtures("order_table")
+def test_bulk_create_draws_keys() -> None:
+    orders = Order.objects.bulk_create([Order(name=str(i)) for i in range(1000)])
+    ids = [order.pk for order in orders]
+
+    assert len(set(ids)) == 1000
+    assert sorted(Order.objects.values_list("pk", flat=True)) == sorted(ids)
+    assert {TwitterSnowflakeIDGenerator(node_id=0).id_type(id_).node_id() for id_ in ids} == {5}
+
+
+@pytest.mark.usefixtures("order_table")
+def test_explicit_value_is_kept() -> None:
+    Order.objects.create(pk=42, external_id=7, name="explicit")
+
+    assert Order.objects.get(pk=42).external_id == 7
+
+
+def test_deconstruct_leaves_out_source() -> None:
+    _, path, args, kwargs = SnowflakeIDField(primary_key=True, source=source).deconstruct()
+
+    assert path == "snowflake_id_toolkit.db.SnowflakeIDField"
+    assert args == []
+    assert kwargs == {"primary_key": True}
@@ -0,0 +1,68 @@
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+pytest.importorskip("psycopg")
+
+from snowflake_id_toolkit.db import BatchedIDSource, copy_with_ids
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+
+
+class FakeCopy:
+    def __init__(self) -> None:
+        self.rows: list[tuple[Any, ...]] = []
+
+    def write_row(self, row: Sequence[object]) -> None:
+        self.rows.append(tuple(row))
+
+
+class FakeCursor:
+    """
+    Records the COPY statement and rows a psycopg cursor would send.
+    """
+
+    def __init__(self) -> None:
+        self.statement: Any = None
+        self.copy_object = FakeCopy()
+
+    @contextmanager
+    def copy(self, statement: object) -> Iterator[FakeCopy]:
+        self.statement = statement
+        yield self.copy_object
+
+
+def test_copy_with_ids_keys_rows() -> None:
+    source = BatchedIDSource(TwitterSnowflakeIDGenerator(node_id=5), batch_size=100)
+    cursor = FakeCursor()
+
+    count = copy_with_ids(
+        cursor,  # type: ignore[arg-type]
+        "public.events",
+        ["event_id", "name", "payload"],
+        ((str(i), i * 2) for i in range(250)),
+        source,
+    )
+
+    ids = [row[0] for row in cursor.copy_object.rows]
+
+    assert count == 250
+    assert cursor.statement.as_string() == 'COPY "public"."events" ("event_id", "name", "payload") FROM STDIN'
+    assert [row[1:] for row in cursor.copy_object.rows] == [(str(i), i * 2) for i in range(250)]
+    assert ids == sorted(set(ids))
+
+
+def test_copy_with_ids_no_rows() -> None:
+    cursor = FakeCursor()
+
+    count = copy_with_ids(
+        cursor,  # type: ignore[arg-type]
+        "events",
+        ["id"],
+        [],
+        BatchedIDSource(TwitterSnowflakeIDGenerator(node_id=5)),
+    )
+
+    assert count == 0
+    assert cursor.copy_object.rows == []
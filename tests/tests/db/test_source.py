@@ -0,0 +1,92 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from snowflake_id_toolkit.db import BatchedIDSource
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+
+
+def test_source_draws_batches() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=3)
+    source = BatchedIDSource(generator, batch_size=100)
+
+    ids = [source() for _ in range(250)]
+
+    assert ids == sorted(set(ids))
+    assert all(type(id_) is int for id_ in ids)
+    assert {generator.id_type(id_).node_id() for id_ in ids} == {3}
+    assert len(source._buffer) == 50  # noqa: SLF001
+
+
+def test_take_drains_buffer_first() -> None:
+    source = BatchedIDSource(TwitterSnowflakeIDGenerator(node_id=3), batch_size=100)
+    first = source()
+
+    ids = source.take(1000)
+
+    assert len(ids) == 1000
+    assert ids == sorted(set(ids))
+    assert ids[0] == first + 1
+    assert not source._buffer  # noqa: SLF001
+    assert source.take(0) == []
+
+
+def test_source_discards_stale_batch(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=3)
+    source = BatchedIDSource(generator, batch_size=100, max_staleness_ms=500)
+    first = generator.id_type(source())
+
+    frozen_time.tick(timedelta(milliseconds=400))
+    kept = generator.id_type(source())
+    frozen_time.tick(timedelta(milliseconds=200))
+    fresh = generator.id_type(source())
+
+    assert kept == first + 1
+    assert fresh.timestamp_ms() == first.timestamp_ms() + 600
+    assert len(source._buffer) == 99  # noqa: SLF001
+
+
+def test_take_discards_stale_batch(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=3)
+    source = BatchedIDSource(generator, batch_size=100, max_staleness_ms=500)
+    first = generator.id_type(source())
+
+    frozen_time.tick(timedelta(seconds=1))
+    ids = source.take(10)
+
+    assert generator.id_type(ids[0]).timestamp_ms() == first.timestamp_ms() + 1000
+    assert not source._buffer  # noqa: SLF001
+
+
+def test_source_concurrent_threads() -> None:
+    source = BatchedIDSource(TwitterSnowflakeIDGenerator(node_id=3), batch_size=64)
+    results: list[list[int]] = []
+
+    def worker() -> None:
+        ids = [source() for _ in range(1000)] + source.take(500)
+        results.append(ids)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len({id_ for ids in results for id_ in ids}) == 8 * 1500
+
+
+def test_source_invalid_arguments_raise_error() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=3)
+
+    with pytest.raises(ValueError, match=r"Batch size must be positive"):
+        BatchedIDSource(generator, batch_size=0)
+
+    with pytest.raises(ValueError, match=r"Max staleness must be positive"):
+        BatchedIDSource(generator, max_staleness_ms=0)
+
+    with pytest.raises(ValueError, match=r"Count must not be negative"):
+        BatchedIDSource(generator).take(-1)
@@ -0,0 +1,62 @@
+import sqlite3
+
+import pytest
+
+from snowflake_id_toolkit import SnowflakeID, SnowflakeIDGenerator
+from snowflake_id_toolkit.db import sql_expressions
+from snowflake_id_toolkit.instagram import InstagramSnowflakeIDGenerator
+from snowflake_id_toolkit.sony import SONYFLAKE_CONFIG, SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TWITTER_SNOWFLAKE_CONFIG, TwitterSnowflakeIDGenerator
+from snowflake_id_toolkit.wide import WIDE_SNOWFLAKE_CONFIG
+
+
+def as_signed(value: int) -> int:
+    """
+    Value of a 64-bit ID stored in a signed BIGINT column.
+    """
+
+    return value - (1 << 64) if value >> 63 else value
+
+
+@pytest.mark.parametrize(
+    ("generator", "top_bit_ids"),
+    [
+        (TwitterSnowflakeIDGenerator(node_id=1023, epoch=1288834974657), False),
+        (InstagramSnowflakeIDGenerator(node_id=8191), True),
+        (SonyflakeIDGenerator(node_id=255, epoch=140000000), False),
+    ],
+)
+def test_sql_expressions_match_id_methods(generator: SnowflakeIDGenerator[SnowflakeID], top_bit_ids: bool) -> None:
+    id_cls = generator.id_type
+    config = generator.config
+    ids = [id_cls(value) for value in generator.generate_raw_ids(100)]
+
+    if top_bit_ids:
+        ids.append(id_cls((1 << 64) - 1))
+
+    expressions = sql_expressions(config, '"snowflake id"', epoch=generator.epoch)
+    connection = sqlite3.connect(":memory:")
+    connection.execute('CREATE TABLE events ("snowflake id" INTEGER)')
+    connection.executemany("INSERT INTO events VALUES (?)", [(as_signed(id_),) for id_ in ids])
+
+    rows = connection.execute(
+        f"SELECT {expressions.timestamp_ms}, {expressions.node_id}, {expressions.sequence} FROM events"  # noqa: S608
+    ).fetchall()
+
+    assert rows == [(id_.timestamp_ms(), id_.node_id(), id_.sequence()) for id_ in ids]
+
+
+def test_sql_expressions_text() -> None:
+    expressions = sql_expressions(SONYFLAKE_CONFIG, epoch=5)
+
+    assert expressions.timestamp_ms == "((((id >> 24) & 549755813887) + 5) * 10)"
+    assert expressions.node_id == "((id >> 16) & 255)"
+    assert expressions.sequence == "(id & 65535)"
+
+
+def test_sql_expressions_invalid_arguments_raise_error() -> None:
+    with pytest.raises(ValueError, match=r"SQL decoding supports layouts of up to 64 bits"):
+        sql_expressions(WIDE_SNOWFLAKE_CONFIG)
+
+    with pytest.raises(ValueError, match=r"Epoch must not be negative"):
+        sql_expressions(TWITTER_SNOWFLAKE_CONFIG, epoch=-1)
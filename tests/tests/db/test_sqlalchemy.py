@@ -0,0 +1,48 @@
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import Column, MetaData, String, Table, create_engine, insert, select  # noqa: E402
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session  # noqa: E402
+
+from snowflake_id_toolkit.db import BatchedIDSource, snowflake_id_column  # noqa: E402
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator  # noqa: E402
+
+
+def test_core_bulk_insert_draws_keys() -> None:
+    source = BatchedIDSource(TwitterSnowflakeIDGenerator(node_id=5), batch_size=64)
+    events = Table("events", MetaData(), snowflake_id_column(source, "id"), Column("name", String))
+    engine = create_engine("sqlite://")
+    events.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(insert(events), [{"name": str(i)} for i in range(1000)])
+        ids = connection.scalars(select(events.c.id).order_by(events.c.id)).all()
+
+    assert len(set(ids)) == 1000
+    assert {TwitterSnowflakeIDGenerator(node_id=0).id_type(id_).node_id() for id_ in ids} == {5}
+    assert events.c.id.primary_key
+    assert not events.c.id.autoincrement
+
+
+def test_declarative_model_draws_keys() -> None:
+    source = BatchedIDSource(TwitterSnowflakeIDGenerator(node_id=5))
+
+    class Base(DeclarativeBase):
+        pass
+
+    class User(Base):
+        __tablename__ = "users"
+
+        id: Mapped[int] = snowflake_id_column(source)  # type: ignore[assignment]
+        name = Column(String)
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        users = [User(name="first"), User(name="second")]
+        session.add_all(users)
+        session.commit()
+
+        assert users[0].id < users[1].id
@@ -69,6 +69,11 @@ def test_parse_bytes_decoding() -> None:
     assert parsed_id == 4096
 
 
+def test_parse_bytes_invalid_length() -> None:
+    with pytest.raises(ValueError, match=r"ID must be exactly 8 bytes long"):
+        InstagramSnowflakeID.parse_bytes(b"\x10\x00")
+
+
 # Base16 encoding/decoding tests
 def test_as_base16_encoding(instagram_id: InstagramSnowflakeID) -> None:
     base16 = instagram_id.as_base16()
@@ -0,0 +1,211 @@
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from snowflake_id_toolkit import CopiedGeneratorError, LastGenerationTimestampIsGreaterError, TwitterSnowflakeID
+from snowflake_id_toolkit.server import SnowflakeIDClient, SnowflakeIDServer
+from snowflake_id_toolkit.server import _protocol as protocol
+from snowflake_id_toolkit.server.__main__ import main
+from snowflake_id_toolkit.sony import SonyflakeID
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+from tests.fixtures.servers import serving
+
+
+def request(path: str, payload: bytes) -> bytes:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(protocol.frame(payload))
+        (length,) = protocol.HEADER.unpack(connection.recv(protocol.HEADER.size))
+        data = b""
+        while len(data) < length:
+            data += connection.recv(length - len(data))
+        return data
+
+
+# Server initialization tests
+def test_server_initialization(id_server: SnowflakeIDServer[TwitterSnowflakeID]) -> None:
+    assert [generator.node_id for generator in id_server.generators] == [1, 2]
+    assert all(generator.epoch == 1288834974657 for generator in id_server.generators)
+
+
+def test_server_empty_node_ids_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Server must own at least one node ID"):
+        SnowflakeIDServer(TwitterSnowflakeIDGenerator, [])
+
+
+def test_server_duplicate_node_ids_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Node IDs must be distinct"):
+        SnowflakeIDServer(TwitterSnowflakeIDGenerator, [1, 1])
+
+
+def test_server_invalid_max_count_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Max count must be positive"):
+        SnowflakeIDServer(TwitterSnowflakeIDGenerator, max_count=0)
+
+
+# Protocol tests
+def test_info_request(id_server_path: str) -> None:
+    response = request(id_server_path, bytes([protocol.REQUEST_INFO]))
+
+    assert response[0] == protocol.STATUS_OK
+    assert protocol.unpack_info(response[1:]) == (TwitterSnowflakeID._config, 1288834974657, 1000)  # noqa: SLF001
+
+
+def test_ids_request_served_round_robin(id_server_path: str) -> None:
+    payload = bytes([protocol.REQUEST_IDS]) + protocol.COUNT.pack(3)
+
+    blocks = [request(id_server_path, payload) for _ in range(2)]
+
+    assert all(block[0] == protocol.STATUS_OK for block in blocks)
+    first, second = ([TwitterSnowflakeID(value) for value in protocol.unpack_ids(block[1:], 8)] for block in blocks)
+    assert [id_.node_id() for id_ in first + second] == [1, 1, 1, 2, 2, 2]
+    assert first == sorted(first)
+
+
+@pytest.mark.parametrize(
+    ("payload", "message"),
+    [
+        (bytes([protocol.REQUEST_IDS]) + protocol.COUNT.pack(0), b"Count must be between 1 and 1000"),
+        (bytes([protocol.REQUEST_IDS]) + protocol.COUNT.pack(1001), b"Count must be between 1 and 1000"),
+        (bytes([protocol.REQUEST_IDS]), b"Unknown request"),
+        (b"\x07", b"Unknown request"),
+    ],
+)
+def test_bad_request(id_server_path: str, payload: bytes, message: bytes) -> None:
+    response = request(id_server_path, payload)
+
+    assert response[0] == protocol.STATUS_BAD_REQUEST
+    assert response[1:] == message
+
+
+def test_pack_ids_roundtrip() -> None:
+    assert protocol.unpack_ids(protocol.pack_ids([1, 2, 1 << 63], 8), 8) == [1, 2, 1 << 63]
+    assert protocol.unpack_ids(protocol.pack_ids([1, 1 << 100], 16), 16) == [1, 1 << 100]
+
+
+def test_unpack_ids_invalid_length_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"ID data length must be a multiple of 8 bytes"):
+        protocol.unpack_ids(b"\x00" * 12, 8)
+
+
+# Client tests
+def test_client_generate_next_id(id_server_path: str) -> None:
+    with SnowflakeIDClient(TwitterSnowflakeID, id_server_path, block_size=100) as client:
+        ids = [client.generate_next_id() for _ in range(1000)]
+
+    assert len(set(ids)) == 1000
+    assert all(type(id_) is TwitterSnowflakeID for id_ in ids)
+    assert {id_.node_id() for id_ in ids} == {1, 2}
+    assert client.epoch == 1288834974657
+
+
+def test_client_generate_ids_above_server_limit(id_server_path: str) -> None:
+    with SnowflakeIDClient(TwitterSnowflakeID, id_server_path) as client:
+        ids = client.generate_ids(2500)
+
+    assert len(set(ids)) == 2500
+
+
+def test_client_concurrent_threads(id_server_path: str) -> None:
+    results: list[list[TwitterSnowflakeID]] = []
+
+    with SnowflakeIDClient(TwitterSnowflakeID, id_server_path, block_size=64, pool_size=2) as client:
+
+        def worker() -> None:
+            results.append([client.generate_next_id() for _ in range(500)] + client.generate_ids(100))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len({id_ for ids in results for id_ in ids}) == 8 * 600
+
+
+def test_client_over_tcp(id_server: SnowflakeIDServer[TwitterSnowflakeID]) -> None:
+    with serving(id_server, ("127.0.0.1", 0)) as server:
+        port = server.sockets[0].getsockname()[1]
+
+        with SnowflakeIDClient(TwitterSnowflakeID, ("127.0.0.1", port), block_size=10) as client:
+            assert len({client.generate_next_id() for _ in range(25)}) == 25
+
+
+def test_client_layout_mismatch_raises_error(id_server_path: str) -> None:
+    with pytest.raises(ValueError, match=r"which does not match SonyflakeID"):
+        SnowflakeIDClient(SonyflakeID, id_server_path)
+
+
+def test_client_invalid_block_size_raises_error(id_server_path: str) -> None:
+    with pytest.raises(ValueError, match=r"Block size must be positive"):
+        SnowflakeIDClient(TwitterSnowflakeID, id_server_path, block_size=0)
+
+
+def test_client_server_error_raised(
+    id_server: SnowflakeIDServer[TwitterSnowflakeID],
+    id_server_path: str,
+) -> None:
+    with SnowflakeIDClient(TwitterSnowflakeID, id_server_path, block_size=10) as client:
+        for generator in id_server.generators:
+            generator._state = (generator.get_current_timestamp() + 60_000) << 12  # noqa: SLF001
+
+        with pytest.raises(LastGenerationTimestampIsGreaterError):
+            client.generate_ids(1)
+
+
+def test_client_copied_generator_error_raised(
+    id_server: SnowflakeIDServer[TwitterSnowflakeID],
+    id_server_path: str,
+) -> None:
+    with SnowflakeIDClient(TwitterSnowflakeID, id_server_path, block_size=10) as client:
+        for generator in id_server.generators:
+            generator._invalidate()  # noqa: SLF001
+
+        response = request(id_server_path, bytes([protocol.REQUEST_IDS]) + protocol.COUNT.pack(1))
+
+        assert response[0] == protocol.STATUS_COPIED_GENERATOR
+
+        with pytest.raises(CopiedGeneratorError):
+            client.generate_ids(1)
+
+
+def test_server_keeps_serving_while_generator_waits(
+    id_server: SnowflakeIDServer[TwitterSnowflakeID],
+    id_server_path: str,
+) -> None:
+    waiting = threading.Event()
+    release = threading.Event()
+    blocked = id_server.generators[0]
+    generate_raw_ids = blocked.generate_raw_ids
+
+    def wait_for_release(count: int) -> list[int]:
+        waiting.set()
+        release.wait(5)
+        return generate_raw_ids(count)
+
+    blocked.generate_raw_ids = wait_for_release  # type: ignore[method-assign]
+    slow = threading.Thread(
+        target=request,
+        args=(id_server_path, bytes([protocol.REQUEST_IDS]) + protocol.COUNT.pack(1)),
+    )
+    slow.start()
+
+    try:
+        assert waiting.wait(5)
+        assert request(id_server_path, bytes([protocol.REQUEST_INFO]))[0] == protocol.STATUS_OK
+    finally:
+        release.set()
+        slow.join()
+
+
+def test_client_unreachable_server_raises_error(tmp_path: Path) -> None:
+    with pytest.raises(OSError, match=r"No such file"):
+        SnowflakeIDClient(TwitterSnowflakeID, f"{tmp_path}/missing.sock")
+
+
+# Command tests
+def test_main_invalid_node_id_fails(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--port", "0", "--layout", "sonyflake", "--node-id", "256"]) == 1
+    assert "error: Node ID must be between 0 and 255" in capsys.readouterr().err
@@ -70,6 +70,11 @@ def test_parse_bytes_decoding() -> None:
     assert parsed_id == 4096
 
 
+def test_parse_bytes_invalid_length() -> None:
+    with pytest.raises(ValueError, match=r"ID must be exactly 8 bytes long"):
+        SonyflakeID.parse_bytes(b"\x10\x00")
+
+
 # Base16 encoding/decoding tests
 def test_as_base16_encoding(sonyflake_id: SonyflakeID) -> None:
     base16 = sonyflake_id.as_base16()
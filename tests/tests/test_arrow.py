@@ -0,0 +1,229 @@
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from snowflake_id_toolkit import SnowflakeID  # noqa: E402
+from snowflake_id_toolkit.arrow import convert_ids, id_schema, to_record_batch, to_table, write_parquet  # noqa: E402
+from snowflake_id_toolkit.instagram import InstagramSnowflakeID, InstagramSnowflakeIDGenerator  # noqa: E402
+from snowflake_id_toolkit.sony import SonyflakeID, SonyflakeIDGenerator  # noqa: E402
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID, TwitterSnowflakeIDGenerator  # noqa: E402
+from snowflake_id_toolkit.wide import WideSnowflakeID  # noqa: E402
+
+
+def components(ids: Sequence[SnowflakeID]) -> list[dict[str, object]]:
+    return [
+        {"id": id_, "timestamp": id_.to_datetime(), "node_id": id_.node_id(), "sequence": id_.sequence()} for id_ in ids
+    ]
+
+
+# Schema tests
+def test_id_schema_types() -> None:
+    schema = id_schema(TwitterSnowflakeID)
+
+    assert schema.names == ["id", "timestamp", "node_id", "sequence"]
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("timestamp").type == pa.timestamp("ms", tz="UTC")
+    assert schema.field("node_id").type == pa.int16()
+    assert schema.field("sequence").type == pa.int16()
+    assert id_schema(InstagramSnowflakeID).field("id").type == pa.uint64()
+    assert id_schema(SonyflakeID).field("sequence").type == pa.int32()
+
+
+def test_id_schema_wide_layout_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Arrow export supports layouts of up to 64 bits"):
+        id_schema(WideSnowflakeID)
+
+
+# Decoding tests
+@pytest.mark.parametrize(
+    "generator_cls",
+    [TwitterSnowflakeIDGenerator, InstagramSnowflakeIDGenerator, SonyflakeIDGenerator],
+)
+def test_to_record_batch_matches_id_methods(
+    generator_cls: type[TwitterSnowflakeIDGenerator | InstagramSnowflakeIDGenerator | SonyflakeIDGenerator],
+) -> None:
+    generator = generator_cls(node_id=generator_cls._config.max_node_id)  # noqa: SLF001
+    ids = generator.generate_ids(5000)
+
+    batch = to_record_batch(ids, generator.id_type)
+
+    assert batch.to_pylist() == components(ids)
+
+
+def test_to_record_batch_custom_epoch() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=7, epoch=1288834974657)
+    ids = generator.generate_ids(10)
+
+    bound = to_record_batch(ids, generator.id_type)
+    explicit = to_record_batch([int(id_) for id_ in ids], TwitterSnowflakeID, epoch=1288834974657)
+
+    assert bound == explicit
+    assert bound.column("timestamp")[0].as_py() == ids[0].to_datetime(epoch=1288834974657)
+
+
+def test_to_record_batch_from_arrow_array_and_iterator() -> None:
+    ids = TwitterSnowflakeIDGenerator(node_id=1).generate_ids(100)
+    expected = to_record_batch(ids, TwitterSnowflakeID)
+
+    assert to_record_batch(pa.array(ids, type=pa.uint64()), TwitterSnowflakeID) == expected
+    assert to_record_batch(pa.chunked_array([ids[:50], ids[50:]]), TwitterSnowflakeID) == expected
+    assert to_record_batch(iter(ids), TwitterSnowflakeID) == expected
+
+
+def test_to_record_batch_from_buffer() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+    ids = generator.generate_id_array(100)
+    expected = to_record_batch(list(ids), TwitterSnowflakeID)
+
+    assert to_record_batch(ids, TwitterSnowflakeID) == expected
+    assert to_record_batch(memoryview(ids), TwitterSnowflakeID) == expected
+    assert to_record_batch(array("q", ids), TwitterSnowflakeID) == expected
+    assert to_record_batch(array("I", [1, 2]), TwitterSnowflakeID).column("id").to_pylist() == [1, 2]
+
+
+def test_to_record_batch_empty() -> None:
+    assert to_record_batch([], TwitterSnowflakeID).num_rows == 0
+
+
+def test_to_record_batch_timestamp_resolution() -> None:
+    id_ = SonyflakeID(123 << 24)
+
+    (row,) = to_record_batch([id_], SonyflakeID).to_pylist()
+
+    assert row["timestamp"] == datetime(1970, 1, 1, 0, 0, 1, 230000, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("ids", "message"),
+    [
+        ([-1], r"IDs must be between 0 and 9223372036854775807"),
+        ([1 << 64], r"IDs must fit into int64"),
+        ([1, None], r"IDs must not be null"),
+    ],
+)
+def test_to_record_batch_invalid_ids_raise_error(ids: list[int | None], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        to_record_batch(ids, TwitterSnowflakeID)
+
+
+# Table tests
+def test_to_table_keeps_chunks() -> None:
+    ids = TwitterSnowflakeIDGenerator(node_id=1).generate_ids(300)
+
+    table = to_table(pa.chunked_array([ids[:100], ids[100:]]), TwitterSnowflakeID)
+
+    assert table.schema == id_schema(TwitterSnowflakeID)
+    assert [len(chunk) for chunk in table.column("id").chunks] == [100, 200]
+    assert table.to_pylist() == components(ids)
+
+
+# Parquet tests
+def test_write_parquet_row_groups(tmp_path: Path) -> None:
+    ids = TwitterSnowflakeIDGenerator(node_id=1).generate_ids(2500)
+    path = tmp_path / "ids.parquet"
+
+    assert write_parquet(iter(ids), TwitterSnowflakeID, path, row_group_size=1000) == 2500
+
+    metadata = pq.read_metadata(path)
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [1000, 1000, 500]
+    assert pq.read_table(path).to_pylist() == components(ids)
+
+
+def test_write_parquet_from_arrow_array(tmp_path: Path) -> None:
+    ids = SonyflakeIDGenerator(node_id=1).generate_ids(10)
+    path = tmp_path / "ids.parquet"
+
+    assert write_parquet(pa.array(ids), SonyflakeID, path, row_group_size=4) == 10
+    assert pq.read_table(path).to_pylist() == components(ids)
+
+
+def test_write_parquet_invalid_row_group_size_raises_error(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"Row group size must be positive"):
+        write_parquet([], TwitterSnowflakeID, tmp_path / "ids.parquet", row_group_size=0)
+
+
+# Conversion tests
+def test_convert_ids_to_coarser_ticks_keeps_order_and_components() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=200, epoch=1288834974657)
+    ids = generator.generate_ids(10_000)
+
+    conversion = convert_ids(array("Q", ids), generator.id_type, SonyflakeID)
+
+    assert conversion.unencodable == 0
+    assert conversion.collisions == 0
+    assert conversion.ids.type == pa.int64()
+
+    converted = [SonyflakeID(id_) for id_ in conversion.ids.to_pylist()]
+    assert converted == sorted(converted)
+    assert [id_.node_id() for id_ in converted] == [200] * 10_000
+    assert [id_.timestamp_ms() // 10 for id_ in converted] == [
+        id_.timestamp_ms(epoch=1288834974657) // 10 for id_ in ids
+    ]
+
+
+def test_convert_ids_spreads_merged_ticks_over_sequence() -> None:
+    ids = [
+        TwitterSnowflakeID((100 << 22) | (1 << 12) | 5),
+        TwitterSnowflakeID((109 << 22) | (1 << 12)),
+        TwitterSnowflakeID((110 << 22) | (1 << 12)),
+    ]
+
+    conversion = convert_ids(ids, TwitterSnowflakeID, SonyflakeID)
+
+    assert [(id_.timestamp_ms(), id_.sequence()) for id_ in map(SonyflakeID, conversion.ids.to_pylist())] == [
+        (100, 5),
+        (100, 9 * 4096),
+        (110, 0),
+    ]
+
+
+def test_convert_ids_shifts_epoch() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1, epoch=1288834974657)
+    old = TwitterSnowflakeID.from_datetime(datetime(2012, 1, 1, tzinfo=timezone.utc), node_id=1, epoch=1288834974657)
+    ids = [old, *generator.generate_ids(100)]
+
+    conversion = convert_ids(ids, generator.id_type, TwitterSnowflakeID, target_epoch=1600000000000)
+
+    assert conversion.unencodable == 1
+    assert conversion.ids[0].as_py() is None
+    assert [TwitterSnowflakeID(id_).to_datetime(epoch=1600000000000) for id_ in conversion.ids[1:].to_pylist()] == [
+        id_.to_datetime(epoch=1288834974657) for id_ in ids[1:]
+    ]
+
+
+def test_convert_ids_reports_unencodable_components() -> None:
+    ids = [
+        InstagramSnowflakeID((1 << 23) | (5000 << 10)),
+        InstagramSnowflakeID((2 << 23) | (5 << 10) | 1000),
+    ]
+
+    conversion = convert_ids(ids, InstagramSnowflakeID, TwitterSnowflakeID)
+
+    assert conversion.unencodable == 1
+    assert conversion.ids.to_pylist() == [None, (2 << 22) | (5 << 12) | 1000]
+
+    wide = convert_ids([(1 << 24) | 40000, 1 << 24], SonyflakeID, TwitterSnowflakeID)
+
+    assert wide.unencodable == 1
+    assert wide.ids.to_pylist() == [None, 10 << 22]
+
+
+def test_convert_ids_reports_collisions() -> None:
+    ids = TwitterSnowflakeIDGenerator(node_id=1).generate_ids(100)
+
+    conversion = convert_ids([ids[50], *ids, ids[10], ids[10]], TwitterSnowflakeID, SonyflakeID)
+
+    assert conversion.collisions == 3
+    assert conversion.unencodable == 0
+    assert convert_ids([], TwitterSnowflakeID, SonyflakeID).collisions == 0
+
+
+def test_convert_ids_wide_layout_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Arrow export supports layouts of up to 64 bits"):
+        convert_ids([1], TwitterSnowflakeID, WideSnowflakeID)
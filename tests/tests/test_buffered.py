@@ -0,0 +1,131 @@
+import gc
+import time
+from datetime import timedelta
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from snowflake_id_toolkit import BufferedSnowflakeIDGenerator, TwitterSnowflakeID
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+
+
+# Initialization tests
+def test_buffer_filled_on_initialization(twitter_generator: TwitterSnowflakeIDGenerator) -> None:
+    with BufferedSnowflakeIDGenerator(twitter_generator, depth=100) as generator:
+        stats = generator.stats
+
+        assert stats.depth == 100
+        assert stats.refills >= 1
+        assert stats.misses == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"depth": 0}, r"Depth must be positive"),
+        ({"depth": 10, "refill_threshold": 10}, r"Refill threshold must be between 0 and 9"),
+        ({"depth": 10, "refill_threshold": -1}, r"Refill threshold must be between 0 and 9"),
+        ({"max_staleness_ms": 0}, r"Max staleness must be positive"),
+        ({"refill_interval_ms": 0}, r"Refill interval must be positive"),
+    ],
+)
+def test_invalid_parameters_raise_error(
+    twitter_generator: TwitterSnowflakeIDGenerator,
+    kwargs: dict[str, int],
+    match: str,
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        BufferedSnowflakeIDGenerator(twitter_generator, **kwargs)
+
+
+# ID generation tests
+def test_generate_next_id_unique_increasing_ids() -> None:
+    with BufferedSnowflakeIDGenerator(TwitterSnowflakeIDGenerator(node_id=12), depth=64) as generator:
+        ids = [generator.generate_next_id() for _ in range(32)]
+
+    assert all(isinstance(id_, TwitterSnowflakeID) for id_ in ids)
+    assert all(id_.node_id() == 12 for id_ in ids)
+    assert ids == sorted(ids)
+    assert len(ids) == len(set(ids))
+
+
+def test_reaching_refill_threshold_wakes_refill_thread(twitter_generator: TwitterSnowflakeIDGenerator) -> None:
+    with BufferedSnowflakeIDGenerator(
+        twitter_generator,
+        depth=10,
+        refill_threshold=5,
+        refill_interval_ms=60_000,
+    ) as generator:
+        for _ in range(5):
+            generator.generate_next_id()
+
+        deadline = time.monotonic() + 5
+        while generator.stats.size < 10 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        stats = generator.stats
+
+    assert stats.size == 10
+    assert stats.refills >= 2
+    assert stats.low_water_mark <= 5
+
+
+def test_empty_buffer_falls_back_to_generator(twitter_generator: TwitterSnowflakeIDGenerator) -> None:
+    generator = BufferedSnowflakeIDGenerator(twitter_generator, depth=3)
+    generator.close()
+
+    ids = [generator.generate_next_id() for _ in range(5)]
+
+    assert len(ids) == len(set(ids)) == 5
+    assert generator.stats.misses == 2
+    assert generator.stats.low_water_mark == 0
+
+
+def test_unclosed_generator_stops_refill_thread_when_collected(
+    twitter_generator: TwitterSnowflakeIDGenerator,
+) -> None:
+    generator = BufferedSnowflakeIDGenerator(twitter_generator, depth=100, refill_interval_ms=1)
+    thread = generator._thread  # noqa: SLF001
+    time.sleep(0.01)
+
+    del generator
+    gc.collect()
+    thread.join(1)
+
+    assert not thread.is_alive()
+
+
+# Staleness tests
+def test_refill_evicts_stale_ids(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = BufferedSnowflakeIDGenerator(
+        SonyflakeIDGenerator(node_id=0),
+        depth=8,
+        max_staleness_ms=100,
+        refill_interval_ms=60_000,
+    )
+    generator.close()
+    stale_ids = [generator.generate_next_id() for _ in range(2)]
+
+    frozen_time.tick(timedelta(milliseconds=110, microseconds=1))
+    generator._refill()  # noqa: SLF001
+    fresh_ids = [generator.generate_next_id() for _ in range(8)]
+
+    assert generator.stats.evicted == 6
+    assert all(id_.timestamp_ms() == stale_ids[0].timestamp_ms() + 110 for id_ in fresh_ids)
+
+
+def test_refill_keeps_ids_within_staleness_bound(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = BufferedSnowflakeIDGenerator(
+        TwitterSnowflakeIDGenerator(node_id=0),
+        depth=8,
+        max_staleness_ms=100,
+        refill_interval_ms=60_000,
+    )
+    generator.close()
+
+    frozen_time.tick(timedelta(milliseconds=100))
+    generator._refill()  # noqa: SLF001
+
+    assert generator.stats.evicted == 0
+    assert generator.stats.size == 8
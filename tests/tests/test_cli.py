@@ -0,0 +1,110 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from snowflake_id_toolkit._cli import main
+from snowflake_id_toolkit.sony import SonyflakeID
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID
+from snowflake_id_toolkit.wide import WideSnowflakeID
+
+
+# Generate command tests
+@pytest.mark.usefixtures("frozen_time")
+def test_generate_text_to_stdout(capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    assert main(["generate", "-n", "3", "--node-id", "7"]) == 0
+
+    ids = [TwitterSnowflakeID(line) for line in capsysbinary.readouterr().out.splitlines()]
+    assert [id_.sequence() for id_ in ids] == [0, 1, 2]
+    assert all(id_.node_id() == 7 for id_ in ids)
+    assert all(id_.timestamp_ms() == 1735689600000 for id_ in ids)
+
+
+def test_generate_binary_to_file(tmp_path: Path) -> None:
+    output = tmp_path / "ids.bin"
+
+    assert main(["generate", "-n", "100000", "-f", "binary", "--layout", "sonyflake", "-o", str(output)]) == 0
+
+    data = output.read_bytes()
+    ids = [SonyflakeID.parse_bytes(data[i : i + 8]) for i in range(0, len(data), 8)]
+    assert len(ids) == len(set(ids)) == 100000
+    assert ids == sorted(ids)
+
+
+def test_generate_base32_to_file(tmp_path: Path) -> None:
+    output = tmp_path / "ids.txt"
+
+    assert main(["generate", "-n", "5", "-f", "base32", "--layout", "wide", "-o", str(output)]) == 0
+
+    ids = [WideSnowflakeID.parse_base32(line) for line in output.read_bytes().splitlines()]
+    assert len(set(ids)) == 5
+
+
+def test_generate_negative_count_fails(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["generate", "-n", "-1"]) == 1
+    assert "error: Count must not be negative" in capsys.readouterr().err
+
+
+def test_generate_invalid_node_id_fails(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["generate", "-n", "1", "--layout", "sonyflake", "--node-id", "256"]) == 1
+    assert "error: Node ID must be between 0 and 255" in capsys.readouterr().err
+
+
+# Decode command tests
+@pytest.mark.parametrize("format_", ["text", "binary", "base32"])
+def test_generate_decode_roundtrip(tmp_path: Path, format_: str) -> None:
+    ids_path = tmp_path / "ids"
+    csv_path = tmp_path / "ids.csv"
+
+    main(["generate", "-n", "10", "-f", format_, "--node-id", "3", "--epoch", "1288834974657", "-o", str(ids_path)])
+    assert main(["decode", "-f", format_, "--epoch", "1288834974657", "-i", str(ids_path), "-o", str(csv_path)]) == 0
+
+    header, *rows = csv_path.read_text().splitlines()
+    assert header == "id,timestamp_ms,node_id,sequence"
+    assert len(rows) == 10
+    for row in rows:
+        id_, timestamp_ms, node_id, sequence = map(int, row.split(","))
+        snowflake_id = TwitterSnowflakeID(id_)
+        assert timestamp_ms == snowflake_id.timestamp_ms(epoch=1288834974657)
+        assert node_id == snowflake_id.node_id() == 3
+        assert sequence == snowflake_id.sequence()
+
+
+def test_decode_jsonl(tmp_path: Path) -> None:
+    ids_path = tmp_path / "ids.txt"
+    ids_path.write_text("2912003932815360000\n\n2912003932815360001\n")
+
+    output = tmp_path / "ids.jsonl"
+    assert main(["decode", "--layout", "sonyflake", "-t", "jsonl", "-i", str(ids_path), "-o", str(output)]) == 0
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert rows == [
+        {"id": 2912003932815360000, "timestamp_ms": 1735689600000, "node_id": 0, "sequence": 0},
+        {"id": 2912003932815360001, "timestamp_ms": 1735689600000, "node_id": 0, "sequence": 1},
+    ]
+
+
+def test_generate_unwritable_output_fails(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["generate", "-n", "1", "-o", str(tmp_path / "missing" / "ids.txt")]) == 1
+    assert "error: [Errno 2] No such file or directory" in capsys.readouterr().err
+
+
+def test_decode_missing_input_fails(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["decode", "-i", str(tmp_path / "missing.txt")]) == 1
+    assert "error: [Errno 2] No such file or directory" in capsys.readouterr().err
+
+
+def test_decode_invalid_text_fails(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    ids_path = tmp_path / "ids.txt"
+    ids_path.write_text("not-an-id\n")
+
+    assert main(["decode", "-i", str(ids_path), "-o", str(tmp_path / "out.csv")]) == 1
+    assert "error: invalid literal for int()" in capsys.readouterr().err
+
+
+def test_decode_truncated_binary_fails(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    ids_path = tmp_path / "ids.bin"
+    ids_path.write_bytes(b"\x00" * 12)
+
+    assert main(["decode", "-f", "binary", "-i", str(ids_path), "-o", str(tmp_path / "out.csv")]) == 1
+    assert "error: Binary input length must be a multiple of 8 bytes" in capsys.readouterr().err
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from snowflake_id_toolkit import SnowflakeID
+from snowflake_id_toolkit.instagram import InstagramSnowflakeID
+from snowflake_id_toolkit.sony import SonyflakeID
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID
+from snowflake_id_toolkit.wide import WideSnowflakeID
+
+ID_CLASSES = [TwitterSnowflakeID, InstagramSnowflakeID, SonyflakeID, WideSnowflakeID]
+
+
+def sample_ids(id_cls: type[SnowflakeID]) -> list[SnowflakeID]:
+    """
+    Edge values and random IDs of every magnitude that fit into the layout's bytes.
+    """
+
+    bits = 8 * id_cls._config.byte_length  # noqa: SLF001
+    rng = random.Random(bits)  # noqa: S311
+    values = [0, 1, (1 << bits) - 1] + [rng.getrandbits(bits) >> rng.randrange(bits) for _ in range(2000)]
+    return [id_cls(value) for value in values]
+
+
+# Round trip tests
+@pytest.mark.parametrize("id_cls", ID_CLASSES)
+def test_str_codecs_match_bytes_codecs(id_cls: type[SnowflakeID]) -> None:
+    for id_ in sample_ids(id_cls):
+        assert id_.as_base16_str() == id_.as_base16().decode()
+        assert id_.as_base32_str() == id_.as_base32().decode()
+        assert id_.as_base64_urlsafe_str() == id_.as_base64_urlsafe().decode()
+
+
+@pytest.mark.parametrize("id_cls", ID_CLASSES)
+@pytest.mark.parametrize("codec", ["base32", "base64_urlsafe", "base62"])
+@pytest.mark.parametrize("padding", [True, False])
+def test_str_codecs_roundtrip(id_cls: type[SnowflakeID], codec: str, padding: bool) -> None:
+    parse = getattr(id_cls, f"parse_{codec}_str")
+
+    for id_ in sample_ids(id_cls):
+        parsed = parse(getattr(id_, f"as_{codec}_str")(padding=padding))
+
+        assert parsed == id_
+        assert type(parsed) is id_cls
+
+
+@pytest.mark.parametrize("id_cls", ID_CLASSES)
+def test_base16_str_roundtrip(id_cls: type[SnowflakeID]) -> None:
+    for id_ in sample_ids(id_cls):
+        assert id_cls.parse_base16_str(id_.as_base16_str()) == id_
+        assert id_cls.parse_base16_str(id_.as_base16_str().lower()) == id_
+
+
+def test_padding_free_encodings() -> None:
+    id_ = TwitterSnowflakeID(7517934317222244352)
+
+    assert id_.as_base32_str() == "NBKRC3QGYAYAA==="
+    assert id_.as_base32_str(padding=False) == "NBKRC3QGYAYAA"
+    assert id_.as_base64_urlsafe_str() == "aFURbgbAMAA="
+    assert id_.as_base64_urlsafe_str(padding=False) == "aFURbgbAMAA"
+    assert id_.as_base62_str() == "8xMDZZigg08"
+    assert TwitterSnowflakeID(61).as_base62_str() == "0000000000z"
+    assert TwitterSnowflakeID(61).as_base62_str(padding=False) == "z"
+    assert TwitterSnowflakeID(0).as_base62_str(padding=False) == "0"
+
+
+def test_base62_str_sorts_like_integers() -> None:
+    ids = sample_ids(TwitterSnowflakeID)
+
+    assert sorted(ids, key=lambda id_: id_.as_base62_str()) == sorted(ids)
+
+
+# Strict parsing tests
+@pytest.mark.parametrize(
+    ("codec", "text", "message"),
+    [
+        ("base16", "0x00000000000001", r"ID must be 16 base16 digits"),
+        ("base16", " 000000000000001", r"ID must be 16 base16 digits"),
+        ("base16", "000000000000_001", r"ID must be 16 base16 digits"),
+        ("base16", "00000000000001", r"ID must be 16 base16 digits"),
+        ("base32", "nbkrc3qgyayaa", r"ID must be 13 base32 characters"),
+        ("base32", "NBKRC3QGYAYAA=", r"ID must be 13 base32 characters"),
+        ("base32", "NBKRC3QGYAY1A", r"ID must be 13 base32 characters"),
+        ("base32", "NBKRC3QGYAYAB", r"ID must not set unused trailing bits"),
+        ("base64_urlsafe", "aFURbgbAMAA==", r"ID must be 11 URL-safe base64 characters"),
+        ("base64_urlsafe", "aFURbgb+MAA", r"ID must be 11 URL-safe base64 characters"),
+        ("base64_urlsafe", "aFURbgbAMAB", r"ID must not set unused trailing bits"),
+        ("base62", "", r"ID must be 1 to 11 base62 characters"),
+        ("base62", "000000000000", r"ID must be 1 to 11 base62 characters"),
+        ("base62", "-1", r"ID must be 1 to 11 base62 characters"),
+        ("base62", "zzzzzzzzzzz", r"ID must fit into 8 bytes"),
+    ],
+)
+def test_parse_str_invalid_raises_error(codec: str, text: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        getattr(TwitterSnowflakeID, f"parse_{codec}_str")(text)
@@ -1,9 +1,12 @@
+import dataclasses
+
 import pytest
 
 from snowflake_id_toolkit._config import SnowflakeIDConfig
 from snowflake_id_toolkit.instagram import INSTAGRAM_SNOWFLAKE_CONFIG
 from snowflake_id_toolkit.sony import SONYFLAKE_CONFIG
 from snowflake_id_toolkit.twitter import TWITTER_SNOWFLAKE_CONFIG
+from snowflake_id_toolkit.wide import WIDE_SNOWFLAKE_CONFIG
 
 
 def test_config_initialization_valid_params(
@@ -66,6 +69,78 @@ def test_config_immutability(
         config_twitter_like.timestamp_bits = 42  # type: ignore[misc]
 
 
+def test_config_is_dataclass(
+    config_twitter_like: SnowflakeIDConfig,
+) -> None:
+    """Test SnowflakeIDConfig works with the dataclasses helpers."""
+    wider = dataclasses.replace(config_twitter_like, sequence_bits=8, total_bits=128)
+
+    assert dataclasses.is_dataclass(config_twitter_like)
+    assert [field.name for field in dataclasses.fields(config_twitter_like) if field.init] == [
+        "timestamp_bits",
+        "node_id_bits",
+        "sequence_bits",
+        "time_step_ms",
+        "total_bits",
+    ]
+    assert dataclasses.asdict(config_twitter_like)["max_sequence"] == 4095
+    assert (wider.max_sequence, wider.byte_length, wider.timestamp_shift) == (255, 16, 18)
+    assert wider != config_twitter_like
+
+
+def test_config_default_total_bits(
+    config_twitter_like: SnowflakeIDConfig,
+) -> None:
+    """Test SnowflakeIDConfig defaults to a 64-bit (8-byte) layout."""
+    assert config_twitter_like.total_bits == 64
+    assert config_twitter_like.byte_length == 8
+
+
+def test_config_components_exceeding_total_bits_raises_error() -> None:
+    """Test SnowflakeIDConfig rejects layouts that do not fit into total_bits."""
+    with pytest.raises(ValueError, match=r"must fit into 64 bits"):
+        SnowflakeIDConfig(timestamp_bits=42, node_id_bits=10, sequence_bits=13)
+
+
+def test_config_components_filling_total_bits_exactly() -> None:
+    """Test SnowflakeIDConfig accepts layouts that use every bit."""
+    config = SnowflakeIDConfig(timestamp_bits=42, node_id_bits=10, sequence_bits=12)
+    assert config.timestamp_shift + config.timestamp_bits == 64
+
+
+@pytest.mark.parametrize("total_bits", [0, -8, 60, 100])
+def test_config_invalid_total_bits_raises_error(total_bits: int) -> None:
+    """Test SnowflakeIDConfig rejects total_bits that is not a positive multiple of 8."""
+    with pytest.raises(ValueError, match=r"Total bits must be a positive multiple of 8"):
+        SnowflakeIDConfig(timestamp_bits=8, node_id_bits=8, sequence_bits=8, total_bits=total_bits)
+
+
+@pytest.mark.parametrize(
+    ("timestamp_bits", "node_id_bits", "sequence_bits", "match"),
+    [
+        (0, 10, 12, r"Timestamp bits must be positive"),
+        (41, -1, 12, r"Node ID bits and sequence bits must not be negative"),
+        (41, 10, -1, r"Node ID bits and sequence bits must not be negative"),
+    ],
+)
+def test_config_invalid_component_bits_raises_error(
+    timestamp_bits: int,
+    node_id_bits: int,
+    sequence_bits: int,
+    match: str,
+) -> None:
+    """Test SnowflakeIDConfig rejects invalid component widths."""
+    with pytest.raises(ValueError, match=match):
+        SnowflakeIDConfig(timestamp_bits=timestamp_bits, node_id_bits=node_id_bits, sequence_bits=sequence_bits)
+
+
+@pytest.mark.parametrize("time_step_ms", [0, -1])
+def test_config_invalid_time_step_raises_error(time_step_ms: int) -> None:
+    """Test SnowflakeIDConfig rejects non-positive time_step_ms."""
+    with pytest.raises(ValueError, match=r"Time step must be positive"):
+        SnowflakeIDConfig(timestamp_bits=41, node_id_bits=10, sequence_bits=12, time_step_ms=time_step_ms)
+
+
 def test_twitter_config_bit_layout() -> None:
     """Test Twitter Snowflake config has correct bit layout."""
     assert TWITTER_SNOWFLAKE_CONFIG.timestamp_bits == 41
@@ -117,6 +192,25 @@ def test_sonyflake_config_max_values() -> None:
     assert SONYFLAKE_CONFIG.timestamp_shift == 24
 
 
+def test_wide_config_bit_layout() -> None:
+    """Test Wide Snowflake config has correct 128-bit layout."""
+    assert WIDE_SNOWFLAKE_CONFIG.timestamp_bits == 48
+    assert WIDE_SNOWFLAKE_CONFIG.node_id_bits == 16
+    assert WIDE_SNOWFLAKE_CONFIG.sequence_bits == 64
+    assert WIDE_SNOWFLAKE_CONFIG.time_step_ms == 1
+    assert WIDE_SNOWFLAKE_CONFIG.total_bits == 128
+    assert WIDE_SNOWFLAKE_CONFIG.byte_length == 16
+
+
+def test_wide_config_max_values() -> None:
+    """Test Wide Snowflake config calculated max values."""
+    assert WIDE_SNOWFLAKE_CONFIG.max_timestamp == 281474976710655
+    assert WIDE_SNOWFLAKE_CONFIG.max_node_id == 65535
+    assert WIDE_SNOWFLAKE_CONFIG.max_sequence == 18446744073709551615
+    assert WIDE_SNOWFLAKE_CONFIG.node_id_shift == 64
+    assert WIDE_SNOWFLAKE_CONFIG.timestamp_shift == 80
+
+
 def test_config_different_bit_layouts_produce_different_shifts(
     config_twitter_like: SnowflakeIDConfig,
 ) -> None:
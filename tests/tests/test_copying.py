@@ -0,0 +1,164 @@
+import copy
+import os
+import pickle
+from collections.abc import Callable
+
+import pytest
+
+from snowflake_id_toolkit import CopiedGeneratorError
+from snowflake_id_toolkit import _ordering as ordering_module
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork() is not available")
+
+
+def run_in_child(child: Callable[[], int]) -> int:
+    """Fork, exit the child with the status returned by child and return it."""
+
+    pid = os.fork()
+
+    if pid == 0:
+        status = 1
+
+        try:
+            status = child()
+        finally:
+            os._exit(status)
+
+    _, wait_status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(wait_status)
+
+
+# Pickling tests
+def test_pickled_generator_refuses_to_generate() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1, epoch=1288834974657)
+    generator.generate_next_id()
+
+    restored = pickle.loads(pickle.dumps(generator))  # noqa: S301
+
+    assert (restored.node_id, restored.epoch, restored.config) == (1, 1288834974657, generator.config)
+
+    with pytest.raises(CopiedGeneratorError):
+        restored.generate_next_id()
+
+    with pytest.raises(CopiedGeneratorError):
+        restored.generate_ids(10)
+
+
+def test_pickled_generator_reassigned() -> None:
+    generator = SonyflakeIDGenerator(node_id=1)
+    last_id = generator.generate_ids(100)[-1]
+
+    restored = pickle.loads(pickle.dumps(generator))  # noqa: S301
+    restored.reassign(2)
+
+    ids = [restored.generate_next_id() for _ in range(100)] + restored.generate_ids(100)
+
+    assert {id_.node_id() for id_ in ids} == {2}
+    assert ids == sorted(ids)
+    assert ids[0].timestamp_ms() >= last_id.timestamp_ms()
+    assert restored._lock is not generator._lock  # noqa: SLF001
+    assert generator.generate_next_id().node_id() == 1
+
+
+def test_pickled_generator_keeps_options() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1, track_exhaustion=True, random_sequence=True)
+    generator.generate_ids(10)
+
+    restored = pickle.loads(pickle.dumps(generator))  # noqa: S301
+    restored.reassign(2)
+    restored.generate_ids(10)
+
+    assert restored._sequence_key == generator._sequence_key  # noqa: SLF001
+    assert restored.exhaustion_stats().ticks >= generator.exhaustion_stats().ticks
+    assert restored._fast_path is None  # noqa: SLF001
+
+
+def test_pickled_monotonic_generator_joins_process_ordering() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1, monotonic=True)
+
+    restored = pickle.loads(pickle.dumps(generator))  # noqa: S301
+    restored.reassign(2)
+
+    assert restored._lock is generator._lock  # noqa: SLF001
+
+    ids = [id_ for _ in range(1000) for id_ in (generator.generate_next_id(), restored.generate_next_id())]
+
+    assert ids == sorted(ids)
+
+
+# Copying tests
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+def test_copied_generator_refuses_to_generate(
+    copier: Callable[[TwitterSnowflakeIDGenerator], TwitterSnowflakeIDGenerator],
+) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+
+    copied = copier(generator)
+
+    with pytest.raises(CopiedGeneratorError):
+        copied.generate_next_id()
+
+    copied.reassign(3)
+
+    assert copied.generate_next_id().node_id() == 3
+    assert generator.generate_next_id().node_id() == 1
+
+
+# Reassignment tests
+def test_reassign_live_generator() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+    first = generator.generate_next_id()
+
+    generator.reassign(5)
+
+    second = generator.generate_next_id()
+    assert second.node_id() == 5
+    assert second.timestamp_ms() >= first.timestamp_ms()
+
+
+@pytest.mark.parametrize(
+    ("node_id", "message"),
+    [
+        (1, r"Node ID must differ from the current one"),
+        (1024, r"Node ID must be between 0 and 1023"),
+    ],
+)
+def test_reassign_invalid_node_id_raises_error(node_id: int, message: str) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+
+    with pytest.raises(ValueError, match=message):
+        generator.reassign(node_id)
+
+
+# Fork tests
+@requires_fork
+def test_forked_child_generator_refuses_to_generate() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+    generator.generate_next_id()
+
+    def child() -> int:
+        try:
+            generator.generate_next_id()
+        except CopiedGeneratorError:
+            generator.reassign(2)
+            return 0 if generator.generate_next_id().node_id() == 2 else 3
+
+        return 2
+
+    assert run_in_child(child) == 0
+
+    assert generator.generate_next_id().node_id() == 1
+
+
+@requires_fork
+def test_forked_child_creates_monotonic_generator_while_registry_locked() -> None:
+    def child() -> int:
+        TwitterSnowflakeIDGenerator(node_id=2, monotonic=True).generate_next_id()
+        return 0
+
+    with ordering_module._orderings_lock:  # noqa: SLF001
+        status = run_in_child(child)
+
+    assert status == 0
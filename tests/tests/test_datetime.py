@@ -0,0 +1,147 @@
+import copy
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from snowflake_id_toolkit import SnowflakeID
+from snowflake_id_toolkit.sony import SonyflakeID, SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID, TwitterSnowflakeIDGenerator
+from snowflake_id_toolkit.wide import WideSnowflakeID
+
+TWITTER_EPOCH = 1288834974657
+MOMENT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+# Epoch binding tests
+def test_with_epoch_returns_cached_subclass() -> None:
+    bound = TwitterSnowflakeID.with_epoch(TWITTER_EPOCH)
+
+    assert issubclass(bound, TwitterSnowflakeID)
+    assert bound.__name__ == "TwitterSnowflakeID"
+    assert TwitterSnowflakeID.with_epoch(TWITTER_EPOCH) is bound
+    assert bound.with_epoch(TWITTER_EPOCH) is bound
+    assert bound.with_epoch(0).__mro__[1] is TwitterSnowflakeID
+
+
+def test_with_epoch_negative_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Epoch must not be negative"):
+        TwitterSnowflakeID.with_epoch(-1)
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_generator_id_type_uses_generator_epoch() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, epoch=TWITTER_EPOCH)
+    snowflake_id = generator.id_type(generator.generate_next_id())
+
+    assert snowflake_id.timestamp_ms() == 1735689600000
+    assert snowflake_id.timestamp_ms(epoch=0) == 1735689600000 - TWITTER_EPOCH
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_generated_ids_use_generator_epoch() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, epoch=TWITTER_EPOCH)
+
+    ids = [generator.generate_next_id(), generator._generate_next_id(), *generator.generate_ids(3)]  # noqa: SLF001
+
+    assert {type(id_) for id_ in ids} == {generator.id_type}
+    assert {id_.to_datetime() for id_ in ids} == {MOMENT}
+    assert type(TwitterSnowflakeIDGenerator(node_id=0).generate_next_id()) is TwitterSnowflakeID
+
+
+def test_generated_ids_use_generator_epoch_on_fast_path() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, epoch=TWITTER_EPOCH)
+    before = datetime.now(timezone.utc)
+
+    snowflake_id = generator.generate_next_id()
+
+    assert type(snowflake_id) is generator.id_type
+    assert snowflake_id.to_datetime() - before < timedelta(seconds=1)
+
+
+@pytest.mark.parametrize("copier", [copy.copy, lambda id_: pickle.loads(pickle.dumps(id_))])  # noqa: S301
+def test_bound_id_copy_keeps_epoch(copier: object) -> None:
+    bound = TwitterSnowflakeID.with_epoch(TWITTER_EPOCH)
+    snowflake_id = bound(1 << 22)
+
+    copied = copier(snowflake_id)  # type: ignore[operator]
+
+    assert type(copied) is bound
+    assert copied == snowflake_id
+
+
+# Datetime conversion tests
+@pytest.mark.usefixtures("frozen_time")
+def test_to_datetime(twitter_generator: TwitterSnowflakeIDGenerator) -> None:
+    snowflake_id = twitter_generator.generate_next_id()
+
+    assert snowflake_id.to_datetime() == MOMENT
+    assert snowflake_id.to_datetime().tzinfo is timezone.utc
+
+
+def test_to_datetime_time_zone_and_epoch() -> None:
+    tz = timezone(timedelta(hours=2))
+    snowflake_id = TwitterSnowflakeID(1000 << 22)
+
+    converted = snowflake_id.to_datetime(tz, epoch=TWITTER_EPOCH)
+
+    assert converted.tzinfo is tz
+    assert converted == datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(milliseconds=TWITTER_EPOCH + 1000)
+
+
+def test_to_datetime_sonyflake_resolution() -> None:
+    assert SonyflakeID(150 << 24).to_datetime() == datetime(1970, 1, 1, 0, 0, 1, 500_000, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("tz", [None, timezone(timedelta(hours=-5))])
+def test_to_datetimes_matches_to_datetime(tz: timezone | None) -> None:
+    generator = SonyflakeIDGenerator(node_id=3)
+    ids = [*generator.generate_ids(1000), SonyflakeID(0)]
+
+    converted = SonyflakeID.to_datetimes(ids, tz)
+
+    assert converted == [id_.to_datetime(tz) for id_ in ids]
+    assert len({id(moment) for moment in converted}) == len({id_ >> 24 for id_ in ids})
+
+
+def test_to_datetimes_plain_integers_and_bound_epoch() -> None:
+    bound = TwitterSnowflakeID.with_epoch(TWITTER_EPOCH)
+
+    assert bound.to_datetimes([5 << 22]) == [TwitterSnowflakeID(5 << 22).to_datetime(epoch=TWITTER_EPOCH)]
+
+
+@pytest.mark.parametrize("id_cls", [TwitterSnowflakeID, SonyflakeID, WideSnowflakeID])
+def test_from_datetime_roundtrip(id_cls: type[SnowflakeID]) -> None:
+    snowflake_id = id_cls.from_datetime(MOMENT, node_id=7, sequence=9, epoch=1000)
+
+    assert type(snowflake_id) is id_cls
+    assert snowflake_id.to_datetime(epoch=1000) == MOMENT
+    assert snowflake_id.node_id() == 7
+    assert snowflake_id.sequence() == 9
+
+
+def test_from_datetime_truncates_to_tick() -> None:
+    snowflake_id = SonyflakeID.from_datetime(MOMENT + timedelta(milliseconds=19))
+
+    assert snowflake_id.to_datetime() == MOMENT + timedelta(milliseconds=10)
+
+
+def test_from_datetime_is_lower_bound_of_tick(twitter_generator: TwitterSnowflakeIDGenerator) -> None:
+    snowflake_id = twitter_generator.generate_next_id()
+
+    assert TwitterSnowflakeID.from_datetime(snowflake_id.to_datetime()) <= snowflake_id
+
+
+@pytest.mark.parametrize(
+    ("moment", "kwargs", "message"),
+    [
+        (datetime(2025, 1, 1), {}, r"Datetime must be timezone-aware"),  # noqa: DTZ001
+        (datetime(1969, 12, 31, tzinfo=timezone.utc), {}, r"Datetime must be between the epoch"),
+        (MOMENT, {"epoch": TWITTER_EPOCH * 2}, r"Datetime must be between the epoch"),
+        (MOMENT, {"node_id": 1024}, r"Node ID must be between 0 and 1023"),
+        (MOMENT, {"sequence": 4096}, r"Sequence must be between 0 and 4095"),
+    ],
+)
+def test_from_datetime_invalid_raises_error(moment: datetime, kwargs: dict[str, int], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        TwitterSnowflakeID.from_datetime(moment, **kwargs)
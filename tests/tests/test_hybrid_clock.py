@@ -0,0 +1,155 @@
+import pickle
+from datetime import timedelta
+from typing import Any
+from unittest import mock
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from snowflake_id_toolkit import SnowflakeID, SnowflakeIDGenerator
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+
+
+def make_id(generator: SnowflakeIDGenerator[Any], timestamp: int, node_id: int, sequence: int) -> SnowflakeID:
+    """
+    ID of the generator's layout and epoch, timestamp in generator-specific units.
+    """
+
+    config = generator.config
+    id_cls: type[SnowflakeID] = generator.id_type
+    return id_cls(
+        ((timestamp - generator.epoch) << config.timestamp_shift) | (node_id << config.node_id_shift) | sequence
+    )
+
+
+# Generation tests
+@pytest.mark.usefixtures("frozen_time")
+def test_hybrid_clock_carries_exhausted_sequence_without_waiting() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1, hybrid_clock=True)
+    now = generator.get_current_timestamp()
+
+    with mock.patch.object(generator, "_wait_for_next_timestamp") as mock_wait:
+        ids = [generator.generate_next_id() for _ in range(4097)] + generator.generate_ids(10_000)
+
+    mock_wait.assert_not_called()
+    assert ids == sorted(set(ids))
+    assert ids[4095].timestamp_ms() == now
+    assert ids[4096].timestamp_ms() == now + 1
+    assert ids[4096].sequence() == 0
+    assert ids[-1].timestamp_ms() == now + 3
+
+
+def test_hybrid_clock_outruns_clock_moving_backwards(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1, hybrid_clock=True)
+    first = generator.generate_next_id()
+
+    frozen_time.tick(timedelta(seconds=-5))
+    second = generator.generate_next_id()
+
+    assert second > first
+    assert second.timestamp_ms() == first.timestamp_ms()
+    assert second.sequence() == 1
+
+    frozen_time.tick(timedelta(seconds=6))
+    third = generator.generate_next_id()
+
+    assert third.timestamp_ms() == first.timestamp_ms() + 1000
+    assert third.sequence() == 0
+
+
+# Observation tests
+@pytest.mark.usefixtures("frozen_time")
+@pytest.mark.parametrize(
+    ("remote_node_id", "expected_offset", "expected_sequence"),
+    [(0, 0, 0), (5, 0, 8), (9, 1, 0)],
+)
+def test_observe_orders_after_remote_id(remote_node_id: int, expected_offset: int, expected_sequence: int) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=5, hybrid_clock=True)
+    now = generator.get_current_timestamp()
+    remote = make_id(generator, now + 500, remote_node_id, 7)
+
+    generator.observe(remote)
+    next_id = generator.generate_next_id()
+
+    assert next_id > remote
+    assert next_id.timestamp_ms() == now + 500 + expected_offset
+    assert next_id.sequence() == expected_sequence
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_observe_past_id_keeps_clock() -> None:
+    generator = SonyflakeIDGenerator(node_id=1, hybrid_clock=True)
+    now = generator.get_current_timestamp()
+    last = generator.generate_next_id()
+
+    generator.observe(make_id(generator, now - 10, 2, 0))
+    next_id = generator.generate_next_id()
+
+    assert next_id == last + 1
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_observe_custom_epoch() -> None:
+    epoch = 1288834974657
+    generator = TwitterSnowflakeIDGenerator(node_id=1, epoch=epoch, hybrid_clock=True)
+    remote = TwitterSnowflakeIDGenerator(node_id=2, epoch=epoch, hybrid_clock=True)
+
+    remote_ids = remote.generate_ids(5000)
+    generator.observe(remote_ids[-1])
+
+    assert generator.generate_next_id() > remote_ids[-1]
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_monotonic_hybrid_clock_follows_process_ordering() -> None:
+    first = TwitterSnowflakeIDGenerator(node_id=9, monotonic=True, hybrid_clock=True)
+    second = TwitterSnowflakeIDGenerator(node_id=1, monotonic=True, hybrid_clock=True)
+
+    ids = []
+
+    with mock.patch.object(second, "_wait_for_next_timestamp") as mock_wait:
+        for _ in range(100):
+            ids.append(first.generate_next_id())
+            ids.append(second.generate_next_id())
+
+    mock_wait.assert_not_called()
+    assert ids == sorted(set(ids))
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_observe_future_id_beyond_skew_raises_error() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1, hybrid_clock=True)
+    remote = make_id(generator, generator.get_current_timestamp() + 60_000, 2, 0)
+
+    with pytest.raises(ValueError, match=r"ID timestamp must not be more than 1000 ms in the future"):
+        generator.observe(remote)
+
+    generator.observe(remote, max_skew_ms=None)
+
+    assert generator.generate_next_id() > remote
+
+
+def test_observe_without_hybrid_clock_raises_error() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+
+    with pytest.raises(ValueError, match=r"Hybrid clock is not enabled"):
+        generator.observe(0)
+
+
+def test_hybrid_clock_random_sequence_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Hybrid clock generators cannot randomize the sequence"):
+        TwitterSnowflakeIDGenerator(node_id=1, hybrid_clock=True, random_sequence=True)
+
+
+# Copying tests
+@pytest.mark.usefixtures("frozen_time")
+def test_hybrid_clock_survives_pickling() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1, hybrid_clock=True)
+    remote = make_id(generator, generator.get_current_timestamp() + 100, 2, 0)
+    generator.observe(remote)
+
+    restored = pickle.loads(pickle.dumps(generator))  # noqa: S301
+    restored.reassign(3)
+
+    assert restored.generate_next_id() > remote
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must stay out of a cold import, see the lazy imports in snowflake_id_toolkit/__init__.py
+HEAVY_MODULES = ("base64", "dataclasses", "inspect", "typing_extensions")
+
+# A layout brings in SnowflakeIDConfig, a dataclass, but still not the codecs
+LAYOUT_HEAVY_MODULES = ("base64", "typing_extensions")
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    """
+    Import in a fresh interpreter and return the names of newly loaded modules.
+    """
+
+    code = f"import sys; before = set(sys.modules); {statement}; print(*sorted(set(sys.modules) - before))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    return set(result.stdout.split())
+
+
+def test_package_import_loads_no_layouts() -> None:
+    loaded = _loaded_modules("import snowflake_id_toolkit")
+
+    assert not {module for module in loaded if module.startswith("snowflake_id_toolkit.")}
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize(
+    ("name", "layout"),
+    [
+        ("TwitterSnowflakeIDGenerator", "twitter"),
+        ("InstagramSnowflakeID", "instagram"),
+        ("SonyflakeIDGenerator", "sony"),
+        ("WideSnowflakeID", "wide"),
+    ],
+)
+def test_layout_import_loads_only_that_layout(name: str, layout: str) -> None:
+    loaded = _loaded_modules(f"from snowflake_id_toolkit import {name}")
+
+    layouts = {
+        module.split(".")[1]
+        for module in loaded
+        if module.startswith("snowflake_id_toolkit.") and not module.split(".")[1].startswith("_")
+    }
+    assert layouts == {layout}
+    assert not loaded.intersection(LAYOUT_HEAVY_MODULES)
+
+
+def test_lazy_attribute_is_cached_in_module_namespace() -> None:
+    import snowflake_id_toolkit  # noqa: PLC0415
+    from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator  # noqa: PLC0415
+
+    assert snowflake_id_toolkit.TwitterSnowflakeIDGenerator is TwitterSnowflakeIDGenerator
+    assert vars(snowflake_id_toolkit)["TwitterSnowflakeIDGenerator"] is TwitterSnowflakeIDGenerator
+
+
+def test_unknown_attribute_raises_error() -> None:
+    import snowflake_id_toolkit  # noqa: PLC0415
+
+    with pytest.raises(AttributeError, match=r"has no attribute 'UnknownGenerator'"):
+        snowflake_id_toolkit.UnknownGenerator  # noqa: B018
+
+
+def test_dir_lists_public_names() -> None:
+    import snowflake_id_toolkit  # noqa: PLC0415
+
+    assert set(snowflake_id_toolkit.__all__) <= set(dir(snowflake_id_toolkit))
@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+
+from snowflake_id_toolkit import SnowflakeID
+from snowflake_id_toolkit import _ordering as ordering_module
+from snowflake_id_toolkit._ordering import get_process_ordering
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TWITTER_SNOWFLAKE_CONFIG, TwitterSnowflakeIDGenerator
+
+EPOCH = 1288834974657
+
+
+# Ordering tests
+def test_monotonic_generators_share_lock() -> None:
+    first = TwitterSnowflakeIDGenerator(node_id=1, epoch=EPOCH, monotonic=True)
+    second = TwitterSnowflakeIDGenerator(node_id=2, epoch=EPOCH, monotonic=True)
+    other_epoch = TwitterSnowflakeIDGenerator(node_id=3, epoch=EPOCH + 1, monotonic=True)
+    plain = TwitterSnowflakeIDGenerator(node_id=4, epoch=EPOCH)
+
+    assert first._lock is second._lock  # noqa: SLF001
+    assert other_epoch._lock is not first._lock  # noqa: SLF001
+    assert plain._lock is not first._lock  # noqa: SLF001
+    assert first._fast_path is None  # noqa: SLF001
+
+
+def test_monotonic_ids_increasing_across_generators() -> None:
+    generators = [TwitterSnowflakeIDGenerator(node_id, epoch=EPOCH, monotonic=True) for node_id in (7, 3, 5, 3)]
+
+    ids = [generator.generate_next_id() for _ in range(500) for generator in generators]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+@pytest.fixture
+def fresh_orderings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Start the test with no process orderings, so IDs of earlier tests at the real time do not bound frozen time.
+    """
+
+    monkeypatch.setattr(ordering_module, "_orderings", {})
+
+
+@pytest.mark.usefixtures("frozen_time", "fresh_orderings")
+def test_monotonic_lower_node_id_continues_last_sequence() -> None:
+    high = TwitterSnowflakeIDGenerator(node_id=9, epoch=EPOCH, monotonic=True)
+    low = TwitterSnowflakeIDGenerator(node_id=1, epoch=EPOCH, monotonic=True)
+
+    high_id = high.generate_next_id()
+    low_id = low.generate_next_id()
+
+    assert low_id == high_id + 1
+    assert low_id.timestamp_ms() == high_id.timestamp_ms()
+    assert low_id.node_id() == 9
+
+
+@pytest.mark.usefixtures("frozen_time", "fresh_orderings")
+def test_monotonic_higher_node_id_starts_own_sequence() -> None:
+    low = TwitterSnowflakeIDGenerator(node_id=1, epoch=EPOCH, monotonic=True)
+    high = TwitterSnowflakeIDGenerator(node_id=9, epoch=EPOCH, monotonic=True)
+
+    low.generate_ids(10)
+    high_id = high.generate_next_id()
+
+    assert (high_id.node_id(), high_id.sequence()) == (9, 0)
+    assert high_id.timestamp_ms() == low.generate_next_id().timestamp_ms()
+
+
+@pytest.mark.usefixtures("frozen_time", "fresh_orderings")
+def test_monotonic_interleaved_generators_share_tick() -> None:
+    first = TwitterSnowflakeIDGenerator(node_id=1, epoch=EPOCH, monotonic=True)
+    second = TwitterSnowflakeIDGenerator(node_id=2, epoch=EPOCH, monotonic=True)
+
+    ids = [generator.generate_next_id() for _ in range(1000) for generator in (first, second)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert {id_.timestamp_ms() for id_ in ids} == {ids[0].timestamp_ms()}
+
+
+@pytest.mark.usefixtures("frozen_time", "fresh_orderings")
+def test_monotonic_used_up_sequence_moves_to_next_tick() -> None:
+    high = TwitterSnowflakeIDGenerator(node_id=9, epoch=EPOCH, monotonic=True, hybrid_clock=True)
+    low = TwitterSnowflakeIDGenerator(node_id=1, epoch=EPOCH, monotonic=True, hybrid_clock=True)
+
+    high_ids = high.generate_ids(4096)
+    low_id = low.generate_next_id()
+
+    assert high_ids[-1].sequence() == 4095
+    assert low_id.timestamp_ms() == high_ids[-1].timestamp_ms() + 1
+    assert (low_id.node_id(), low_id.sequence()) == (1, 0)
+
+
+def test_monotonic_same_node_id_continues_sequence() -> None:
+    first = SonyflakeIDGenerator(node_id=1, monotonic=True)
+    second = SonyflakeIDGenerator(node_id=1, monotonic=True)
+
+    first_id = first.generate_next_id()
+    second_id = second.generate_next_id()
+
+    assert second_id > first_id
+    assert second_id.node_id() == 1
+
+
+def test_monotonic_generate_ids_increasing_across_generators() -> None:
+    generators = [TwitterSnowflakeIDGenerator(node_id, epoch=EPOCH, monotonic=True) for node_id in (2, 1)]
+
+    ids: list[SnowflakeID] = []
+    for _ in range(20):
+        for generator in generators:
+            ids.extend(generator.generate_ids(300))
+            ids.append(generator.generate_next_id())
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_monotonic_generators_concurrent_threads() -> None:
+    generators = [TwitterSnowflakeIDGenerator(node_id, epoch=EPOCH, monotonic=True) for node_id in range(4)]
+    results: list[list[SnowflakeID]] = [[] for _ in generators]
+    issued: list[SnowflakeID] = []
+
+    def worker(index: int) -> None:
+        generator = generators[index]
+        for _ in range(2000):
+            results[index].append(generator.generate_next_id())
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(generators))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for ids in results:
+        assert ids == sorted(ids)
+        issued.extend(ids)
+
+    assert len(set(issued)) == len(issued)
+    assert get_process_ordering(TWITTER_SNOWFLAKE_CONFIG, EPOCH).last_id == max(issued)
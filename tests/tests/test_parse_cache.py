@@ -0,0 +1,129 @@
+import binascii
+from collections.abc import Generator
+
+import pytest
+
+from snowflake_id_toolkit.sony import SonyflakeID
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID
+
+
+@pytest.fixture
+def parse_cache() -> Generator[None]:
+    """
+    Enable a parse cache of 2 IDs on TwitterSnowflakeID for the duration of a test.
+    """
+
+    TwitterSnowflakeID.enable_parse_cache(2)
+    yield
+    TwitterSnowflakeID.disable_parse_cache()
+
+
+# Caching tests
+@pytest.mark.usefixtures("parse_cache")
+@pytest.mark.parametrize("codec", ["base16", "base32", "base64", "base64_urlsafe", "base85"])
+def test_parse_cache_returns_cached_instance(codec: str) -> None:
+    data = getattr(TwitterSnowflakeID(123456789), f"as_{codec}")()
+    parse = getattr(TwitterSnowflakeID, f"parse_{codec}")
+
+    first = parse(data)
+
+    assert parse(data) is first
+    assert first == 123456789
+    assert type(first) is TwitterSnowflakeID
+    assert TwitterSnowflakeID.parse_cache_info()[:2] == (1, 1)
+
+
+@pytest.mark.usefixtures("parse_cache")
+def test_parse_cache_keys_include_codec() -> None:
+    # Valid base16 and base32, but 10 bytes long in base32
+    data = b"AAAAAAAAAAAAAAAB"
+
+    assert TwitterSnowflakeID.parse_base16(data) == 0xAAAAAAAAAAAAAAAB
+
+    with pytest.raises(ValueError, match=r"ID must be exactly 8 bytes long"):
+        TwitterSnowflakeID.parse_base32(data)
+
+
+@pytest.mark.usefixtures("parse_cache")
+def test_parse_cache_keys_include_strict() -> None:
+    data = b"AAA!!\nAAAdbzRU="
+
+    assert TwitterSnowflakeID.parse_base64(data) == 123456789
+
+    with pytest.raises(binascii.Error, match=r"Only base64 data is allowed"):
+        TwitterSnowflakeID.parse_base64(data, strict=True)
+
+    strict = TwitterSnowflakeID.parse_base64(b"AAAAAAdbzRU=", strict=True)
+
+    assert TwitterSnowflakeID.parse_base64(b"AAAAAAdbzRU=") is not strict
+    assert TwitterSnowflakeID.parse_base64(b"AAAAAAdbzRU=", strict=True) is strict
+
+
+@pytest.mark.usefixtures("parse_cache")
+def test_parse_cache_evicts_least_recently_used() -> None:
+    first, second, third = (TwitterSnowflakeID(value).as_base32() for value in (1, 2, 3))
+
+    cached = TwitterSnowflakeID.parse_base32(first)
+    TwitterSnowflakeID.parse_base32(second)
+    TwitterSnowflakeID.parse_base32(first)
+    TwitterSnowflakeID.parse_base32(third)
+
+    assert TwitterSnowflakeID.parse_base32(first) is cached
+    info = TwitterSnowflakeID.parse_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 3, 2, 2)
+
+
+@pytest.mark.usefixtures("parse_cache")
+def test_parse_cache_belongs_to_one_class() -> None:
+    bound = TwitterSnowflakeID.with_epoch(1288834974657)
+    data = TwitterSnowflakeID(1 << 22).as_base32()
+
+    parsed = bound.parse_base32(data)
+
+    assert type(parsed) is bound
+    assert parsed.timestamp_ms() == 1288834974658
+    assert TwitterSnowflakeID.parse_cache_info().misses == 0
+
+    with pytest.raises(ValueError, match=r"Parse cache is not enabled"):
+        bound.parse_cache_info()
+
+
+@pytest.mark.usefixtures("parse_cache")
+def test_parse_cache_skips_unhashable_data() -> None:
+    data = bytearray(TwitterSnowflakeID(42).as_base64())
+
+    assert TwitterSnowflakeID.parse_base64(data) == 42  # type: ignore[arg-type]
+    assert TwitterSnowflakeID.parse_cache_info().currsize == 0
+
+
+@pytest.mark.usefixtures("parse_cache")
+def test_parse_cache_does_not_cache_errors() -> None:
+    for _ in range(2):
+        with pytest.raises(binascii.Error):
+            TwitterSnowflakeID.parse_base32(b"not base32")
+
+    assert TwitterSnowflakeID.parse_cache_info().currsize == 0
+
+
+# Configuration tests
+def test_enable_parse_cache_again_starts_empty() -> None:
+    SonyflakeID.enable_parse_cache()
+    SonyflakeID.parse_base32(SonyflakeID(1).as_base32())
+
+    SonyflakeID.enable_parse_cache(10)
+    info = SonyflakeID.parse_cache_info()
+    SonyflakeID.disable_parse_cache()
+    SonyflakeID.disable_parse_cache()
+
+    assert (info.currsize, info.maxsize) == (0, 10)
+    assert "_parse_cache" not in vars(SonyflakeID)
+
+
+def test_enable_parse_cache_invalid_maxsize_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Max size must be positive"):
+        TwitterSnowflakeID.enable_parse_cache(0)
+
+
+def test_parse_cache_info_not_enabled_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Parse cache is not enabled"):
+        TwitterSnowflakeID.parse_cache_info()
@@ -0,0 +1,311 @@
+import warnings
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from snowflake_id_toolkit import LifetimeWarning, SnowflakeIDConfig, plan_layout, simulate_stalls
+from snowflake_id_toolkit._cli import main
+from snowflake_id_toolkit.sony import SONYFLAKE_CONFIG, SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TWITTER_SNOWFLAKE_CONFIG, TwitterSnowflakeIDGenerator
+
+
+# Exhaustion tracking tests
+def test_exhaustion_stats_count_exhausted_ticks(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, track_exhaustion=True)
+
+    def wait_for_next_timestamp() -> int:
+        frozen_time.tick(timedelta(milliseconds=1, microseconds=1))
+        return generator.get_current_timestamp()
+
+    with mock.patch.object(generator, "_wait_for_next_timestamp", side_effect=wait_for_next_timestamp):
+        generator.generate_ids(4096)
+        generator.generate_next_id()
+        generator.generate_ids(4095)
+        generator.generate_next_id()
+
+    stats = generator.exhaustion_stats()
+    assert stats.ticks == 3
+    assert stats.exhausted_ticks == 2
+    assert stats.exhaustion_rate == pytest.approx(2 / 3)
+    assert stats.stall_ns > 0
+
+
+def test_exhaustion_stats_without_exhaustion() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, track_exhaustion=True)
+
+    generator.generate_next_id()
+
+    stats = generator.exhaustion_stats()
+    assert stats.ticks == 1
+    assert stats.exhausted_ticks == 0
+    assert generator._fast_path is None  # noqa: SLF001
+
+
+def test_exhaustion_stats_not_tracked_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Exhaustion tracking is not enabled"):
+        TwitterSnowflakeIDGenerator(node_id=0).exhaustion_stats()
+
+
+def test_tick_utilization_percentiles(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, track_exhaustion=True)
+
+    for count in (*[1024] * 98, 2048, 4096):
+        generator.generate_ids(count)
+        frozen_time.tick(timedelta(milliseconds=1, microseconds=1))
+
+    generator.generate_next_id()
+
+    utilization = generator.tick_utilization()
+    assert utilization.ticks == 100
+    assert utilization.p50 == 0.25
+    assert utilization.p99 == 1.0
+    assert utilization.max == 1.0
+
+    utilization = generator.tick_utilization(window=2)
+    assert utilization.ticks == 2
+    assert utilization.p50 == 1.0
+
+
+def test_tick_utilization_keeps_most_recent_ticks(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, track_exhaustion=True)
+
+    for count in (*[4096] * 10, *[1] * 4096):
+        generator.generate_ids(count)
+        frozen_time.tick(timedelta(milliseconds=1, microseconds=1))
+
+    generator.generate_next_id()
+
+    utilization = generator.tick_utilization()
+    assert utilization.ticks == 4096
+    assert utilization.max == 1 / 4096
+
+
+def test_tick_utilization_counts_ticks_starting_past_zero(frozen_time: FrozenDateTimeFactory) -> None:
+    # An epoch of its own keeps the process ordering apart from other tests
+    other = TwitterSnowflakeIDGenerator(node_id=0, epoch=1700000000000, monotonic=True)
+    generator = TwitterSnowflakeIDGenerator(node_id=0, epoch=1700000000000, monotonic=True, track_exhaustion=True)
+
+    other.generate_ids(1024)
+    generator.generate_ids(1024)
+    frozen_time.tick(timedelta(milliseconds=1, microseconds=1))
+    generator.generate_next_id()
+
+    assert generator.tick_utilization().max == 0.25
+
+
+def test_tick_utilization_without_completed_ticks() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, track_exhaustion=True)
+
+    assert generator.tick_utilization().ticks == 0
+
+    generator.generate_next_id()
+
+    utilization = generator.tick_utilization()
+    assert utilization.ticks == 0
+    assert utilization.max == 0.0
+
+
+@pytest.mark.parametrize("window", [0, 4097])
+def test_tick_utilization_window_out_of_range_raises_error(window: int) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, track_exhaustion=True)
+
+    with pytest.raises(ValueError, match=r"Window must be between 1 and 4096"):
+        generator.tick_utilization(window=window)
+
+
+def test_tick_utilization_not_tracked_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Exhaustion tracking is not enabled"):
+        TwitterSnowflakeIDGenerator(node_id=0).tick_utilization()
+
+
+# Health tests
+def test_health_reports_remaining_lifetime(frozen_time: FrozenDateTimeFactory) -> None:  # noqa: ARG001
+    generator = TwitterSnowflakeIDGenerator(node_id=0)
+
+    health = generator.health()
+
+    assert health.remaining_ms == (1 << 41) - 1735689600000
+    assert health.remaining_years == pytest.approx(14.68, abs=0.01)
+    assert health.lifetime_used == pytest.approx(1735689600000 / (1 << 41))
+    assert health.sequence_headroom == 4096
+
+    sony = SonyflakeIDGenerator(node_id=0, epoch=SonyflakeIDGenerator.get_current_timestamp())
+
+    assert sony.health().remaining_ms == (1 << 39) * 10
+    assert sony.health().lifetime_used == 0.0
+
+
+def test_health_reports_sequence_headroom(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0)
+
+    generator.generate_ids(1000)
+    assert generator.health().sequence_headroom == 3096
+
+    generator.generate_ids(3096)
+    assert generator.health().sequence_headroom == 0
+
+    frozen_time.tick(timedelta(milliseconds=1, microseconds=1))
+    assert generator.health().sequence_headroom == 4096
+
+
+def test_health_after_timestamp_range() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0)
+
+    with mock.patch.object(
+        generator,
+        "get_current_timestamp",
+        return_value=TWITTER_SNOWFLAKE_CONFIG.max_timestamp + 1,
+    ):
+        health = generator.health()
+
+    assert health.remaining_ms == 0
+    assert health.lifetime_used == 1.0
+
+
+def test_watch_lifetime_warns_once_per_threshold(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=3)
+
+    with pytest.warns(LifetimeWarning, match=r"TwitterSnowflakeIDGenerator with node ID 3 runs out of timestamps"):
+        generator.watch_lifetime([timedelta(days=5000), timedelta(days=6000), timedelta(days=3000)])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        generator.health()
+
+    frozen_time.tick(timedelta(days=3000))
+
+    with pytest.warns(LifetimeWarning) as record:
+        generator.health()
+
+    assert len(record) == 1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        generator.health()
+
+
+def test_watch_lifetime_calls_hook(frozen_time: FrozenDateTimeFactory) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0)
+    hook = mock.Mock()
+
+    generator.watch_lifetime([timedelta(days=365)], hook)
+    hook.assert_not_called()
+
+    frozen_time.tick(timedelta(days=5000))
+    health = generator.health()
+
+    hook.assert_called_once_with(health)
+
+
+def test_watch_lifetime_negative_threshold_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Thresholds must not be negative"):
+        TwitterSnowflakeIDGenerator(node_id=0).watch_lifetime([timedelta(days=-1)])
+
+
+# Layout planning tests
+def test_plan_layout_matches_twitter() -> None:
+    plan = plan_layout(2_000_000, 1024, 69)
+
+    assert plan.config == TWITTER_SNOWFLAKE_CONFIG
+    assert plan.lifespan_years == pytest.approx(69.7, abs=0.1)
+    assert plan.ids_per_second == 4_096_000
+    assert plan.nodes == 1024
+
+
+def test_plan_layout_coarser_step_for_long_lifespan() -> None:
+    plan = plan_layout(2_500_000, 256, 170)
+
+    assert plan.config.time_step_ms == 5
+    assert plan.config.node_id_bits == 8
+    assert plan.lifespan_years >= 170
+    assert plan.ids_per_second >= 2 * 2_500_000
+
+
+def test_plan_layout_wide_ids() -> None:
+    plan = plan_layout(10**9, 1 << 20, 1000, total_bits=128)
+
+    assert plan.config.total_bits == 128
+    assert plan.config.time_step_ms == 1
+    assert plan.config.timestamp_bits + plan.config.node_id_bits + plan.config.sequence_bits == 127
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "message"),
+    [
+        ((0, 1, 1), {}, r"IDs per second must be positive"),
+        ((1, 0, 1), {}, r"Nodes must be positive"),
+        ((1, 1, 0), {}, r"Lifespan must be positive"),
+        ((1, 1, 1), {"headroom": 0.5}, r"Headroom must be at least 1"),
+        ((1, 1, 1), {"total_bits": 60}, r"Total bits must be a positive multiple of 8"),
+        ((10**9, 1 << 16, 100), {}, r"No layout of 64 bits covers 100 years at 1000000000 IDs per second"),
+    ],
+)
+def test_plan_layout_invalid_raises_error(args: tuple[int, int, int], kwargs: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        plan_layout(*args, **kwargs)
+
+
+# Stall simulation tests
+def test_simulate_stalls_within_capacity() -> None:
+    report = simulate_stalls(TWITTER_SNOWFLAKE_CONFIG, [i / 4 for i in range(4000)])
+
+    assert report.ids == 4000
+    assert report.stalled_ids == report.exhausted_ticks == 0
+    assert report.total_stall_ms == report.max_stall_ms == 0
+
+
+def test_simulate_stalls_burst_spills_into_next_ticks() -> None:
+    config = SnowflakeIDConfig(41, 10, 2)
+
+    report = simulate_stalls(config, [10.5] * 10 + [12.0])
+
+    # Ticks 10 and 11 take 4 requests each, the last 2 of the burst and the request at 12.0 share tick 12
+    assert report.exhausted_ticks == 2
+    assert report.stalled_ids == 6
+    assert report.max_stall_ms == pytest.approx(1.5)
+    assert report.total_stall_ms == pytest.approx(4 * 0.5 + 2 * 1.5)
+
+
+def test_simulate_stalls_coarser_ticks_absorb_burst() -> None:
+    burst = [1000.0 + i / 5000 for i in range(20_000)]
+
+    assert simulate_stalls(TWITTER_SNOWFLAKE_CONFIG, burst).stalled_ids > 0
+    assert simulate_stalls(SONYFLAKE_CONFIG, burst).stalled_ids == 0
+
+
+def test_simulate_stalls_decreasing_arrivals_raise_error() -> None:
+    with pytest.raises(ValueError, match=r"Arrival times must not decrease"):
+        simulate_stalls(TWITTER_SNOWFLAKE_CONFIG, [2.0, 1.0])
+
+
+# Command tests
+def test_main_plan(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["plan", "--ids-per-second", "2000000", "--nodes", "1024", "--years", "69"]) == 0
+
+    assert capsys.readouterr().out.splitlines() == [
+        f"layout: {TWITTER_SNOWFLAKE_CONFIG}",
+        "lifespan: 69.7 years",
+        "capacity: 4096000 IDs per second per node, 1024 nodes",
+    ]
+
+
+def test_main_plan_with_profile(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    profile = tmp_path / "profile.txt"
+    profile.write_text("".join(f"{1000 + i / 10000}\n" for i in range(10_000)) + "\n")
+
+    assert (
+        main(["plan", "--ids-per-second", "1000", "--nodes", "1024", "--years", "69", "--profile", str(profile)]) == 0
+    )
+
+    out = capsys.readouterr().out.splitlines()
+    assert out[3] == "requests: 10000"
+    assert out[4].startswith("stalled: 5904 (59.04%), 2 exhausted ticks")
+
+
+def test_main_plan_impossible_fails(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["plan", "--ids-per-second", "1000000000", "--nodes", "65536", "--years", "100"]) == 1
+    assert "error: No layout of 64 bits" in capsys.readouterr().err
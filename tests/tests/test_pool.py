@@ -0,0 +1,115 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from snowflake_id_toolkit import SnowflakeIDGeneratorPool, TwitterSnowflakeID
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+
+
+# Initialization tests
+def test_pool_initialization_node_ids() -> None:
+    pool = SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [7, 3, 5], epoch=1000000000000)
+
+    assert [generator._node_id for generator in pool.generators] == [7, 3, 5]  # noqa: SLF001
+    assert all(generator._epoch == 1000000000000 for generator in pool.generators)  # noqa: SLF001
+
+
+def test_pool_empty_node_ids_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Pool must contain at least one node ID"):
+        SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [])
+
+
+def test_pool_duplicate_node_ids_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Node IDs must be distinct"):
+        SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [1, 2, 1])
+
+
+def test_pool_out_of_range_node_id_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Node ID must be between 0 and 1023"):
+        SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [1023, 1024])
+
+
+def test_pool_unknown_strategy_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Unknown strategy: 'random'"):
+        SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [0], strategy="random")  # type: ignore[arg-type]
+
+
+# Strategy tests
+def test_round_robin_strategy_cycles_members() -> None:
+    pool = SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [1, 2, 3], strategy="round_robin")
+
+    assert [pool.generate_next_id().node_id() for _ in range(6)] == [1, 2, 3, 1, 2, 3]
+
+
+def test_thread_strategy_pins_thread_to_member() -> None:
+    pool = SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [1, 2, 3])
+    node_ids_by_thread: list[set[int]] = []
+
+    def generate_ids() -> None:
+        node_ids_by_thread.append({pool.generate_next_id().node_id() for _ in range(100)})
+
+    threads = [threading.Thread(target=generate_ids) for _ in range(3)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    # Every thread stays on one member, and three threads cover all members
+    assert all(len(node_ids) == 1 for node_ids in node_ids_by_thread)
+    assert set().union(*node_ids_by_thread) == {1, 2, 3}
+
+
+def test_pool_thread_safe_concurrent_generation() -> None:
+    pool = SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [1, 2], strategy="round_robin")
+    ids: list[TwitterSnowflakeID] = []
+
+    def generate_ids() -> None:
+        ids.extend(pool.generate_next_id() for _ in range(100))
+
+    threads = [threading.Thread(target=generate_ids) for _ in range(10)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(ids) == len(set(ids)) == 1000
+
+
+# Batch generation tests
+@pytest.mark.parametrize("count", [0, 1, 2, 10, 1001])
+def test_generate_ids_splits_count_over_members(count: int) -> None:
+    pool = SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [1, 2, 3])
+
+    ids = pool.generate_ids(count)
+
+    assert len(ids) == len(set(ids)) == count
+    assert all(isinstance(id_, TwitterSnowflakeID) for id_ in ids)
+
+    node_ids = [id_.node_id() for id_ in ids]
+    assert node_ids == sorted(node_ids)
+    assert (
+        max(node_ids.count(node_id) for node_id in (1, 2, 3)) - min(node_ids.count(node_id) for node_id in (1, 2, 3))
+        <= 1
+    )
+
+
+def test_generate_ids_with_executor() -> None:
+    pool = SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [1, 2, 3, 4])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ids = pool.generate_ids(1000, executor=executor)
+
+    assert len(ids) == len(set(ids)) == 1000
+    assert {id_.node_id() for id_ in ids} == {1, 2, 3, 4}
+
+
+def test_generate_ids_negative_count_raises_error() -> None:
+    pool = SnowflakeIDGeneratorPool(TwitterSnowflakeIDGenerator, [1])
+
+    with pytest.raises(ValueError, match=r"Count must not be negative"):
+        pool.generate_ids(-1)
@@ -0,0 +1,122 @@
+from unittest import mock
+
+import pytest
+
+from snowflake_id_toolkit import SnowflakeID, SnowflakeIDConfig, SnowflakeIDGenerator
+from snowflake_id_toolkit._generator import _MASK_64, _sequence_offset
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+from snowflake_id_toolkit.wide import WideSnowflakeIDGenerator
+
+
+# Sequence offset tests
+def test_sequence_offsets_spread_low_bits() -> None:
+    offsets = [_sequence_offset(timestamp, 0x5DEECE66D, 12) for timestamp in range(10_000)]
+
+    assert all(0 <= offset < 4096 for offset in offsets)
+    assert 4500 < sum(offset & 1 for offset in offsets) < 5500
+    assert len(set(offsets)) > 3500
+
+
+def test_sequence_offsets_depend_on_key() -> None:
+    assert [_sequence_offset(timestamp, 1, 16) for timestamp in range(10)] != [
+        _sequence_offset(timestamp, 2, 16) for timestamp in range(10)
+    ]
+
+
+def test_sequence_offsets_wider_than_64_bits() -> None:
+    offsets = [_sequence_offset(timestamp, 0x5DEECE66D, 80) for timestamp in range(1000)]
+
+    assert all(0 <= offset < 1 << 80 for offset in offsets)
+    assert [offset & _MASK_64 for offset in offsets] == [
+        _sequence_offset(timestamp, 0x5DEECE66D, 64) for timestamp in range(1000)
+    ]
+    assert len({offset >> 64 for offset in offsets}) > 900
+
+
+def test_sequence_offset_without_sequence_bits() -> None:
+    assert _sequence_offset(12345, 67890, 0) == 0
+
+
+# Generation tests
+@pytest.mark.usefixtures("frozen_time")
+def test_random_sequence_fills_whole_tick() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=5, random_sequence=True)
+
+    ids = [generator.generate_next_id() for _ in range(4096)]
+    offset = ids[0].sequence()
+
+    assert [id_.sequence() for id_ in ids] == [(offset + i) & 4095 for i in range(4096)]
+    assert {id_.node_id() for id_ in ids} == {5}
+    assert len({id_.timestamp_ms() for id_ in ids}) == 1
+
+    with mock.patch.object(
+        generator,
+        "_wait_for_next_timestamp",
+        return_value=generator.get_current_timestamp() + 1,
+    ) as mock_wait:
+        next_id = generator.generate_next_id()
+
+    assert mock_wait.call_count == 1
+    assert next_id.timestamp_ms() == ids[0].timestamp_ms() + 1
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_random_sequence_generate_ids_wraps_around() -> None:
+    generator = SonyflakeIDGenerator(node_id=1, random_sequence=True)
+
+    ids = generator.generate_ids(65536)
+    offset = ids[0].sequence()
+
+    assert [id_.sequence() for id_ in ids] == [(offset + i) & 65535 for i in range(65536)]
+    assert len(set(ids)) == 65536
+
+
+def test_random_sequence_wide_layout() -> None:
+    generator = WideSnowflakeIDGenerator(node_id=3, random_sequence=True)
+
+    ids = generator.generate_ids(1000) + [generator.generate_next_id() for _ in range(1000)]
+
+    assert len(set(ids)) == 2000
+    assert [id_ >> 64 for id_ in ids] == sorted(id_ >> 64 for id_ in ids)
+
+
+def test_random_sequence_unique_and_tick_ordered() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0, random_sequence=True)
+
+    ids = [generator.generate_next_id() for _ in range(10_000)] + generator.generate_ids(10_000)
+
+    assert len(set(ids)) == 20_000
+    assert [id_.timestamp_ms() for id_ in ids] == sorted(id_.timestamp_ms() for id_ in ids)
+
+
+def test_random_sequence_keys_differ_between_generators() -> None:
+    first = TwitterSnowflakeIDGenerator(node_id=0, random_sequence=True)
+    second = TwitterSnowflakeIDGenerator(node_id=0, random_sequence=True)
+
+    assert first._sequence_key != second._sequence_key  # noqa: SLF001
+
+
+def test_random_sequence_monotonic_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Monotonic generators cannot randomize the sequence"):
+        TwitterSnowflakeIDGenerator(node_id=0, monotonic=True, random_sequence=True)
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_random_sequence_wider_than_64_bits() -> None:
+    config = SnowflakeIDConfig(timestamp_bits=44, node_id_bits=4, sequence_bits=80, total_bits=128)
+
+    class LongSequenceID(SnowflakeID):
+        _config = config
+
+    class LongSequenceIDGenerator(SnowflakeIDGenerator[LongSequenceID]):
+        _config = config
+        _id_cls = LongSequenceID
+
+    generator = LongSequenceIDGenerator(node_id=3, random_sequence=True)
+
+    ids = [generator.generate_next_id(), *generator.generate_ids(10)]
+    offset = ids[0].sequence()
+
+    assert [id_.sequence() for id_ in ids] == [(offset + i) & ((1 << 80) - 1) for i in range(11)]
+    assert {id_.node_id() for id_ in ids} == {3}
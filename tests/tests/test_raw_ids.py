@@ -0,0 +1,80 @@
+import pytest
+
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+from snowflake_id_toolkit.wide import WideSnowflakeIDGenerator
+
+
+# Single ID tests
+@pytest.mark.usefixtures("frozen_time")
+def test_generate_next_raw_id_shares_state() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=3, epoch=1288834974657)
+
+    first = generator.generate_next_id()
+    raw = generator.generate_next_raw_id()
+
+    assert type(raw) is int
+    assert raw == first + 1
+    assert generator.id_type(raw).node_id() == 3
+    assert generator.generate_next_id() == raw + 1
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_generate_next_raw_id_random_sequence() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=3, random_sequence=True)
+
+    ids = [generator.generate_next_raw_id() for _ in range(4096)]
+
+    assert len(set(ids)) == 4096
+    assert {generator.id_type(id_).timestamp_ms() for id_ in ids} == {1735689600000}
+
+
+# Batch tests
+@pytest.mark.parametrize("generator_cls", [TwitterSnowflakeIDGenerator, SonyflakeIDGenerator, WideSnowflakeIDGenerator])
+@pytest.mark.parametrize("random_sequence", [False, True])
+def test_generate_raw_ids_unique_and_plain(
+    generator_cls: type[TwitterSnowflakeIDGenerator | SonyflakeIDGenerator | WideSnowflakeIDGenerator],
+    random_sequence: bool,
+) -> None:
+    generator = generator_cls(node_id=1, random_sequence=random_sequence)
+
+    ids = generator.generate_raw_ids(10_000)
+
+    assert len(set(ids)) == 10_000
+    assert all(type(id_) is int for id_ in ids)
+    assert {generator.id_type(id_).node_id() for id_ in ids} == {1}
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_generate_raw_ids_matches_generate_ids() -> None:
+    generator = SonyflakeIDGenerator(node_id=1, random_sequence=True)
+    twin = SonyflakeIDGenerator(node_id=1, random_sequence=True)
+    twin._sequence_key = generator._sequence_key  # noqa: SLF001
+    twin._bind()  # noqa: SLF001
+
+    assert generator.generate_raw_ids(50_000) == twin.generate_ids(50_000)
+
+
+@pytest.mark.parametrize("random_sequence", [False, True])
+def test_generate_id_array(random_sequence: bool) -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=7, random_sequence=random_sequence)
+
+    ids = generator.generate_id_array(10_000)
+
+    assert ids.typecode == "Q"
+    assert len(set(ids)) == 10_000
+    assert {generator.id_type(id_).node_id() for id_ in ids} == {7}
+
+    if not random_sequence:
+        assert ids.tolist() == sorted(ids)
+
+
+def test_generate_id_array_wide_layout_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"ID arrays support layouts of up to 64 bits"):
+        WideSnowflakeIDGenerator(node_id=1).generate_id_array(1)
+
+
+@pytest.mark.parametrize("method", ["generate_raw_ids", "generate_id_array"])
+def test_raw_batch_negative_count_raises_error(method: str) -> None:
+    with pytest.raises(ValueError, match=r"Count must not be negative"):
+        getattr(TwitterSnowflakeIDGenerator(node_id=1), method)(-1)
@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import pytest
+
+from snowflake_id_toolkit import MaxTimestampHasReachedError, read_trace, replay_trace
+from snowflake_id_toolkit._cli import main
+from snowflake_id_toolkit.instagram import InstagramSnowflakeIDGenerator
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+
+START_MS = 1735689600000.0
+
+
+# Replay tests
+def test_replay_trace_within_capacity() -> None:
+    report = replay_trace(TwitterSnowflakeIDGenerator, [START_MS + i / 2 for i in range(1000)])
+
+    assert report.ids == 1000
+    assert report.ticks == 500
+    assert report.max_ids_per_tick == 2
+    assert report.mean_ids_per_tick == 2
+    assert report.stall_ms == report.stalled_ids == 0
+    assert report.p50_ms == report.p999_ms == report.max_ms == 0
+
+
+def test_replay_trace_burst_stalls_and_queues() -> None:
+    # 3000 requests arriving at once exhaust Instagram's 1024 sequence numbers per tick twice
+    report = replay_trace(InstagramSnowflakeIDGenerator, [START_MS + 0.5] * 3000)
+
+    assert report.ticks == 3
+    assert report.max_ids_per_tick == 1024
+    assert report.stall_ms == pytest.approx(1.5)
+    assert report.stalled_ids == 3000 - 1024
+    assert report.p50_ms == pytest.approx(0.5)
+    assert report.max_ms == pytest.approx(1.5)
+
+
+def test_replay_trace_deterministic() -> None:
+    arrivals = [START_MS + i / 7 for i in range(20_000)] + [START_MS + 5000] * 10_000
+
+    assert replay_trace(TwitterSnowflakeIDGenerator, arrivals) == replay_trace(TwitterSnowflakeIDGenerator, arrivals)
+
+
+def test_replay_trace_coarser_ticks_absorb_burst() -> None:
+    arrivals = [START_MS] * 10_000
+
+    assert replay_trace(TwitterSnowflakeIDGenerator, arrivals).stalled_ids > 0
+    assert replay_trace(SonyflakeIDGenerator, arrivals).stalled_ids == 0
+
+
+def test_replay_trace_empty() -> None:
+    assert replay_trace(TwitterSnowflakeIDGenerator, []).ids == 0
+
+
+@pytest.mark.parametrize(
+    ("arrivals", "message"),
+    [
+        ([-1.0], r"Arrival times must not be negative"),
+        ([START_MS, START_MS - 1], r"Arrival times must not decrease"),
+    ],
+)
+def test_replay_trace_invalid_arrivals_raise_error(arrivals: list[float], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        replay_trace(TwitterSnowflakeIDGenerator, arrivals)
+
+
+def test_replay_trace_beyond_max_timestamp_raises_error() -> None:
+    with pytest.raises(MaxTimestampHasReachedError):
+        replay_trace(TwitterSnowflakeIDGenerator, [float(1 << 41)])
+
+
+# Trace reading tests
+def test_read_trace_skips_header_and_empty_rows(tmp_path: Path) -> None:
+    trace = tmp_path / "trace.csv"
+    trace.write_text("arrival_ms,path\n1.5,/a\n\n2,/b\n")
+
+    assert read_trace(trace) == [1.5, 2.0]
+
+
+def test_read_trace_invalid_row_raises_error(tmp_path: Path) -> None:
+    trace = tmp_path / "trace.csv"
+    trace.write_text("1.5\nlater\n")
+
+    with pytest.raises(ValueError, match=r"could not convert string to float"):
+        read_trace(trace)
+
+
+# Command tests
+def test_main_simulate(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    trace = tmp_path / "trace.csv"
+    trace.write_text("arrival_ms\n" + "".join(f"{START_MS}\n" for _ in range(2000)))
+
+    assert main(["simulate", "--trace", str(trace), "--layout", "twitter", "--layout", "instagram"]) == 0
+
+    header, twitter, instagram = capsys.readouterr().out.splitlines()
+    assert header.split() == [
+        "layout",
+        "ids",
+        "ticks",
+        "max/tick",
+        "stalled",
+        "stall_ms",
+        "p50_ms",
+        "p99_ms",
+        "p99.9_ms",
+        "max_ms",
+    ]
+    assert twitter.split()[:5] == ["twitter", "2000", "1", "2000", "0"]
+    assert instagram.split()[:5] == ["instagram", "2000", "2", "1024", "976"]
@@ -0,0 +1,182 @@
+from array import array
+from collections.abc import Callable
+from unittest import mock
+
+import pytest
+
+from snowflake_id_toolkit import SnowflakeIDConfig, TwitterSnowflakeID, WideSnowflakeID
+from snowflake_id_toolkit import _cli as cli
+from snowflake_id_toolkit._compiled import speedups
+from snowflake_id_toolkit.sony import SONYFLAKE_CONFIG, SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TWITTER_SNOWFLAKE_CONFIG, TwitterSnowflakeIDGenerator
+from snowflake_id_toolkit.wide import WideSnowflakeIDGenerator
+
+pytestmark = pytest.mark.skipif(speedups is None, reason="compiled accelerator is not available")
+
+
+class ManualClockGenerator(TwitterSnowflakeIDGenerator):
+    @classmethod
+    def get_current_timestamp(cls) -> int:
+        return 1735689600000
+
+
+# Fast path selection tests
+def test_fast_path_enabled_for_64_bit_layouts() -> None:
+    assert TwitterSnowflakeIDGenerator(node_id=0)._fast_path is not None  # noqa: SLF001
+    assert SonyflakeIDGenerator(node_id=0)._fast_path is not None  # noqa: SLF001
+
+
+def test_fast_path_disabled_for_wide_layout() -> None:
+    generator = WideSnowflakeIDGenerator(node_id=5)
+
+    assert generator._fast_path is None  # noqa: SLF001
+    assert generator.generate_next_id().node_id() == 5
+
+
+def test_fast_path_disabled_for_custom_clock() -> None:
+    generator = ManualClockGenerator(node_id=0)
+
+    assert generator._fast_path is None  # noqa: SLF001
+    assert generator.generate_next_id().timestamp_ms() == 1735689600000
+
+
+# Generation tests
+def test_compiled_generate_next_id_matches_pure_python() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=42, epoch=1288834974657)
+
+    compiled_id = generator.generate_next_id()
+    assert type(compiled_id) is generator.id_type
+    assert isinstance(compiled_id, TwitterSnowflakeID)
+    assert compiled_id == generator._compose(generator._state)  # noqa: SLF001
+
+    pure_id = generator._generate_next_id()  # noqa: SLF001
+    assert pure_id > compiled_id
+    assert pure_id.node_id() == compiled_id.node_id() == 42
+
+
+def test_compiled_and_pure_python_share_state() -> None:
+    generator = SonyflakeIDGenerator(node_id=1)
+
+    ids = []
+    for _ in range(1000):
+        ids.append(generator.generate_next_id())
+        ids.append(generator._generate_next_id())  # noqa: SLF001
+
+    assert len(set(ids)) == 2000
+    assert ids == sorted(ids)
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_compiled_generate_next_id_falls_back_on_patched_clock() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0)
+
+    ids = [generator.generate_next_id() for _ in range(3)]
+
+    assert [id_.timestamp_ms() for id_ in ids] == [1735689600000] * 3
+    assert [id_.sequence() for id_ in ids] == [0, 1, 2]
+
+
+def test_compiled_generate_next_id_falls_back_on_clock_patched_after_binding() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0)
+    future = TwitterSnowflakeIDGenerator.get_current_timestamp() + 10**9
+
+    with mock.patch.object(generator, "get_current_timestamp", return_value=future):
+        assert generator.generate_next_id().timestamp_ms() == future
+
+    with mock.patch.object(TwitterSnowflakeIDGenerator, "get_current_timestamp", return_value=future + 1):
+        assert generator.generate_next_raw_id() >> 22 == future + 1
+
+    assert generator._fast_path is not None  # noqa: SLF001
+
+
+def test_compiled_generate_next_id_keeps_error_raised_under_lock() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=0)
+    generator._state = 1 << 70  # noqa: SLF001
+
+    with pytest.raises(OverflowError):
+        generator.generate_next_id()
+
+    assert not generator._lock.locked()  # noqa: SLF001
+
+
+def test_compiled_generate_next_raw_id_matches_pure_python() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=42, epoch=1288834974657)
+
+    compiled_id = generator.generate_next_raw_id()
+    assert type(compiled_id) is int
+    assert compiled_id == generator._compose(generator._state)  # noqa: SLF001
+
+    pure_id = generator._generate_next_raw_id()  # noqa: SLF001
+    assert type(pure_id) is int
+    assert pure_id == compiled_id + 1
+
+
+# Batch helper tests
+def test_make_ids_matches_pure_python() -> None:
+    assert speedups is not None
+
+    ids = speedups.make_ids(TwitterSnowflakeID, 1 << 40, 5, 9)
+
+    assert ids == [TwitterSnowflakeID((1 << 40) + sequence) for sequence in range(5, 10)]
+    assert all(type(id_) is TwitterSnowflakeID for id_ in ids)
+    assert speedups.make_ids(TwitterSnowflakeID, 0, 3, 2) == []
+
+
+def test_make_ids_wider_than_64_bits() -> None:
+    assert speedups is not None
+
+    ids = speedups.make_ids(WideSnowflakeID, 1 << 100, 0, 2)
+
+    assert ids == [(1 << 100) + sequence for sequence in range(3)]
+    assert all(type(id_) is WideSnowflakeID for id_ in ids)
+
+
+def test_pack_ids_matches_pure_python() -> None:
+    assert speedups is not None
+
+    packed = array("Q")
+    packed.frombytes(speedups.pack_ids((1 << 64) - 5, 5))
+
+    assert packed.tolist() == list(range((1 << 64) - 5, 1 << 64))
+    assert speedups.pack_ids(7, 0) == b""
+
+
+@pytest.mark.parametrize(("start", "count"), [((1 << 64) - 5, 6), (0, -1), (1 << 64, 1)])
+def test_pack_ids_out_of_range_raises_error(start: int, count: int) -> None:
+    assert speedups is not None
+
+    with pytest.raises(OverflowError):
+        speedups.pack_ids(start, count)
+
+
+@pytest.mark.parametrize("formatter", [cli._format_csv, cli._format_jsonl])  # noqa: SLF001
+@pytest.mark.parametrize(("config", "epoch"), [(TWITTER_SNOWFLAKE_CONFIG, 1288834974657), (SONYFLAKE_CONFIG, 0)])
+def test_format_rows_matches_pure_python(
+    monkeypatch: pytest.MonkeyPatch,
+    formatter: Callable[[list[int], SnowflakeIDConfig, int], bytes],
+    config: SnowflakeIDConfig,
+    epoch: int,
+) -> None:
+    values = [0, 1, 4095, 4096, 1 << 40, (1 << 63) - 1, (1 << 64) - 1]
+
+    compiled = formatter(values, config, epoch)
+    monkeypatch.setattr(cli, "speedups", None)
+
+    assert compiled == formatter(values, config, epoch)
+
+
+def test_format_rows_out_of_range_values_fall_back() -> None:
+    rows = cli._format_csv([1 << 64, -1], TWITTER_SNOWFLAKE_CONFIG, 0)  # noqa: SLF001
+
+    assert rows == b"18446744073709551616,4398046511104,0,0\n-1,-1,1023,4095\n"
+
+
+def test_compiled_random_sequence_matches_pure_python() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=9, random_sequence=True)
+
+    assert generator._fast_path is not None  # noqa: SLF001
+
+    for _ in range(1000):
+        compiled_id = generator.generate_next_id()
+        assert compiled_id == generator._compose(generator._state)  # noqa: SLF001
+        assert generator._generate_next_id() != compiled_id  # noqa: SLF001
@@ -0,0 +1,75 @@
+import threading
+from collections.abc import Callable
+
+from snowflake_id_toolkit import SnowflakeID, SnowflakeIDConfig
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+from snowflake_id_toolkit.twitter import TwitterSnowflakeIDGenerator
+
+THREADS = 8
+
+
+def run_threads(target: Callable[[], list[SnowflakeID]]) -> list[list[SnowflakeID]]:
+    barrier = threading.Barrier(THREADS)
+    results: list[list[SnowflakeID]] = [[] for _ in range(THREADS)]
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        results[index] = target()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+# Stress tests, meant to be run with PYTHON_GIL=0 on free-threaded builds as well
+def test_generate_next_id_concurrent_unique_increasing() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+
+    results = run_threads(lambda: [generator.generate_next_id() for _ in range(20_000)])
+
+    assert len({id_ for ids in results for id_ in ids}) == THREADS * 20_000
+    assert all(ids == sorted(ids) for ids in results)
+    assert all(id_.node_id() == 1 for ids in results for id_ in ids)
+
+
+def test_generate_ids_concurrent_unique_increasing() -> None:
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+
+    results = run_threads(lambda: [id_ for _ in range(20) for id_ in generator.generate_ids(1000)])
+
+    assert len({id_ for ids in results for id_ in ids}) == THREADS * 20_000
+    assert all(ids == sorted(ids) for ids in results)
+
+
+def test_mixed_calls_concurrent_unique() -> None:
+    generator = SonyflakeIDGenerator(node_id=1)
+
+    def target() -> list[SnowflakeID]:
+        ids: list[SnowflakeID] = []
+        for _ in range(500):
+            ids.append(generator.generate_next_id())
+            ids.extend(generator.generate_ids(20))
+        return ids
+
+    results = run_threads(target)
+
+    assert len({id_ for ids in results for id_ in ids}) == THREADS * 500 * 21
+    assert all(ids == sorted(ids) for ids in results)
+
+
+def test_config_derived_values_computed_on_construction() -> None:
+    config = SnowflakeIDConfig(timestamp_bits=41, node_id_bits=10, sequence_bits=12)
+
+    # Nothing is computed lazily on first access, so concurrent readers cannot race
+    assert {
+        "node_id_shift",
+        "timestamp_shift",
+        "max_timestamp",
+        "max_node_id",
+        "max_sequence",
+        "byte_length",
+    } <= vars(config).keys()
@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from snowflake_id_toolkit.sony import SonyflakeID
+from snowflake_id_toolkit.twitter import TwitterSnowflakeID
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+# Bound tests
+@pytest.mark.usefixtures("frozen_time")
+def test_max_valid_id_covers_skew() -> None:
+    max_id = TwitterSnowflakeID.max_valid_id(max_skew_ms=1000)
+
+    assert TwitterSnowflakeID(max_id).to_datetime() == NOW + timedelta(seconds=1)
+    assert TwitterSnowflakeID(max_id).node_id() == 1023
+    assert TwitterSnowflakeID(max_id).sequence() == 4095
+    assert TwitterSnowflakeID(max_id + 1).to_datetime() == NOW + timedelta(seconds=1, milliseconds=1)
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_max_valid_id_rounds_down_to_time_step() -> None:
+    max_id = SonyflakeID.max_valid_id(max_skew_ms=15)
+
+    assert SonyflakeID(max_id).to_datetime() == NOW + timedelta(milliseconds=10)
+
+
+def test_max_valid_id_without_skew_is_layout_maximum() -> None:
+    assert TwitterSnowflakeID.max_valid_id(max_skew_ms=None) == (1 << 63) - 1
+    assert SonyflakeID.max_valid_id(max_skew_ms=None) == (1 << 63) - 1
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_max_valid_id_epoch_beyond_skew() -> None:
+    epoch = TwitterSnowflakeID.from_datetime(NOW + timedelta(days=1), 0, 0).timestamp_ms()
+
+    assert TwitterSnowflakeID.max_valid_id(epoch=epoch) == -1
+    assert TwitterSnowflakeID.with_epoch(epoch).validate_ids([0, 1]) == [False, False]
+
+
+def test_max_valid_id_negative_skew_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Max skew must not be negative"):
+        TwitterSnowflakeID.max_valid_id(max_skew_ms=-1)
+
+
+# Validation tests
+@pytest.mark.usefixtures("frozen_time")
+def test_validate_accepts_ids_up_to_skew() -> None:
+    id_ = TwitterSnowflakeID.from_datetime(NOW + timedelta(seconds=1), 1023, 4095)
+
+    validated = TwitterSnowflakeID.validate(int(id_))
+
+    assert validated == id_
+    assert type(validated) is TwitterSnowflakeID
+
+
+@pytest.mark.usefixtures("frozen_time")
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        (-1, r"ID must fit into the layout's timestamp, node ID and sequence bits"),
+        (1 << 63, r"ID must fit into the layout's timestamp, node ID and sequence bits"),
+        (
+            int(TwitterSnowflakeID.from_datetime(NOW + timedelta(seconds=1, milliseconds=1), 0, 0)),
+            r"ID timestamp must not be more than 1000 ms in the future",
+        ),
+    ],
+)
+def test_validate_invalid_id_raises_error(value: int, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        TwitterSnowflakeID.validate(value)
+
+
+def test_validate_without_skew_accepts_layout_maximum() -> None:
+    assert TwitterSnowflakeID.validate((1 << 63) - 1, max_skew_ms=None) == (1 << 63) - 1
+
+
+def test_validate_ids_follows_clock(frozen_time: FrozenDateTimeFactory) -> None:
+    future = int(TwitterSnowflakeID.from_datetime(NOW + timedelta(minutes=1), 0, 0))
+    ids = [0, -1, future, 1 << 63, int(TwitterSnowflakeID.from_datetime(NOW, 5, 5))]
+
+    assert TwitterSnowflakeID.validate_ids(ids) == [True, False, False, False, True]
+    assert TwitterSnowflakeID.validate_ids(ids, max_skew_ms=60_000) == [True, False, True, False, True]
+
+    frozen_time.tick(timedelta(minutes=1))
+
+    assert TwitterSnowflakeID.validate_ids(iter(ids)) == [True, False, True, False, True]
+
+
+# Strict parsing tests
+@pytest.mark.usefixtures("frozen_time")
+@pytest.mark.parametrize("codec", ["base16", "base32", "base64_urlsafe", "base62"])
+def test_parse_str_strict(codec: str) -> None:
+    parse = getattr(TwitterSnowflakeID, f"parse_{codec}_str")
+    valid = TwitterSnowflakeID.from_datetime(NOW, 1, 1)
+    future = TwitterSnowflakeID.from_datetime(NOW + timedelta(hours=1), 1, 1)
+    signed = TwitterSnowflakeID(1 << 63)
+
+    assert parse(getattr(valid, f"as_{codec}_str")(), strict=True) == valid
+    assert parse(getattr(future, f"as_{codec}_str")()) == future
+    assert parse(getattr(signed, f"as_{codec}_str")()) == signed
+
+    with pytest.raises(ValueError, match=r"ID timestamp must not be more than 1000 ms in the future"):
+        parse(getattr(future, f"as_{codec}_str")(), strict=True)
+
+    with pytest.raises(ValueError, match=r"ID must fit into the layout's timestamp, node ID and sequence bits"):
+        parse(getattr(signed, f"as_{codec}_str")(), strict=True)
+
+
+@pytest.mark.usefixtures("frozen_time")
+@pytest.mark.parametrize("codec", ["base16", "base32", "base64", "base64_urlsafe", "base85"])
+def test_parse_text_bytes_strict(codec: str) -> None:
+    parse = getattr(TwitterSnowflakeID, f"parse_{codec}")
+    valid = TwitterSnowflakeID.from_datetime(NOW, 1, 1)
+    future = TwitterSnowflakeID.from_datetime(NOW + timedelta(hours=1), 1, 1)
+    signed = TwitterSnowflakeID(1 << 63)
+
+    assert parse(getattr(valid, f"as_{codec}")(), strict=True) == valid
+    assert parse(getattr(future, f"as_{codec}")()) == future
+    assert parse(getattr(signed, f"as_{codec}")()) == signed
+
+    with pytest.raises(ValueError, match=r"ID timestamp must not be more than 1000 ms in the future"):
+        parse(getattr(future, f"as_{codec}")(), strict=True)
+
+    with pytest.raises(ValueError, match=r"ID must fit into the layout's timestamp, node ID and sequence bits"):
+        parse(getattr(signed, f"as_{codec}")(), strict=True)
+
+
+@pytest.mark.parametrize(
+    ("codec", "data"),
+    [("base64", b"AAA!!\nAAAdbzRU="), ("base64_urlsafe", b"AAA!!\nAAAdbzRU=")],
+)
+def test_parse_base64_strict_rejects_foreign_characters(codec: str, data: bytes) -> None:
+    parse = getattr(TwitterSnowflakeID, f"parse_{codec}")
+
+    assert parse(data) == 123456789
+
+    with pytest.raises(ValueError, match=r"Only base64 data is allowed"):
+        parse(data, strict=True)
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_parse_bytes_strict() -> None:
+    signed = TwitterSnowflakeID(1 << 63).as_bytes()
+
+    assert TwitterSnowflakeID.parse_bytes(signed) == 1 << 63
+
+    with pytest.raises(ValueError, match=r"ID must fit into the layout's timestamp, node ID and sequence bits"):
+        TwitterSnowflakeID.parse_bytes(signed, strict=True)
@@ -0,0 +1,94 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from snowflake_id_toolkit import WaitStrategy
+from snowflake_id_toolkit.sony import SonyflakeIDGenerator
+
+
+def test_wait_strategy_negative_spin_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Spin time must not be negative"):
+        WaitStrategy(spin_ns=-1)
+
+
+def test_wait_strategy_sleeps_until_next_tick() -> None:
+    generator = SonyflakeIDGenerator(node_id=1, wait_strategy=WaitStrategy(spin_ns=0))
+
+    with mock.patch("snowflake_id_toolkit._generator.time.sleep", wraps=time.sleep) as mock_sleep:
+        ids = generator.generate_ids(140_000)
+
+    assert mock_sleep.called
+    assert all(0 < delay <= 0.01 for (delay,), _ in mock_sleep.call_args_list)
+    assert ids == sorted(set(ids))
+    assert ids[-1].timestamp_ms() - ids[0].timestamp_ms() >= 20
+
+
+def test_wait_strategy_spins_before_sleeping() -> None:
+    generator = SonyflakeIDGenerator(node_id=1, wait_strategy=WaitStrategy(spin_ns=50_000_000))
+
+    with mock.patch("snowflake_id_toolkit._generator.time.sleep") as mock_sleep:
+        ids = generator.generate_ids(140_000)
+
+    mock_sleep.assert_not_called()
+    assert ids == sorted(set(ids))
+
+
+def test_wait_strategy_keeps_lock_while_sleeping() -> None:
+    generator = SonyflakeIDGenerator(node_id=1, wait_strategy=WaitStrategy(spin_ns=0))
+    locked = []
+    real_sleep = time.sleep
+
+    def sleep(delay: float) -> None:
+        locked.append(generator._lock.locked())  # noqa: SLF001
+        real_sleep(delay)
+
+    with mock.patch("snowflake_id_toolkit._generator.time.sleep", side_effect=sleep):
+        generator.generate_ids(70_000)
+
+    assert locked
+    assert all(locked)
+
+
+def test_wait_strategy_releases_lock_while_sleeping() -> None:
+    generator = SonyflakeIDGenerator(node_id=1, wait_strategy=WaitStrategy(spin_ns=0, release_lock=True))
+    locked = []
+    real_sleep = time.sleep
+
+    def sleep(delay: float) -> None:
+        locked.append(generator._lock.locked())  # noqa: SLF001
+        real_sleep(delay)
+
+    with mock.patch("snowflake_id_toolkit._generator.time.sleep", side_effect=sleep):
+        generator.generate_ids(70_000)
+
+    assert locked
+    assert not any(locked)
+
+
+def test_wait_strategy_releasing_lock_keeps_ids_unique_across_threads() -> None:
+    generator = SonyflakeIDGenerator(node_id=1, wait_strategy=WaitStrategy(spin_ns=0, release_lock=True))
+    results: list[list[int]] = []
+
+    def worker() -> None:
+        ids = [int(generator.generate_next_id()) for _ in range(1000)]
+
+        for _ in range(5):
+            ids += generator.generate_raw_ids(20_000)
+
+        results.append(ids)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    for ids in results:
+        assert ids == sorted(ids)
+
+    all_ids = [id_ for ids in results for id_ in ids]
+    assert len(set(all_ids)) == len(all_ids) == 404_000
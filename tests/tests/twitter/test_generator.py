@@ -225,6 +225,42 @@ def test_sequence_overflow_calls_wait_for_next_timestamp(
         assert next_timestamp_id.sequence() == 0
 
 
+@pytest.mark.usefixtures("frozen_time")
+def test_sequence_overflow_preserves_node_id() -> None:
+    """Test that the sequence restarts at 0 without spilling into node ID bits."""
+    generator = TwitterSnowflakeIDGenerator(node_id=1)
+
+    with mock.patch.object(
+        generator,
+        "_wait_for_next_timestamp",
+        return_value=generator.get_current_timestamp() + 1,
+    ):
+        generator.generate_ids(4096)
+        next_timestamp_id = generator.generate_next_id()
+
+    assert next_timestamp_id.node_id() == 1
+    assert next_timestamp_id.sequence() == 0
+
+
+# Batch generation tests
+@pytest.mark.usefixtures("frozen_time")
+def test_generate_ids_returns_increasing_unique_ids(twitter_generator: TwitterSnowflakeIDGenerator) -> None:
+    ids = twitter_generator.generate_ids(100)
+
+    assert all(isinstance(id_, TwitterSnowflakeID) for id_ in ids)
+    assert [id_.sequence() for id_ in ids] == list(range(100))
+    assert twitter_generator.generate_next_id().sequence() == 100
+
+
+def test_generate_ids_zero_count(twitter_generator: TwitterSnowflakeIDGenerator) -> None:
+    assert twitter_generator.generate_ids(0) == []
+
+
+def test_generate_ids_negative_count_raises_error(twitter_generator: TwitterSnowflakeIDGenerator) -> None:
+    with pytest.raises(ValueError, match=r"Count must not be negative"):
+        twitter_generator.generate_ids(-1)
+
+
 # Thread safety tests
 def test_generator_thread_safe_concurrent_generation(
     twitter_generator: TwitterSnowflakeIDGenerator,
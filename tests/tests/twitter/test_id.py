@@ -60,6 +60,11 @@ def test_parse_bytes_decoding() -> None:
     assert parsed_id == 4096
 
 
+def test_parse_bytes_invalid_length() -> None:
+    with pytest.raises(ValueError, match=r"ID must be exactly 8 bytes long"):
+        TwitterSnowflakeID.parse_bytes(b"\x10\x00")
+
+
 # Base16 encoding/decoding tests
 def test_as_base16_encoding(twitter_id: TwitterSnowflakeID) -> None:
     base16 = twitter_id.as_base16()
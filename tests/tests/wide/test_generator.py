@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from snowflake_id_toolkit.wide import WideSnowflakeIDGenerator
+
+
+# Initialization tests
+def test_generator_initialization_max_node_id() -> None:
+    # Wide has 16 bits for node_id, so max is 2^16 - 1 = 65535
+    max_node_id = 65535
+    generator = WideSnowflakeIDGenerator(node_id=max_node_id)
+    assert generator._node_id == max_node_id  # noqa: SLF001
+
+
+def test_generator_node_id_exceeds_max_raises_error() -> None:
+    with pytest.raises(ValueError, match=r"Node ID must be between 0 and 65535"):
+        WideSnowflakeIDGenerator(node_id=65536)
+
+
+# ID generation tests
+@pytest.mark.usefixtures("frozen_time")
+def test_generate_next_id_increments_sequence(wide_generator: WideSnowflakeIDGenerator) -> None:
+    ids = [wide_generator.generate_next_id() for _ in range(3)]
+
+    assert [id_.sequence() for id_ in ids] == [0, 1, 2]
+
+
+def test_generate_next_id_monotonic_increase(wide_generator: WideSnowflakeIDGenerator) -> None:
+    ids = [wide_generator.generate_next_id() for _ in range(100)]
+    assert ids == sorted(ids)
+    assert len(ids) == len(set(ids))
+
+
+def test_generate_many_ids_same_ms_without_waiting(
+    frozen_time: FrozenDateTimeFactory,
+    wide_generator: WideSnowflakeIDGenerator,
+) -> None:
+    """A 64-bit sequence does not run out where 64-bit layouts would stall."""
+    ids = [wide_generator.generate_next_id() for _ in range(70000)]
+
+    assert len({id_.timestamp_ms() for id_ in ids}) == 1
+    assert ids[-1].sequence() == 69999
+
+    frozen_time.tick(timedelta(milliseconds=1, microseconds=1))
+    assert wide_generator.generate_next_id().sequence() == 0
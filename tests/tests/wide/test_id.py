@@ -0,0 +1,109 @@
+import binascii
+from collections.abc import Callable
+
+import pytest
+
+from snowflake_id_toolkit.wide import WideSnowflakeID, WideSnowflakeIDGenerator
+
+
+# Timestamp extraction tests
+@pytest.mark.usefixtures("frozen_time")
+def test_timestamp_ms_extraction_zero_epoch(wide_id: WideSnowflakeID) -> None:
+    # 2025-01-01 00:00:00 UTC = 1735689600000 ms
+    assert wide_id.timestamp_ms() == 1735689600000
+
+
+@pytest.mark.usefixtures("frozen_time")
+def test_timestamp_ms_extraction_custom_epoch() -> None:
+    custom_epoch = 1609459200000  # 2021-01-01 00:00:00 UTC in ms
+    generator = WideSnowflakeIDGenerator(node_id=0, epoch=custom_epoch)
+    wide_id = generator.generate_next_id()
+
+    # Current time: 2025-01-01 00:00:00 UTC = 1735689600000 ms
+    assert wide_id.timestamp_ms(epoch=custom_epoch) == 1735689600000
+
+
+# Component extraction tests
+@pytest.mark.usefixtures("frozen_time")
+def test_all_components_extraction() -> None:
+    generator = WideSnowflakeIDGenerator(node_id=65535)
+    wide_id = generator.generate_next_id()
+
+    assert wide_id.timestamp_ms() == 1735689600000
+    assert wide_id.node_id() == 65535
+    assert wide_id.sequence() == 0
+
+
+def test_id_max_sequence_value() -> None:
+    """Max sequence value for Wide Snowflake is 2^64 - 1."""
+    id_with_max_seq = WideSnowflakeID((1 << 64) - 1)
+    assert id_with_max_seq.sequence() == (1 << 64) - 1
+    assert id_with_max_seq.node_id() == 0
+
+
+# Bytes encoding/decoding tests
+def test_as_bytes_conversion(wide_id: WideSnowflakeID) -> None:
+    id_bytes = wide_id.as_bytes()
+    assert isinstance(id_bytes, bytes)
+    assert len(id_bytes) == 16
+
+
+def test_parse_bytes_roundtrip(wide_id: WideSnowflakeID) -> None:
+    id_bytes = wide_id.as_bytes()
+    parsed_id = WideSnowflakeID.parse_bytes(id_bytes)
+    assert parsed_id == wide_id
+
+
+def test_parse_bytes_decoding() -> None:
+    id_bytes = b"\x00" * 14 + b"\x10\x00"
+    parsed_id = WideSnowflakeID.parse_bytes(id_bytes)
+    assert parsed_id == 4096
+
+
+def test_parse_bytes_invalid_length() -> None:
+    with pytest.raises(ValueError, match=r"ID must be exactly 16 bytes long"):
+        WideSnowflakeID.parse_bytes(b"\x00\x00\x00\x00\x00\x00\x10\x00")
+
+
+# Text encoding tests
+def test_as_base16_encoding(wide_id: WideSnowflakeID) -> None:
+    base16 = wide_id.as_base16()
+    assert isinstance(base16, bytes)
+    assert len(base16) == 32
+
+
+def test_parse_base16_decoding() -> None:
+    base16 = b"00000000000000000000000000001000"
+    parsed_id = WideSnowflakeID.parse_base16(base16)
+    assert parsed_id == 4096
+
+
+def test_parse_base16_invalid_encoding() -> None:
+    with pytest.raises(binascii.Error, match=r"Non-base16 digit found"):
+        WideSnowflakeID.parse_base16(b"INVALID!")
+
+
+@pytest.mark.parametrize(
+    ("encode", "parse"),
+    [
+        (WideSnowflakeID.as_base16, WideSnowflakeID.parse_base16),
+        (WideSnowflakeID.as_base32, WideSnowflakeID.parse_base32),
+        (WideSnowflakeID.as_base64, WideSnowflakeID.parse_base64),
+        (WideSnowflakeID.as_base64_urlsafe, WideSnowflakeID.parse_base64_urlsafe),
+        (WideSnowflakeID.as_base85, WideSnowflakeID.parse_base85),
+    ],
+)
+def test_text_encoding_roundtrip(
+    wide_id: WideSnowflakeID,
+    encode: Callable[[WideSnowflakeID], bytes],
+    parse: Callable[[bytes], WideSnowflakeID],
+) -> None:
+    assert parse(encode(wide_id)) == wide_id
+
+
+# Integer behavior tests
+@pytest.mark.usefixtures("frozen_time")
+def test_id_behaves_as_int(wide_id: WideSnowflakeID) -> None:
+    assert isinstance(wide_id, int)
+    assert wide_id == 1735689600000 << 80
+    assert wide_id.bit_length() > 64